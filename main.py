@@ -8,12 +8,36 @@ Point d'entrée principal du jeu
 
 import sys
 import os
+import json
+import argparse
 import pygame
 from src.game import Game
+from src.utils.profiler import COUNTERS_ENABLED
 from src.utils.config import load_config
+from src.utils.profiling import DEFAULT_RACES, profile_session, run_ui_scenario
+from src.utils.replay import InputRecording
 
 def main():
     """Fonction principale du jeu"""
+    parser = argparse.ArgumentParser(description="Drive to Survive")
+    parser.add_argument('--profile', action='store_true',
+                        help="Joue un scénario scripté sous profileur (pstats et piles agrégées)")
+    parser.add_argument('--races', type=int, default=DEFAULT_RACES, help="Nombre de courses du scénario profilé")
+    parser.add_argument('--seed', type=int, default=0, help="Graine du scénario profilé")
+    parser.add_argument('--record', metavar='FICHIER', default=None,
+                        help="Enregistre les entrées de la partie pour un rejeu")
+    parser.add_argument('--replay', metavar='FICHIER', default=None,
+                        help="Rejoue un enregistrement sans écran et mesure chaque frame")
+    args = parser.parse_args()
+    
+    recording = None
+    if args.replay:
+        recording = InputRecording.load(args.replay)
+        if recording is None:
+            sys.exit(1)
+        # Rejeu sans fenêtre ni son
+        os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+        os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
     
     # Initialisation de pygame
     pygame.init()
@@ -23,13 +47,30 @@ def main():
     config = load_config()
     
     # Création de la fenêtre du jeu
-    screen = pygame.display.set_mode((config['screen_width'], config['screen_height']))
+    if recording is not None:
+        screen = pygame.display.set_mode(recording.screen_size)
+    else:
+        screen = pygame.display.set_mode((config['screen_width'], config['screen_height']))
     
-    # Initialisation du jeu
-    game = Game(screen, config)
+    # Initialisation du jeu (le rejeu exporte les compteurs d'allocations)
+    game = Game(screen, config, count_allocations=COUNTERS_ENABLED or recording is not None)
     
-    # Boucle principale du jeu
-    game.run()
+    if args.profile:
+        # Scénario reproductible à la place de la boucle de jeu
+        profile_session(lambda: run_ui_scenario(game, args.races, args.seed), 'game')
+        game.save_writer.close()
+    elif recording is not None:
+        # Rejeu en lockstep et temps de chaque frame
+        print(json.dumps(game.replay(recording), indent=2))
+        path = game.profiler.export_csv()
+        if path:
+            print(f"Frames du rejeu: {path}")
+    else:
+        if args.record:
+            game.start_recording(args.record)
+        
+        # Boucle principale du jeu
+        game.run()
     
     # Nettoyage à la fin du jeu
     pygame.quit()
@@ -115,6 +115,7 @@ class DriverAcademy:
         self.name = name
         self.prestige = prestige
         self.teams = teams or []
+        self._teams_by_category = {team.category: team for team in self.teams}
         
         # Bonus d'académie pour les pilotes
         self.skill_bonuses = self._generate_skill_bonuses()
@@ -167,10 +168,7 @@ class DriverAcademy:
         Returns:
             Team: Équipe correspondante ou None
         """
-        for team in self.teams:
-            if team.category == category:
-                return team
-        return None
+        return self._teams_by_category.get(category)
     
     def add_team(self, team):
         """
@@ -181,6 +179,94 @@ class DriverAcademy:
         """
         team.parent_academy = self
         self.teams.append(team)
+        self._teams_by_category.setdefault(team.category, team)
+
+
+class TeamRegistry:
+    """Académies et équipes, indexées pour des recherches directes"""
+    
+    def __init__(self, academies):
+        """
+        Initialisation du registre
+        
+        Args:
+            academies (list): Académies (avec leurs équipes)
+        """
+        self.academies = list(academies)
+        
+        # Index: (catégorie, nom) -> équipe, nom -> académie, catégorie -> équipes
+        self._by_key = {}
+        self._by_academy = {}
+        self._by_category = {}
+        for academy in self.academies:
+            self._by_academy[academy.name] = academy
+            for team in academy.teams:
+                self._add_team(team)
+    
+    @classmethod
+    def from_teams(cls, teams):
+        """
+        Registre limité à quelques équipes (courses créées hors d'une carrière)
+        
+        Args:
+            teams (list): Équipes
+            
+        Returns:
+            TeamRegistry: Registre des équipes
+        """
+        registry = cls([])
+        for team in teams:
+            if team:
+                registry._add_team(team)
+        return registry
+    
+    def _add_team(self, team):
+        """Ajoute une équipe aux index"""
+        self._by_key[(team.category, team.name)] = team
+        self._by_category.setdefault(team.category, []).append(team)
+    
+    def __iter__(self):
+        return iter(self.academies)
+    
+    def __len__(self):
+        return len(self.academies)
+    
+    def get(self, category, name):
+        """
+        Récupère une équipe par catégorie et nom
+        
+        Args:
+            category (str): Catégorie ('f3', 'f2', 'f1')
+            name (str): Nom de l'équipe
+            
+        Returns:
+            Team: Équipe correspondante ou None
+        """
+        return self._by_key.get((category, name))
+    
+    def get_academy(self, name):
+        """
+        Récupère une académie par son nom
+        
+        Args:
+            name (str): Nom de l'académie
+            
+        Returns:
+            DriverAcademy: Académie correspondante ou None
+        """
+        return self._by_academy.get(name)
+    
+    def in_category(self, category):
+        """
+        Équipes d'une catégorie, dans l'ordre des académies
+        
+        Args:
+            category (str): Catégorie ('f3', 'f2', 'f1')
+            
+        Returns:
+            list: Équipes de la catégorie
+        """
+        return list(self._by_category.get(category, ()))
 
 
 def create_all_academies():
@@ -188,7 +274,7 @@ def create_all_academies():
     Crée toutes les académies avec leurs équipes
     
     Returns:
-        list: Liste de toutes les académies
+        TeamRegistry: Registre des académies et de leurs équipes
     """
     # Ferrari Driver Academy
     ferrari_academy = DriverAcademy("Ferrari Driver Academy", 90)
@@ -220,4 +306,4 @@ def create_all_academies():
     mclaren_academy.add_team(Team("DAMS", "f2", mclaren_academy, 68))
     mclaren_academy.add_team(Team("McLaren F1 Team", "f1", mclaren_academy, 82))
     
-    return [ferrari_academy, mercedes_academy, redbull_academy, alpine_academy, mclaren_academy]
\ No newline at end of file
+    return TeamRegistry([ferrari_academy, mercedes_academy, redbull_academy, alpine_academy, mclaren_academy])
\ No newline at end of file
@@ -5,24 +5,41 @@
 Gestion de la progression de carrière du pilote de F3 à F1
 """
 
+import uuid
+import random
 from src.career.academy import create_all_academies
 from src.career.season import Season
+from src.career.drivers import DriverRegistry
+from src.career.market import DriverMarket
+from src.career.history import CareerHistory, get_history_path
+from src.utils import memory
 
 class CareerPath:
     """Classe gérant la progression de carrière du joueur"""
     
-    def __init__(self, player):
+    def __init__(self, player, history_path=None):
         """
         Initialisation du chemin de carrière
         
         Args:
             player (Player): Joueur/pilote
+            history_path (str, optional): Base d'historique (':memory:' pour une simulation).
+                                          Par défaut, une base par carrière dans HISTORY_DIR.
         """
         self.player = player
         self.current_year = 2023  # Année de départ
-        self.academies = create_all_academies()
-        self.seasons = []  # Historique des saisons
-        self.current_season = None
+        self.teams = create_all_academies()  # Registre des équipes
+        self.academies = self.teams.academies
+        self.current_season = None  # Seule la saison en cours reste en mémoire
+        self.last_season_summary = None  # Classements de la dernière saison terminée
+        self.drivers = DriverRegistry()  # Pilotes IA, conservés d'une saison à l'autre
+        self.last_market_moves = []  # Transferts de la dernière intersaison
+        
+        # Historique des saisons terminées (base SQLite ouverte à la demande)
+        self.career_id = uuid.uuid4().hex
+        self.history_path = history_path
+        self._history = None
+        self._history_seasons = []  # Saisons de cette partie, avant l'ouverture de la base
         
         # Configuration des catégories
         self.category_config = {
@@ -65,6 +82,10 @@ class CareerPath:
         """Démarre une nouvelle saison pour le joueur"""
         category = self.player.category
         races_count = self.category_config[category]['races_per_season']
+        
+        # Intersaison: transferts des pilotes IA (une place est réservée au joueur)
+        if self.current_season is not None:
+            self.last_market_moves = DriverMarket(self.drivers, self.teams).run(self.player.team)
         points_system = self.category_config[category]['points_system']
         
         # Création de la nouvelle saison
@@ -74,28 +95,33 @@ class CareerPath:
             races_count=races_count,
             points_system=points_system,
             player=self.player,
-            teams=self._get_category_teams(category)
+            teams=self.teams.in_category(category),
+            registry=self.drivers,
+            team_registry=self.teams
         )
         
-        # Ajouter la saison à l'historique
-        self.seasons.append(self.current_season)
+        memory.checkpoint(f"Début de saison {self.current_year} {category.upper()}")
     
-    def _get_category_teams(self, category):
-        """
-        Récupère toutes les équipes d'une catégorie donnée
-        
-        Args:
-            category (str): Catégorie ('f3', 'f2', 'f1')
-            
-        Returns:
-            list: Liste des équipes de la catégorie
-        """
-        teams = []
-        for academy in self.academies:
-            team = academy.get_team_by_category(category)
-            if team:
-                teams.append(team)
-        return teams
+    @property
+    def history(self):
+        """Historique des saisons terminées"""
+        if self._history is None:
+            self._history = CareerHistory(self.history_path or get_history_path(self.career_id),
+                                          self._history_seasons)
+        return self._history
+    
+    @property
+    def history_seasons(self):
+        """Identifiants des saisons de cette partie dans l'historique (conservés dans les sauvegardes)"""
+        if self._history is not None:
+            return list(self._history.seasons)
+        return list(self._history_seasons)
+    
+    @history_seasons.setter
+    def history_seasons(self, seasons):
+        self._history_seasons = list(seasons)
+        if self._history is not None:
+            self._history.seasons = list(seasons)
     
     def end_season(self):
         """
@@ -106,6 +132,13 @@ class CareerPath:
         """
         results = self.current_season.get_final_standings()
         player_position = results['player_position']
+        
+        # Archivage de la saison terminée, seul un résumé reste en mémoire
+        self.history.archive_season(self.current_season)
+        self.last_season_summary = self.current_season.get_summary()
+        self.drivers.record_season(self.current_season)
+        self.drivers.compact()
+        memory.checkpoint(f"Fin de saison {self.current_season.year} {self.current_season.category.upper()}")
         player_points = results['player_points']
         
         # Mise à jour de l'année
@@ -127,6 +160,7 @@ class CareerPath:
             'points': player_points,
             'promotion_available': promotion,
             'new_contracts': new_contracts,
+            'summary': self.last_season_summary,
             'season_end': True
         }
         
@@ -202,7 +236,6 @@ class CareerPath:
                 chance = min(80, int(self.player.reputation / 2))
                 
                 # Simulation d'une chance d'obtenir une offre
-                import random
                 if random.randint(1, 100) <= chance:
                     team = academy.get_team_by_category(category)
                     if team:
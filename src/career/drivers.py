@@ -0,0 +1,374 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Base persistante des pilotes IA: les pilotes sont conservés d'une saison
+à l'autre, stockés dans des tableaux compacts et indexés par catégorie et
+par équipe
+
+Les méthodes de la base désignent un pilote par sa ligne dans les tableaux;
+les lignes des retraités sont supprimées en fin de saison. Les saisons et
+l'historique utilisent l'identifiant permanent du pilote (uid).
+"""
+
+import random
+from array import array
+
+# Catégories (indices stockés dans le tableau des catégories)
+CATEGORIES = ('f3', 'f2', 'f1')
+
+# Aucune catégorie (pilote retraité)
+RETIRED = -1
+
+# Âge de départ à la retraite des pilotes IA
+RETIREMENT_AGE = 38
+
+# Pilotes IA par équipe (une place est laissée au joueur dans son équipe)
+SEATS_PER_TEAM = 2
+
+FIRST_NAMES = ["Alex", "Daniel", "Carlos", "Lewis", "Max", "Charles", "Lando", "Pierre", "Esteban",
+               "Lance", "Fernando", "Sebastian", "Mick", "Valtteri", "George", "Sergio", "Yuki",
+               "Nicholas", "Zhou", "Kevin", "Jean", "Oscar", "Théo", "Jack", "Frederik", "Oliver"]
+
+LAST_NAMES = ["Smith", "Johnson", "Brown", "Garcia", "Miller", "Davis", "Rodriguez", "Martinez",
+              "Wilson", "Anderson", "Taylor", "Thomas", "Moore", "Martin", "Lee", "Thompson",
+              "White", "Lopez", "Hill", "Clark", "Lewis", "Robinson", "Walker", "Young", "Allen",
+              "King", "Wright", "Scott", "Torres", "Nguyen", "Pourchaire", "Doohan", "Lawson"]
+
+# Âge des nouveaux pilotes par catégorie
+ROOKIE_AGES = {'f3': (16, 19), 'f2': (18, 22), 'f1': (21, 26)}
+
+# Durée des contrats des pilotes IA (saisons)
+CONTRACT_YEARS = (1, 3)
+
+# Les pilotes de saison sont numérotés à partir de 1 ("driver_1" = pilote d'identifiant
+# permanent 0), comme les plateaux générés par les anciennes versions
+def season_driver_id(uid):
+    """Identifiant d'un pilote de la base dans une saison"""
+    return f"driver_{uid + 1}"
+
+def registry_driver_id(season_id):
+    """Identifiant permanent d'un pilote de saison (None pour le joueur)"""
+    if season_id.startswith("driver_"):
+        return int(season_id[7:]) - 1
+    return None
+
+
+class DriverRegistry:
+    """Pilotes IA de la carrière"""
+
+    def __init__(self):
+        """Initialisation d'une base vide"""
+        self.names = []
+        self.teams = []
+        self.categories = array('b')
+        self.skills = array('f')
+        self.ages = array('B')
+        self.contracts = array('B')  # Saisons de contrat restantes (0 = libre)
+
+        # Statistiques de carrière
+        self.races = array('H')
+        self.wins = array('H')
+        self.podiums = array('H')
+        self.points = array('f')
+
+        # Identifiants permanents (inchangés par le compactage)
+        self.uids = array('L')
+        self.next_uid = 0
+
+        # Index: identifiant permanent -> ligne, catégorie -> pilotes, (catégorie, équipe) -> pilotes
+        self.rows = {}
+        self.by_category = {category: [] for category in CATEGORIES}
+        self.by_team = {}
+
+    def __len__(self):
+        return len(self.names)
+
+    def add(self, name, category, team, skill, age, contract_years=1, uid=None):
+        """
+        Ajoute un pilote
+
+        Args:
+            name (str): Nom
+            category (str): Catégorie ('f3', 'f2', 'f1')
+            team (str): Nom de l'équipe
+            skill (float): Niveau (1-100)
+            age (int): Âge
+            contract_years (int): Durée du contrat avec l'équipe
+            uid (int, optional): Identifiant permanent (par défaut le suivant)
+
+        Returns:
+            int: Ligne du pilote
+        """
+        if uid is None:
+            uid = self.next_uid
+        self.next_uid = max(self.next_uid, uid + 1)
+
+        driver_id = len(self.names)
+        self.uids.append(uid)
+        self.rows[uid] = driver_id
+        self.names.append(name)
+        self.teams.append(team)
+        self.categories.append(CATEGORIES.index(category))
+        self.skills.append(skill)
+        self.ages.append(age)
+        self.contracts.append(contract_years)
+        for column in (self.races, self.wins, self.podiums, self.points):
+            column.append(0)
+
+        self._index(driver_id)
+        return driver_id
+
+    def _index(self, driver_id):
+        """Ajoute un pilote aux index"""
+        category = CATEGORIES[self.categories[driver_id]]
+        self.by_category[category].append(driver_id)
+        self.by_team.setdefault((category, self.teams[driver_id]), []).append(driver_id)
+
+    def _unindex(self, driver_id):
+        """Retire un pilote des index"""
+        category = CATEGORIES[self.categories[driver_id]]
+        self.by_category[category].remove(driver_id)
+        self.by_team[(category, self.teams[driver_id])].remove(driver_id)
+
+    def get(self, driver_id):
+        """
+        Informations d'un pilote
+
+        Args:
+            driver_id (int): Ligne du pilote
+
+        Returns:
+            dict: Nom, équipe, catégorie, niveau, âge et statistiques
+        """
+        category = self.categories[driver_id]
+        return {
+            'id': driver_id,
+            'uid': self.uids[driver_id],
+            'name': self.names[driver_id],
+            'team': self.teams[driver_id],
+            'category': CATEGORIES[category] if category != RETIRED else None,
+            'skills': self.skills[driver_id],
+            'age': self.ages[driver_id],
+            'contract_years': self.contracts[driver_id],
+            'races': self.races[driver_id],
+            'wins': self.wins[driver_id],
+            'podiums': self.podiums[driver_id],
+            'points': self.points[driver_id]
+        }
+
+    def drivers_in(self, category):
+        """Pilotes en activité d'une catégorie"""
+        return list(self.by_category[category])
+
+    def drivers_of(self, category, team):
+        """Pilotes d'une équipe"""
+        return list(self.by_team.get((category, team), ()))
+
+    def transfer(self, driver_id, category, team, contract_years=1):
+        """
+        Change un pilote d'équipe ou de catégorie
+
+        Args:
+            driver_id (int): Ligne du pilote
+            category (str): Nouvelle catégorie
+            team (str): Nouvelle équipe
+            contract_years (int): Durée du nouveau contrat
+        """
+        if self.categories[driver_id] != RETIRED:
+            self._unindex(driver_id)
+        self.categories[driver_id] = CATEGORIES.index(category)
+        self.teams[driver_id] = team
+        self.contracts[driver_id] = contract_years
+        self._index(driver_id)
+
+    def retire(self, driver_id):
+        """Met fin à la carrière d'un pilote (il reste dans la base jusqu'au compactage)"""
+        if self.categories[driver_id] != RETIRED:
+            self._unindex(driver_id)
+            self.categories[driver_id] = RETIRED
+
+    def compact(self):
+        """
+        Supprime les pilotes retraités: les lignes sont renumérotées, les
+        identifiants permanents sont conservés
+
+        Returns:
+            int: Nombre de pilotes supprimés
+        """
+        kept = [driver_id for driver_id, category in enumerate(self.categories) if category != RETIRED]
+        removed = len(self.names) - len(kept)
+        if not removed:
+            return 0
+
+        self.names = [self.names[d] for d in kept]
+        self.teams = [self.teams[d] for d in kept]
+        for name in ('categories', 'skills', 'ages', 'contracts', 'races', 'wins', 'podiums', 'points', 'uids'):
+            column = getattr(self, name)
+            setattr(self, name, array(column.typecode, [column[d] for d in kept]))
+        self._reindex()
+        return removed
+
+    def _reindex(self):
+        """Reconstruit les index à partir des colonnes"""
+        self.rows = {uid: driver_id for driver_id, uid in enumerate(self.uids)}
+        self.by_category = {category: [] for category in CATEGORIES}
+        self.by_team = {}
+        for driver_id, category in enumerate(self.categories):
+            if category != RETIRED:
+                self._index(driver_id)
+
+    def sign_rookie(self, category, team):
+        """
+        Crée un nouveau pilote pour une équipe (niveau lié à sa performance)
+
+        Args:
+            category (str): Catégorie
+            team (Team): Équipe
+
+        Returns:
+            int: Ligne du pilote
+        """
+        name = f"{random.choice(FIRST_NAMES)} {random.choice(LAST_NAMES)}"
+        skill = max(1, min(100, team.performance + random.randint(-15, 15)))
+        age = random.randint(*ROOKIE_AGES[category])
+        return self.add(name, category, team.name, skill, age, random.randint(*CONTRACT_YEARS))
+
+    def field(self, category, teams, player_team):
+        """
+        Plateau d'une saison: les pilotes des équipes, complétés si des
+        places sont libres
+
+        Args:
+            category (str): Catégorie
+            teams (list): Équipes de la catégorie
+            player_team (str): Équipe du joueur (une place lui est réservée)
+
+        Returns:
+            dict: Pilotes au format des saisons (id: name, team, skills, is_player)
+        """
+        drivers = {}
+        for team in teams:
+            seats = SEATS_PER_TEAM - (1 if team.name == player_team else 0)
+            roster = self.by_team.get((category, team.name), [])
+
+            while len(roster) < seats:
+                self.sign_rookie(category, team)
+                roster = self.by_team[(category, team.name)]
+
+            # Les meilleurs pilotes de l'équipe sont titulaires
+            for driver_id in sorted(roster, key=lambda d: -self.skills[d])[:seats]:
+                drivers[season_driver_id(self.uids[driver_id])] = {
+                    "name": self.names[driver_id],
+                    "team": team.name,
+                    "skills": self.skills[driver_id],
+                    "is_player": False
+                }
+        return drivers
+
+    def record_season(self, season):
+        """
+        Fin de saison: statistiques, vieillissement, progression, contrats et retraites
+
+        Args:
+            season (Season): Saison terminée
+        """
+        for record in season.race_results:
+            for i, season_id in enumerate(record.order):
+                driver_id = self.rows.get(registry_driver_id(season_id))
+                if driver_id is None:
+                    continue
+                self.races[driver_id] += 1
+                self.points[driver_id] += record.points[i]
+                if i == 0:
+                    self.wins[driver_id] += 1
+                if i < 3:
+                    self.podiums[driver_id] += 1
+
+        for driver_id in [d for category in CATEGORIES for d in self.by_category[category]]:
+            age = self.ages[driver_id] + 1
+            self.ages[driver_id] = age
+            if self.contracts[driver_id]:
+                self.contracts[driver_id] -= 1
+
+            if age >= RETIREMENT_AGE:
+                self.retire(driver_id)
+                continue
+
+            # Les jeunes pilotes progressent, les plus âgés déclinent
+            change = random.uniform(-1, 3) if age < 28 else random.uniform(-3, 1)
+            self.skills[driver_id] = max(1, min(100, self.skills[driver_id] + change))
+
+    @classmethod
+    def from_field(cls, category, drivers):
+        """
+        Base reconstituée à partir du plateau d'une saison (sauvegardes
+        antérieures à la base des pilotes)
+
+        Args:
+            category (str): Catégorie de la saison
+            drivers (dict): Pilotes de la saison (id: name, team, skills, is_player)
+
+        Returns:
+            DriverRegistry: Base dont les identifiants permanents correspondent à ceux du plateau
+        """
+        registry = cls()
+        ai_drivers = sorted(
+            (registry_driver_id(driver_id), info) for driver_id, info in drivers.items()
+            if not info["is_player"] and registry_driver_id(driver_id) is not None
+        )
+        for uid, info in ai_drivers:
+            registry.add(info["name"], category, info["team"], info["skills"], ROOKIE_AGES[category][1], uid=uid)
+        return registry
+
+    def to_state(self):
+        """
+        État de la base en structures simples (sauvegarde)
+
+        Returns:
+            dict: Colonnes de la base
+        """
+        return {
+            'names': list(self.names),
+            'teams': list(self.teams),
+            'categories': self.categories.tolist(),
+            'skills': self.skills.tolist(),
+            'ages': self.ages.tolist(),
+            'contracts': self.contracts.tolist(),
+            'races': self.races.tolist(),
+            'wins': self.wins.tolist(),
+            'podiums': self.podiums.tolist(),
+            'points': self.points.tolist(),
+            'uids': self.uids.tolist(),
+            'next_uid': self.next_uid
+        }
+
+    @classmethod
+    def from_state(cls, state):
+        """
+        Reconstruit la base à partir de son état
+
+        Args:
+            state (dict): État renvoyé par to_state
+
+        Returns:
+            DriverRegistry: Base reconstruite
+        """
+        registry = cls()
+        registry.names = list(state['names'])
+        registry.teams = list(state['teams'])
+        registry.categories = array('b', state['categories'])
+        registry.skills = array('f', state['skills'])
+        registry.ages = array('B', state['ages'])
+        registry.contracts = array('B', state['contracts'])
+        registry.races = array('H', state['races'])
+        registry.wins = array('H', state['wins'])
+        registry.podiums = array('H', state['podiums'])
+        registry.points = array('f', state['points'])
+
+        # Les bases sans identifiants permanents n'étaient jamais compactées: ligne = identifiant
+        registry.uids = array('L', state.get('uids', range(len(registry.names))))
+        registry.next_uid = state.get('next_uid', len(registry.names))
+
+        registry._reindex()
+        return registry
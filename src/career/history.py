@@ -0,0 +1,305 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Historique de carrière stocké dans une base SQLite locale: saisons
+terminées, courses, résultats et classements
+
+Toutes les sauvegardes d'une carrière partagent la même base. Une saison
+archivée n'est jamais supprimée: chaque sauvegarde conserve la liste des
+saisons de sa partie, et les lectures sont limitées à ces saisons. Recharger
+une ancienne sauvegarde puis rejouer une saison ajoute une nouvelle saison
+de la même année sans toucher à celle des sauvegardes plus récentes.
+"""
+
+import os
+import sqlite3
+from src.career.drivers import registry_driver_id
+
+# Dossier des bases d'historique (une base par carrière)
+HISTORY_DIR = os.path.join(os.path.expanduser('~'), '.drive_to_survive', 'history')
+
+# Version du schéma (PRAGMA user_version)
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS seasons (
+    id INTEGER PRIMARY KEY,
+    year INTEGER NOT NULL,
+    category TEXT NOT NULL,
+    races_count INTEGER NOT NULL,
+    player_team TEXT,
+    player_position INTEGER,
+    player_points REAL,
+    champion TEXT,
+    team_champion TEXT
+);
+CREATE TABLE IF NOT EXISTS races (
+    id INTEGER PRIMARY KEY,
+    season_id INTEGER NOT NULL REFERENCES seasons(id) ON DELETE CASCADE,
+    round INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    circuit TEXT NOT NULL,
+    country TEXT,
+    date TEXT,
+    weather TEXT,
+    fastest_driver TEXT,
+    fastest_time REAL
+);
+CREATE TABLE IF NOT EXISTS results (
+    race_id INTEGER NOT NULL REFERENCES races(id) ON DELETE CASCADE,
+    driver_id INTEGER,
+    driver TEXT NOT NULL,
+    team TEXT NOT NULL,
+    is_player INTEGER NOT NULL,
+    grid INTEGER,
+    position INTEGER NOT NULL,
+    points REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS standings (
+    season_id INTEGER NOT NULL REFERENCES seasons(id) ON DELETE CASCADE,
+    kind TEXT NOT NULL,
+    name TEXT NOT NULL,
+    team TEXT,
+    position INTEGER NOT NULL,
+    points REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_seasons_year ON seasons(year);
+CREATE INDEX IF NOT EXISTS idx_races_season ON races(season_id);
+CREATE INDEX IF NOT EXISTS idx_races_circuit ON races(circuit);
+CREATE INDEX IF NOT EXISTS idx_results_race ON results(race_id);
+CREATE INDEX IF NOT EXISTS idx_results_driver_id ON results(driver_id);
+CREATE INDEX IF NOT EXISTS idx_results_team ON results(team);
+CREATE INDEX IF NOT EXISTS idx_results_player ON results(is_player, position);
+CREATE INDEX IF NOT EXISTS idx_standings_season ON standings(season_id, kind);
+CREATE INDEX IF NOT EXISTS idx_standings_name ON standings(name);
+"""
+
+def get_history_path(career_id):
+    """
+    Chemin de la base d'historique d'une carrière
+
+    Args:
+        career_id (str): Identifiant de la carrière
+
+    Returns:
+        str: Chemin du fichier
+    """
+    return os.path.join(HISTORY_DIR, f"career_{career_id}.db")
+
+
+class CareerHistory:
+    """Base d'historique d'une carrière"""
+
+    def __init__(self, path, seasons=()):
+        """
+        Ouverture (et création si nécessaire) de la base
+
+        Args:
+            path (str): Chemin du fichier, ou ':memory:' (simulations sans disque)
+            seasons (iterable): Identifiants des saisons de la partie en cours
+        """
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        self.path = path
+        self.seasons = list(seasons)
+        self.connection = sqlite3.connect(path)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.executescript(SCHEMA)
+        self.connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self.connection.execute("PRAGMA foreign_keys = ON")
+
+    def close(self):
+        """Ferme la base"""
+        self.connection.close()
+
+    def archive_season(self, season):
+        """
+        Enregistre une saison terminée et l'ajoute aux saisons de la partie
+        (à la place d'une saison de la même année de la partie, qui reste dans
+        la base pour les autres sauvegardes)
+
+        Args:
+            season (Season): Saison terminée
+
+        Returns:
+            int: Identifiant de la saison dans la base
+        """
+        standings = season.get_current_standings()
+        driver_standings = standings['driver_standings']
+        team_standings = standings['team_standings']
+        drivers = season.drivers
+
+        champion = drivers[driver_standings[0][0]]['name'] if driver_standings else None
+        team_champion = team_standings[0][0] if team_standings else None
+
+        with self.connection:
+            season_id = self.connection.execute(
+                "INSERT INTO seasons (year, category, races_count, player_team, player_position,"
+                " player_points, champion, team_champion) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (season.year, season.category, season.races_count,
+                 drivers['player']['team'] if 'player' in drivers else None,
+                 standings['player_position'], standings['player_points'], champion, team_champion)
+            ).lastrowid
+
+            # Courses et résultats
+            for race_info, record in zip(season.race_calendar, season.race_results):
+                fastest_driver, fastest_time = None, None
+                if record.fastest_lap and record.fastest_lap[0] in drivers:
+                    fastest_driver = drivers[record.fastest_lap[0]]['name']
+                    fastest_time = record.fastest_lap[2]
+
+                race_id = self.connection.execute(
+                    "INSERT INTO races (season_id, round, name, circuit, country, date, weather,"
+                    " fastest_driver, fastest_time) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (season_id, race_info['id'], race_info['name'], race_info['circuit']['name'],
+                     race_info['circuit']['country'], race_info['date'], record.weather,
+                     fastest_driver, fastest_time)
+                ).lastrowid
+
+                self.connection.executemany(
+                    "INSERT INTO results (race_id, driver_id, driver, team, is_player, grid, position, points)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    [
+                        (race_id, registry_driver_id(driver_id), drivers[driver_id]['name'], drivers[driver_id]['team'],
+                         int(drivers[driver_id]['is_player']), record.grid_position_of(driver_id) or None,
+                         i + 1, record.points[i])
+                        for i, driver_id in enumerate(record.order)
+                        if driver_id in drivers
+                    ]
+                )
+
+            # Classements finaux
+            self.connection.executemany(
+                "INSERT INTO standings (season_id, kind, name, team, position, points) VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (season_id, 'driver', drivers[driver_id]['name'], drivers[driver_id]['team'], i + 1, points)
+                    for i, (driver_id, points) in enumerate(driver_standings)
+                ] + [
+                    (season_id, 'team', team_name, team_name, i + 1, points)
+                    for i, (team_name, points) in enumerate(team_standings)
+                ]
+            )
+
+        condition, params = self._in_game('id')
+        replaced = {row['id'] for row in self.connection.execute(
+            f"SELECT id FROM seasons WHERE year = ? AND {condition}", [season.year] + params
+        )}
+        self.seasons = [sid for sid in self.seasons if sid not in replaced] + [season_id]
+        return season_id
+
+    def _in_game(self, column='s.id'):
+        """
+        Filtre SQL des saisons de la partie
+
+        Args:
+            column (str): Colonne de l'identifiant de saison
+
+        Returns:
+            tuple: (condition SQL, paramètres)
+        """
+        return f"{column} IN ({', '.join('?' * len(self.seasons))})", list(self.seasons)
+
+    def seasons_before(self, year):
+        """
+        Saisons déjà archivées d'une ancienne sauvegarde (pickle), qui ne
+        conservait pas la liste de ses saisons: la plus récente archivée de
+        chaque année antérieure
+
+        Args:
+            year (int): Année de la sauvegarde
+
+        Returns:
+            list: Identifiants des saisons, par année
+        """
+        return [row['id'] for row in self.connection.execute(
+            "SELECT MAX(id) AS id FROM seasons WHERE year < ? GROUP BY year ORDER BY year", (year,)
+        )]
+
+    def season_summaries(self, limit=None):
+        """
+        Résumé des saisons terminées, de la plus récente à la plus ancienne
+
+        Args:
+            limit (int, optional): Nombre maximum de saisons
+
+        Returns:
+            list: Saisons (dict: year, category, player_team, player_position, player_points, champion, team_champion)
+        """
+        condition, params = self._in_game('id')
+        query = "SELECT year, category, player_team, player_position, player_points, champion, team_champion" \
+                f" FROM seasons WHERE {condition} ORDER BY year DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        return [dict(row) for row in self.connection.execute(query, params)]
+
+    def player_totals(self):
+        """
+        Totaux du joueur par année
+
+        Returns:
+            list: Lignes (dict: year, category, races, wins, podiums, points)
+        """
+        condition, params = self._in_game()
+        return [dict(row) for row in self.connection.execute(
+            "SELECT s.year, s.category, COUNT(*) AS races,"
+            " SUM(r.position = 1) AS wins, SUM(r.position <= 3) AS podiums, SUM(r.points) AS points"
+            " FROM results r JOIN races ra ON ra.id = r.race_id JOIN seasons s ON s.id = ra.season_id"
+            f" WHERE r.is_player = 1 AND {condition} GROUP BY s.year ORDER BY s.year", params
+        )]
+
+    def driver_results(self, driver_id):
+        """
+        Résultats d'un pilote IA sur toute la carrière (les noms des pilotes
+        ne sont pas uniques: la recherche se fait par identifiant)
+
+        Args:
+            driver_id (int): Identifiant permanent du pilote (DriverRegistry.uids)
+
+        Returns:
+            list: Résultats (dict: year, circuit, team, grid, position, points)
+        """
+        condition, params = self._in_game()
+        return [dict(row) for row in self.connection.execute(
+            "SELECT s.year, ra.circuit, r.team, r.grid, r.position, r.points"
+            " FROM results r JOIN races ra ON ra.id = r.race_id JOIN seasons s ON s.id = ra.season_id"
+            f" WHERE r.driver_id = ? AND {condition} ORDER BY s.year, ra.round", [driver_id] + params
+        )]
+
+    def team_history(self, team):
+        """
+        Classements d'une équipe par saison
+
+        Args:
+            team (str): Nom de l'équipe
+
+        Returns:
+            list: Lignes (dict: year, category, position, points)
+        """
+        condition, params = self._in_game()
+        return [dict(row) for row in self.connection.execute(
+            "SELECT s.year, s.category, st.position, st.points"
+            " FROM standings st JOIN seasons s ON s.id = st.season_id"
+            f" WHERE st.kind = 'team' AND st.name = ? AND {condition} ORDER BY s.year", [team] + params
+        )]
+
+    def circuit_history(self, circuit):
+        """
+        Vainqueurs et résultats du joueur sur un circuit
+
+        Args:
+            circuit (str): Nom du circuit
+
+        Returns:
+            list: Lignes (dict: year, category, winner, player_position)
+        """
+        condition, params = self._in_game()
+        return [dict(row) for row in self.connection.execute(
+            "SELECT s.year, s.category,"
+            " (SELECT driver FROM results WHERE race_id = ra.id AND position = 1) AS winner,"
+            " (SELECT position FROM results WHERE race_id = ra.id AND is_player = 1) AS player_position"
+            " FROM races ra JOIN seasons s ON s.id = ra.season_id"
+            f" WHERE ra.circuit = ? AND {condition} ORDER BY s.year", [circuit] + params
+        )]
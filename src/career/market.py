@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Marché des transferts de l'intersaison: tous les pilotes IA sont évalués
+en une passe sur les colonnes de la base, puis les pilotes libres sont
+associés aux baquets disponibles, de la F1 à la F3
+"""
+
+import random
+from array import array
+from src.career.drivers import CATEGORIES, SEATS_PER_TEAM, CONTRACT_YEARS
+
+# Catégorie inférieure (vivier des promotions)
+LOWER_CATEGORY = {'f1': 'f2', 'f2': 'f3', 'f3': None}
+
+# Note minimale d'un pilote de la catégorie inférieure pour être promu
+PROMOTION_SCORES = {'f2': 65, 'f1': 75}
+
+# Âge à partir duquel un pilote sans baquet met fin à sa carrière
+RELEASE_RETIREMENT_AGE = 30
+
+
+class DriverMarket:
+    """Marché des pilotes IA entre deux saisons"""
+
+    def __init__(self, registry, teams):
+        """
+        Initialisation du marché
+
+        Args:
+            registry (DriverRegistry): Base des pilotes IA
+            teams (TeamRegistry): Registre des équipes
+        """
+        self.registry = registry
+        self.teams = teams
+
+    def score_drivers(self):
+        """
+        Note de tous les pilotes en une passe: niveau, marge de progression
+        liée à l'âge et réputation (points par course)
+
+        Returns:
+            array: Note de chaque pilote (indexée par ligne)
+        """
+        registry = self.registry
+        return array('f', [
+            skill + max(0, 24 - age) * 1.5 - max(0, age - 30) * 2 + min(20, points / races if races else 0) / 2
+            for skill, age, points, races in zip(registry.skills, registry.ages, registry.points, registry.races)
+        ])
+
+    def team_appeal(self, category):
+        """
+        Attractivité des équipes d'une catégorie (performance et budget)
+
+        Args:
+            category (str): Catégorie
+
+        Returns:
+            list: Équipes de la plus attractive à la moins attractive
+        """
+        teams = self.teams.in_category(category)
+        max_budget = max((team.budget for team in teams), default=0) or 1
+        return sorted(teams, key=lambda team: -(team.performance + 20 * team.budget / max_budget))
+
+    def run(self, player_team=None):
+        """
+        Intersaison: les pilotes en fin de contrat, les meilleurs espoirs de
+        la catégorie inférieure et les pilotes libérés se disputent les
+        baquets libres
+
+        Les équipes et les pilotes classent leurs partenaires selon les mêmes
+        critères (attractivité, note): l'attribution dans l'ordre des notes
+        donne l'unique affectation stable.
+
+        Args:
+            player_team (Team, optional): Équipe du joueur (un baquet lui est réservé)
+
+        Returns:
+            list: Mouvements (identifiant permanent, (catégorie, équipe) de départ ou None pour un
+                  nouveau pilote, (catégorie, équipe) d'arrivée ou None pour une retraite)
+        """
+        registry = self.registry
+        scores = self.score_drivers()
+        categories = registry.categories
+        contracts = registry.contracts
+        uids = registry.uids
+        moves = []
+
+        # Pilotes libres par catégorie (contrat terminé)
+        free_agents = {
+            category: [d for d in registry.by_category[category] if contracts[d] == 0]
+            for category in CATEGORIES
+        }
+
+        for category in reversed(CATEGORIES):
+            lower = LOWER_CATEGORY[category]
+
+            # Baquets libres: places des équipes (moins celle du joueur) et pilotes sous contrat
+            seats = []
+            for team in self.team_appeal(category):
+                available = SEATS_PER_TEAM - (1 if player_team is not None and team is player_team else 0)
+                contracted = sorted(
+                    (d for d in registry.by_team.get((category, team.name), ()) if contracts[d] > 0),
+                    key=lambda d: -scores[d]
+                )
+                # Pilotes sous contrat en surnombre (arrivée du joueur): libérés sur le marché
+                for driver_id in contracted[available:]:
+                    contracts[driver_id] = 0
+                    free_agents[category].append(driver_id)
+                seats.extend([team] * max(0, available - len(contracted)))
+
+            # Candidats: pilotes libres de la catégorie et espoirs de la catégorie inférieure
+            candidates = list(free_agents[category])
+            if lower:
+                threshold = PROMOTION_SCORES[category]
+                candidates.extend(d for d in free_agents[lower] if scores[d] >= threshold)
+            candidates.sort(key=lambda d: -scores[d])
+
+            signed = set()
+            for driver_id, team in zip(candidates, seats):
+                origin = (CATEGORIES[categories[driver_id]], registry.teams[driver_id])
+                registry.transfer(driver_id, category, team.name, random.randint(*CONTRACT_YEARS))
+                signed.add(driver_id)
+                if origin != (category, team.name):
+                    moves.append((uids[driver_id], origin, (category, team.name)))
+
+            if lower:
+                free_agents[lower] = [d for d in free_agents[lower] if d not in signed]
+
+            # Pilotes sans baquet: retraite ou descente dans la catégorie inférieure
+            for driver_id in free_agents[category]:
+                if driver_id in signed:
+                    continue
+                origin = (category, registry.teams[driver_id])
+                if lower is None or registry.ages[driver_id] >= RELEASE_RETIREMENT_AGE:
+                    registry.retire(driver_id)
+                    moves.append((uids[driver_id], origin, None))
+                else:
+                    free_agents[lower].append(driver_id)
+
+            # Baquets restés libres en bas de l'échelle: nouveaux pilotes des académies
+            if lower is None and len(registry):
+                for team in seats[len(candidates):]:
+                    driver_id = registry.sign_rookie(category, team)
+                    moves.append((uids[driver_id], None, (category, team.name)))
+
+        return moves
@@ -6,12 +6,19 @@ Gestion des saisons de course et des championnats
 """
 
 import random
+from array import array
 from src.racing.race import Race
+from src.racing.circuits import circuits_for
+from src.racing.results import RaceRecord, SeasonSummary
+from src.career.academy import TeamRegistry
+from src.career.drivers import DriverRegistry
+from src.utils.instrument import timed, counted
+from src.utils import memory
 
 class Season:
     """Classe représentant une saison de course"""
     
-    def __init__(self, year, category, races_count, points_system, player, teams):
+    def __init__(self, year, category, races_count, points_system, player, teams, registry=None, team_registry=None):
         """
         Initialisation d'une saison
         
@@ -22,6 +29,10 @@ class Season:
             points_system (list): Système de points pour les positions
             player (Player): Joueur/pilote
             teams (list): Liste des équipes participantes
+            registry (DriverRegistry, optional): Base des pilotes IA de la carrière.
+                                                 Par défaut, une base propre à la saison.
+            team_registry (TeamRegistry, optional): Registre des équipes de la carrière.
+                                                    Par défaut, un registre des équipes participantes.
         """
         self.year = year
         self.category = category
@@ -29,6 +40,8 @@ class Season:
         self.points_system = points_system
         self.player = player
         self.teams = teams
+        self.registry = registry if registry is not None else DriverRegistry()
+        self.team_registry = team_registry if team_registry is not None else TeamRegistry.from_teams(teams)
         
         # Génération des circuits pour la saison
         self.circuits = self._generate_circuits()
@@ -46,8 +59,11 @@ class Season:
         # Index de la course actuelle
         self.current_race_index = 0
         
-        # Historique des résultats
+        # Historique des résultats (RaceRecord compacts)
         self.race_results = []
+        
+        # Nombre d'arrivées à chaque position et clés de tri des classements
+        self.rebuild_finishes()
     
     def _generate_circuits(self):
         """
@@ -56,45 +72,9 @@ class Season:
         Returns:
             list: Liste des circuits
         """
-        # Liste des circuits possibles selon la catégorie
-        f1_circuits = [
-            {"name": "Circuit de Monaco", "country": "Monaco", "difficulty": 9},
-            {"name": "Silverstone", "country": "Royaume-Uni", "difficulty": 7},
-            {"name": "Spa-Francorchamps", "country": "Belgique", "difficulty": 8},
-            {"name": "Monza", "country": "Italie", "difficulty": 6},
-            {"name": "Suzuka", "country": "Japon", "difficulty": 8},
-            {"name": "Circuit des Amériques", "country": "États-Unis", "difficulty": 7},
-            {"name": "Circuit de Barcelone-Catalogne", "country": "Espagne", "difficulty": 6},
-            {"name": "Red Bull Ring", "country": "Autriche", "difficulty": 5},
-            {"name": "Hungaroring", "country": "Hongrie", "difficulty": 7},
-            {"name": "Circuit Gilles-Villeneuve", "country": "Canada", "difficulty": 6},
-            {"name": "Yas Marina", "country": "Émirats arabes unis", "difficulty": 5},
-            {"name": "Bahrain International Circuit", "country": "Bahreïn", "difficulty": 5},
-            {"name": "Circuit de Djeddah", "country": "Arabie Saoudite", "difficulty": 8},
-            {"name": "Circuit International de Shanghai", "country": "Chine", "difficulty": 6},
-            {"name": "Autodromo Jose Carlos Pace", "country": "Brésil", "difficulty": 7},
-            {"name": "Circuit de Zandvoort", "country": "Pays-Bas", "difficulty": 7},
-            {"name": "Albert Park", "country": "Australie", "difficulty": 6},
-            {"name": "Circuit Paul Ricard", "country": "France", "difficulty": 5},
-            {"name": "Baku City Circuit", "country": "Azerbaïdjan", "difficulty": 8},
-            {"name": "Losail International Circuit", "country": "Qatar", "difficulty": 6},
-            {"name": "Autodromo Enzo e Dino Ferrari", "country": "Italie", "difficulty": 7},
-            {"name": "Circuit de Mexico", "country": "Mexique", "difficulty": 6},
-            {"name": "Marina Bay Street Circuit", "country": "Singapour", "difficulty": 9}
-        ]
-        
-        f2_f3_circuits = [circuit for circuit in f1_circuits if circuit["difficulty"] <= 8]
-        
-        # Sélection des circuits selon la catégorie
-        if self.category == 'f1':
-            # Pour la F1, on utilise 23 circuits (tous différents)
-            selected_circuits = random.sample(f1_circuits, min(self.races_count, len(f1_circuits)))
-        elif self.category == 'f2':
-            # Pour la F2, on utilise 12 circuits
-            selected_circuits = random.sample(f2_f3_circuits, min(self.races_count, len(f2_f3_circuits)))
-        else:  # f3
-            # Pour la F3, on utilise 7 circuits
-            selected_circuits = random.sample(f2_f3_circuits, min(self.races_count, len(f2_f3_circuits)))
+        # Circuits éligibles de la catégorie (catalogue chargé une seule fois)
+        eligible_circuits = circuits_for(self.category)
+        selected_circuits = random.sample(eligible_circuits, min(self.races_count, len(eligible_circuits)))
         
         return selected_circuits
     
@@ -105,13 +85,6 @@ class Season:
         Returns:
             dict: Dictionnaire des pilotes (id: info)
         """
-        # Nombre de pilotes selon la catégorie
-        drivers_count = {
-            'f1': 20,
-            'f2': 22,
-            'f3': 30
-        }
-        
         # Le joueur est toujours inclus
         drivers = {
             "player": {
@@ -122,64 +95,8 @@ class Season:
             }
         }
         
-        # Génération des pilotes IA
-        first_names = ["Alex", "Daniel", "Carlos", "Lewis", "Max", "Charles", "Lando", "Pierre", "Esteban", 
-                      "Lance", "Fernando", "Sebastian", "Mick", "Valtteri", "George", "Sergio", "Yuki", 
-                      "Nicholas", "Zhou", "Kevin", "Jean", "Oscar", "Théo", "Jack", "Frederik", "Oliver"]
-        
-        last_names = ["Smith", "Johnson", "Brown", "Garcia", "Miller", "Davis", "Rodriguez", "Martinez", 
-                      "Wilson", "Anderson", "Taylor", "Thomas", "Moore", "Martin", "Lee", "Thompson", 
-                      "White", "Lopez", "Hill", "Clark", "Lewis", "Robinson", "Walker", "Young", "Allen", 
-                      "King", "Wright", "Scott", "Torres", "Nguyen", "Pourchaire", "Doohan", "Lawson"]
-        
-        # Attribuer les pilotes IA aux équipes
-        team_names = [team.name for team in self.teams]
-        drivers_per_team = {}
-        
-        for team_name in team_names:
-            drivers_per_team[team_name] = 0
-        
-        # Nombre total de pilotes à générer
-        ai_drivers_count = drivers_count[self.category] - 1  # -1 pour le joueur
-        
-        for i in range(ai_drivers_count):
-            # Choisir un nom
-            first_name = random.choice(first_names)
-            last_name = random.choice(last_names)
-            name = f"{first_name} {last_name}"
-            
-            # Choisir une équipe qui n'a pas encore tous ses pilotes
-            available_teams = [team for team in team_names 
-                              if drivers_per_team[team] < 2 and team != self.player.team.name]
-            
-            # Si le joueur est le seul pilote de son équipe, aussi considérer son équipe
-            if drivers_per_team[self.player.team.name] < 1:
-                available_teams.append(self.player.team.name)
-            
-            if not available_teams:  # Toutes les équipes sont pleines
-                break
-            
-            team_name = random.choice(available_teams)
-            drivers_per_team[team_name] += 1
-            
-            # Générer un niveau de compétence
-            # Plus d'équipes prestigieuses ont des pilotes plus forts
-            team = next((t for t in self.teams if t.name == team_name), None)
-            base_skill = 50
-            if team:
-                base_skill = team.performance
-            
-            # Ajouter un peu de variation
-            skill = max(1, min(100, base_skill + random.randint(-15, 15)))
-            
-            # Ajouter le pilote
-            driver_id = f"driver_{i+1}"
-            drivers[driver_id] = {
-                "name": name,
-                "team": team_name,
-                "skills": skill,
-                "is_player": False
-            }
+        # Pilotes IA tirés de la base de la carrière (complétée si des places sont libres)
+        drivers.update(self.registry.field(self.category, self.teams, self.player.team.name))
         
         return drivers
     
@@ -205,7 +122,8 @@ class Season:
                 "circuit": circuit,
                 "date": f"{day:02d}/{month:02d}/{self.year}",
                 "completed": False,
-                "race_obj": None
+                "race_obj": None,
+                "result": None
             }
             
             calendar.append(race)
@@ -228,7 +146,9 @@ class Season:
                 circuit=race_info["circuit"],
                 category=self.category,
                 drivers=self.drivers,
-                player=self.player
+                player=self.player,
+                teams=self.team_registry,
+                points_system=self.points_system
             )
             
             # Stocker l'objet Race dans le calendrier
@@ -238,6 +158,7 @@ class Season:
         else:
             return None  # Plus de courses dans la saison
     
+    @timed('season.complete_race')
     def complete_race(self, race_results):
         """
         Marque une course comme terminée et met à jour les classements
@@ -248,27 +169,80 @@ class Season:
         race_info = self.race_calendar[self.current_race_index]
         race_info["completed"] = True
         
-        # Mise à jour des points au championnat
-        driver_positions = race_results.get("driver_positions", {})
-        for driver_id, position in driver_positions.items():
-            # Attribution des points
-            points = 0
-            if position <= len(self.points_system):
-                points = self.points_system[position - 1]
-            
-            # Mise à jour du classement pilote
-            self.driver_standings[driver_id] += points
-            
-            # Mise à jour du classement équipe
-            team_name = self.drivers[driver_id]["team"]
-            self.team_standings[team_name] += points
-        
-        # Enregistrement des résultats
-        self.race_results.append(race_results)
+        # Résultat complet de la course (construit à partir des positions pour les anciens journaux)
+        record = race_results.get("record")
+        if record is None:
+            record = RaceRecord.from_results(race_info["id"], race_results, self.points_system)
+        elif not isinstance(record, RaceRecord):
+            record = RaceRecord.from_state(record)
+        record = record._replace(round=race_info["id"])
+        
+        # Mise à jour des classements en une passe sur l'ordre d'arrivée
+        driver_standings = self.driver_standings
+        team_standings = self.team_standings
+        drivers = self.drivers
+        for driver_id, points in zip(record.order, record.points):
+            if driver_id in driver_standings:
+                driver_standings[driver_id] += points
+                team_standings[drivers[driver_id]["team"]] += points
+        
+        # Enregistrement du résultat compact, l'objet Race n'est plus conservé
+        race_info["result"] = record
+        race_info["race_obj"] = None
+        self.race_results.append(record)
+        self._record_finishes(record)
+        self._update_standing_keys()
         
         # Passage à la course suivante
         self.current_race_index += 1
+        
+        journal = getattr(self.player, 'journal', None)
+        if journal is not None:
+            journal.record('complete_race', {"record": record})
+        
+        memory.checkpoint(f"Fin de course {self.year} {self.category.upper()} #{race_info['id']}")
+    
+    def rebuild_finishes(self):
+        """
+        Recalcule les arrivées par position à partir des résultats de la
+        saison (création ou chargement), puis les clés de tri
+        """
+        positions_count = len(self.drivers)
+        self.driver_finishes = {driver_id: array('H', [0]) * positions_count for driver_id in self.drivers}
+        self.team_finishes = {team_name: array('H', [0]) * positions_count for team_name in self.team_standings}
+        for record in self.race_results:
+            self._record_finishes(record)
+        self._update_standing_keys()
     
+    def _record_finishes(self, record):
+        """
+        Compte les arrivées d'une course
+        
+        Args:
+            record (RaceRecord): Résultat de la course
+        """
+        for i, driver_id in enumerate(record.order):
+            finishes = self.driver_finishes.get(driver_id)
+            if finishes is None or i >= len(finishes):
+                continue
+            finishes[i] += 1
+            team_finishes = self.team_finishes.get(self.drivers[driver_id]["team"])
+            if team_finishes is not None:
+                team_finishes[i] += 1
+    
+    def _update_standing_keys(self):
+        """Précalcule les clés de tri: points, puis nombre d'arrivées à chaque position"""
+        self.driver_keys = {
+            driver_id: (-self.driver_standings[driver_id],) + tuple(-count for count in finishes)
+            for driver_id, finishes in self.driver_finishes.items()
+        }
+        self.team_keys = {
+            team_name: (-self.team_standings[team_name],) + tuple(-count for count in finishes)
+            for team_name, finishes in self.team_finishes.items()
+        }
+    
+    @timed('season.get_current_standings')
+    @counted('season.standings_sorts')
     def get_current_standings(self):
         """
         Récupère les classements actuels
@@ -276,11 +250,11 @@ class Season:
         Returns:
             dict: Classements pilotes et équipes
         """
-        # Tri des classements
-        sorted_drivers = sorted(self.driver_standings.items(), 
-                               key=lambda x: x[1], reverse=True)
-        sorted_teams = sorted(self.team_standings.items(), 
-                             key=lambda x: x[1], reverse=True)
+        # Tri des classements (points, puis départage au nombre de victoires, de deuxièmes places...)
+        driver_keys = self.driver_keys
+        team_keys = self.team_keys
+        sorted_drivers = sorted(self.driver_standings.items(), key=lambda x: driver_keys[x[0]])
+        sorted_teams = sorted(self.team_standings.items(), key=lambda x: team_keys[x[0]])
         
         # Trouver la position du joueur
         player_position = 1
@@ -337,4 +311,29 @@ class Season:
         final_standings["champion"] = champion_name
         final_standings["team_champion"] = team_champion
         
-        return final_standings
\ No newline at end of file
+        return final_standings
+    
+    def get_summary(self):
+        """
+        Résumé compact des classements de la saison
+        
+        Returns:
+            SeasonSummary: Classements pilotes et équipes, position du joueur et champions
+        """
+        standings = self.get_current_standings()
+        driver_standings = tuple(
+            (self.drivers[driver_id]["name"], self.drivers[driver_id]["team"], points)
+            for driver_id, points in standings["driver_standings"]
+        )
+        team_standings = tuple(standings["team_standings"])
+        
+        return SeasonSummary(
+            self.year,
+            self.category,
+            driver_standings,
+            team_standings,
+            standings["player_position"],
+            standings["player_points"],
+            driver_standings[0][0] if driver_standings else None,
+            team_standings[0][0] if team_standings else None
+        )
@@ -0,0 +1,357 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Simulation accélérée de carrières complètes (F3 -> F1) sans interface,
+pour régler l'équilibre entre seuils de promotion et progression des
+compétences
+
+Utilisation:
+    python -m src.career.simulator --careers 1000 --policy ambitious --workers 4
+    python -m src.career.simulator --profile --races 7
+"""
+
+import sys
+import json
+import random
+import argparse
+import multiprocessing
+from src.player import Player
+from src.career.career_path import CareerPath
+from src.utils.stats import percentile
+from src.utils.profiling import DEFAULT_RACES, profile_session, run_headless_scenario
+
+# Âge auquel une carrière simulée s'arrête
+RETIREMENT_AGE = 36
+
+# Nombre maximum de saisons simulées par carrière
+MAX_SEASONS = 20
+
+
+class CareerPolicy:
+    """Décisions du joueur simulé (par défaut: comme un joueur prudent)"""
+
+    name = 'default'
+
+    def choose_academy(self, academies):
+        """
+        Choisit l'académie de départ
+
+        Args:
+            academies (list): Académies disponibles
+
+        Returns:
+            DriverAcademy: Académie choisie
+        """
+        return random.choice(academies)
+
+    def accept_promotion(self, player, season_results):
+        """
+        Décide d'accepter une promotion
+
+        Args:
+            player (Player): Joueur
+            season_results (dict): Résultats de fin de saison
+
+        Returns:
+            bool: True pour accepter
+        """
+        return True
+
+    def choose_contract(self, player, offers):
+        """
+        Choisit une offre de contrat
+
+        Args:
+            player (Player): Joueur
+            offers (list): Offres disponibles (non vide)
+
+        Returns:
+            dict: Offre choisie, ou None pour n'en signer aucune
+        """
+        # Rester dans l'académie si possible
+        for offer in offers:
+            if offer['team'].parent_academy == player.academy:
+                return offer
+        return offers[0]
+
+
+class AmbitiousPolicy(CareerPolicy):
+    """Accepte toutes les promotions et signe le contrat le mieux payé"""
+
+    name = 'ambitious'
+
+    def choose_contract(self, player, offers):
+        return max(offers, key=lambda offer: offer['value'] / offer['years'])
+
+
+class PerformancePolicy(CareerPolicy):
+    """Signe dans l'équipe la plus performante"""
+
+    name = 'performance'
+
+    def choose_contract(self, player, offers):
+        return max(offers, key=lambda offer: offer['team'].performance)
+
+
+class CautiousPolicy(CareerPolicy):
+    """N'accepte une promotion qu'après un titre, reste fidèle à l'académie"""
+
+    name = 'cautious'
+
+    def accept_promotion(self, player, season_results):
+        return season_results['position'] == 1
+
+
+POLICIES = {policy.name: policy for policy in (CareerPolicy, AmbitiousPolicy, PerformancePolicy, CautiousPolicy)}
+
+
+class CareerSimulator:
+    """Fait avancer une carrière saison après saison, sans interface"""
+
+    def __init__(self, policy=None, promotion_thresholds=None, skill_gain=1.0, history_path=':memory:'):
+        """
+        Initialisation du simulateur
+
+        Args:
+            policy (CareerPolicy, optional): Décisions du joueur simulé
+            promotion_thresholds (dict, optional): Seuils de promotion par catégorie ({'f3': 70, 'f2': 80})
+            skill_gain (float): Facteur appliqué aux gains de compétences après chaque course
+            history_path (str): Base d'historique des carrières simulées
+        """
+        self.policy = policy or CareerPolicy()
+        self.promotion_thresholds = promotion_thresholds or {}
+        self.skill_gain = skill_gain
+        self.history_path = history_path
+
+    def run(self, name="Pilote simulé", age=16):
+        """
+        Simule une carrière complète
+
+        Args:
+            name (str): Nom du pilote
+            age (int): Âge de départ
+
+        Returns:
+            dict: Bilan de la carrière (âges de promotion, titres, gains...)
+        """
+        player = Player(name, age)
+        career = CareerPath(player, history_path=self.history_path)
+        for category, threshold in self.promotion_thresholds.items():
+            career.category_config[category]['promotion_threshold'] = threshold
+
+        career.start_career(self.policy.choose_academy(career.academies))
+
+        summary = {
+            'policy': self.policy.name,
+            'seasons': 0,
+            'promotion_ages': {},
+            'titles': {'f3': 0, 'f2': 0, 'f1': 0},
+            'final_category': None,
+            'final_age': None,
+            'earnings': 0,
+            'wins': 0,
+            'podiums': 0,
+            'races': 0,
+            'final_overall': 0
+        }
+
+        try:
+            while player.age < RETIREMENT_AGE and summary['seasons'] < MAX_SEASONS:
+                self._play_season(career)
+                self._end_season(career, summary)
+                summary['seasons'] += 1
+        finally:
+            career.history.close()
+
+        summary['final_category'] = player.category
+        summary['final_age'] = player.age
+        summary['earnings'] = player.money
+        summary['wins'] = player.stats.wins
+        summary['podiums'] = player.stats.podiums
+        summary['races'] = player.stats.races
+        summary['final_overall'] = player.skills.overall
+        return summary
+
+    def _play_season(self, career):
+        """Dispute toutes les courses de la saison comme l'interface de course"""
+        season = career.current_season
+        player = career.player
+
+        while season.current_race_index < len(season.race_calendar):
+            race_obj = season.get_next_race()["race_obj"]
+            results = race_obj.simulate_race()
+            season.complete_race(results)
+
+            skill_improvements = {
+                skill: amount * self.skill_gain
+                for skill, amount in results['skill_improvements'].items()
+            }
+            player.update_stats({
+                'position': results['player_position'],
+                'points': results['points'],
+                'prize_money': results['prize_money'],
+                'skill_improvements': skill_improvements
+            })
+
+    def _end_season(self, career, summary):
+        """Fin de saison: titres, promotion, contrats et nouvelle saison"""
+        player = career.player
+
+        player.advance_year()
+        results = career.end_season()
+
+        if results['position'] == 1:
+            summary['titles'][results['category']] += 1
+
+        offers = results['new_contracts']
+        if results['promotion_available'] and self.policy.accept_promotion(player, results):
+            new_category = career.promote_player()
+            summary['promotion_ages'][new_category] = player.age
+
+            # Les offres de fin de saison concernent l'ancienne catégorie
+            if player.contract_years <= 0 or player.team.category != new_category:
+                offers = career._generate_contract_offers()
+                self._sign(career, offers, required=player.team.category != new_category)
+        elif player.contract_years <= 0 and offers:
+            self._sign(career, offers)
+
+        career.start_new_season()
+
+    def _sign(self, career, offers, required=False):
+        """
+        Signe l'offre choisie par la politique
+
+        Args:
+            career (CareerPath): Carrière
+            offers (list): Offres disponibles
+            required (bool): True si le joueur doit changer d'équipe (promotion)
+        """
+        if not offers:
+            return
+
+        offer = self.policy.choose_contract(career.player, offers)
+        if offer is None and required:
+            offer = offers[0]
+        if offer is not None:
+            career.sign_new_contract(offer)
+
+
+def simulate_career(job):
+    """
+    Simule une carrière (fonction exécutée par les processus du pool)
+
+    Args:
+        job (tuple): (graine, nom de la politique, options du simulateur)
+
+    Returns:
+        dict: Bilan de la carrière
+    """
+    seed, policy_name, options = job
+    random.seed(seed)
+    simulator = CareerSimulator(POLICIES[policy_name](), **options)
+    result = simulator.run()
+    result['seed'] = seed
+    return result
+
+def run_careers(count, policy='default', workers=None, seed=0, **options):
+    """
+    Simule de nombreuses carrières en parallèle
+
+    Args:
+        count (int): Nombre de carrières
+        policy (str): Nom de la politique (voir POLICIES)
+        workers (int, optional): Nombre de processus (1 = sans pool). Par défaut, un par cœur.
+        seed (int): Graine de la première carrière (les suivantes sont seed+1, seed+2...)
+        **options: Options de CareerSimulator (promotion_thresholds, skill_gain)
+
+    Returns:
+        list: Bilans des carrières, dans l'ordre des graines
+    """
+    jobs = [(seed + i, policy, options) for i in range(count)]
+
+    if workers == 1:
+        return [simulate_career(job) for job in jobs]
+
+    with multiprocessing.Pool(workers) as pool:
+        chunksize = max(1, count // ((workers or multiprocessing.cpu_count()) * 4))
+        return pool.map(simulate_career, jobs, chunksize)
+
+def aggregate(results):
+    """
+    Agrège les bilans de carrières
+
+    Args:
+        results (list): Bilans renvoyés par run_careers
+
+    Returns:
+        dict: Statistiques (taux et âges de promotion, titres, gains)
+    """
+    count = len(results)
+    stats = {'careers': count}
+    if not count:
+        return stats
+
+    def distribution(values):
+        values = sorted(values)
+        if not values:
+            return None
+        return {
+            'mean': sum(values) / len(values),
+            'p10': percentile(values, 10),
+            'p50': percentile(values, 50),
+            'p90': percentile(values, 90)
+        }
+
+    for category in ('f2', 'f1'):
+        ages = [r['promotion_ages'][category] for r in results if category in r['promotion_ages']]
+        stats[f'reached_{category}'] = len(ages) / count
+        stats[f'promotion_age_{category}'] = distribution(ages)
+
+    for category in ('f3', 'f2', 'f1'):
+        stats[f'titles_{category}'] = distribution([r['titles'][category] for r in results])
+
+    stats['earnings'] = distribution([r['earnings'] for r in results])
+    stats['wins'] = distribution([r['wins'] for r in results])
+    stats['final_overall'] = distribution([r['final_overall'] for r in results])
+    return stats
+
+def main(argv=None):
+    """Point d'entrée en ligne de commande"""
+    parser = argparse.ArgumentParser(description="Simulation accélérée de carrières")
+    parser.add_argument('--careers', type=int, default=100, help="Nombre de carrières simulées")
+    parser.add_argument('--policy', choices=sorted(POLICIES), default='default', help="Politique du joueur simulé")
+    parser.add_argument('--workers', type=int, default=None, help="Nombre de processus (1 = sans pool)")
+    parser.add_argument('--seed', type=int, default=0, help="Graine de la première carrière")
+    parser.add_argument('--f3-threshold', type=float, default=None, help="Seuil de promotion F3 -> F2")
+    parser.add_argument('--f2-threshold', type=float, default=None, help="Seuil de promotion F2 -> F1")
+    parser.add_argument('--skill-gain', type=float, default=1.0, help="Facteur des gains de compétences")
+    parser.add_argument('--json', dest='json_path', default=None, help="Fichier de sortie des statistiques")
+    parser.add_argument('--profile', action='store_true',
+                        help="Profile un scénario scripté (nouvelle carrière, N courses, fin de saison, sauvegarde)")
+    parser.add_argument('--races', type=int, default=DEFAULT_RACES, help="Nombre de courses du scénario profilé")
+    args = parser.parse_args(argv)
+
+    if args.profile:
+        paths = profile_session(lambda: run_headless_scenario(args.races, args.seed), 'simulator')
+        return 0 if paths else 1
+
+    thresholds = {}
+    if args.f3_threshold is not None:
+        thresholds['f3'] = args.f3_threshold
+    if args.f2_threshold is not None:
+        thresholds['f2'] = args.f2_threshold
+
+    results = run_careers(args.careers, args.policy, args.workers, args.seed,
+                          promotion_thresholds=thresholds, skill_gain=args.skill_gain)
+    stats = aggregate(results)
+
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump(stats, f, indent=2)
+
+    print(json.dumps(stats, indent=2))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
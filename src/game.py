@@ -5,13 +5,30 @@
 Classe principale du jeu qui gère les états du jeu et les transitions
 """
 
+import os
+import random
 import pygame
+import src.ui.main_menu
+import src.ui.race_ui
+import src.ui.career_ui
+import src.ui.standings
+import src.ui.table
+import src.ui.widgets
 from src.ui.main_menu import MainMenu
 from src.ui.race_ui import RaceUI
 from src.ui.career_ui import CareerUI
 from src.player import Player
 from src.career.career_path import CareerPath
-from src.utils.save_load import save_game, load_game
+from src.utils.save_load import SaveWriter, load_game
+from src.utils.journal import CareerJournal, structure_key
+from src.utils.scheduler import FrameScheduler
+from src.utils.profiler import COUNTERS_ENABLED, FrameProfiler, install_counters
+from src.ui.profiler_overlay import ProfilerOverlay
+from src.ui.save_indicator import SaveIndicator
+from src.utils.instrument import timed
+from src.utils.replay import InputRecorder, new_seed, replay_stats
+from src.utils.profiling import temporary_storage
+from src.utils.config import get_config_service
 
 class GameState:
     """Énumération des différents états du jeu"""
@@ -21,20 +38,36 @@ class GameState:
     RESULTS = 3
     QUIT = 4
 
+# Noms des écrans pour le profileur
+SCREEN_NAMES = {
+    GameState.MAIN_MENU: 'menu',
+    GameState.CAREER: 'career',
+    GameState.RACE: 'race',
+    GameState.RESULTS: 'results'
+}
+
 class Game:
     """Classe principale du jeu qui gère les états et la boucle de jeu"""
     
-    def __init__(self, screen, config):
+    def __init__(self, screen, config, count_allocations=COUNTERS_ENABLED):
         """
         Initialisation du jeu
         
         Args:
             screen (pygame.Surface): Surface d'affichage du jeu
             config (dict): Configuration du jeu
+            count_allocations (bool): Compte les rendus de texte et les surfaces des interfaces
         """
         self.screen = screen
         self.config = config
-        self.clock = pygame.time.Clock()
+        self.scheduler = FrameScheduler(
+            fps=config['fps'],
+            update_rate=config['update_rate'],
+            idle_timeout=config['idle_timeout']
+        )
+        
+        # Paramètres de la boucle modifiables en cours de partie (options)
+        get_config_service().subscribe(self._on_config_changed, ('fps', 'update_rate', 'idle_timeout'))
         self.running = True
         self.current_state = GameState.MAIN_MENU
         
@@ -42,6 +75,23 @@ class Game:
         self.player = None
         self.career = None
         
+        # Profileur de frames (F12), allocations des interfaces comptées à la demande
+        self.profiler = FrameProfiler()
+        if count_allocations:
+            install_counters(src.ui.main_menu, src.ui.career_ui, src.ui.race_ui, src.ui.standings, src.ui.table,
+                             src.ui.widgets)
+        self.profiler_overlay = ProfilerOverlay(self.profiler)
+        
+        # Sauvegardes écrites en arrière-plan
+        self.save_writer = SaveWriter()
+        self.save_indicator = SaveIndicator()
+        
+        # Journal des changements entre deux auto-sauvegardes complètes
+        self.journal = CareerJournal()
+        
+        # Enregistrement des entrées (--record)
+        self.recorder = None
+        
         # Interfaces utilisateur
         self.main_menu = MainMenu(self)
         self.race_ui = None
@@ -50,6 +100,22 @@ class Game:
         # Chargement des ressources
         self.load_resources()
     
+    def _on_config_changed(self, key, value):
+        """
+        Applique un paramètre de configuration modifié
+        
+        Args:
+            key (str): Paramètre
+            value: Nouvelle valeur
+        """
+        self.config[key] = value
+        if key == 'fps':
+            self.scheduler.fps = value
+        elif key == 'update_rate':
+            self.scheduler.update_rate = value
+        elif key == 'idle_timeout':
+            self.scheduler.idle_timeout = value
+    
     def load_resources(self):
         """Chargement des ressources (images, sons, etc.)"""
         # À implémenter: chargement des ressources
@@ -59,15 +125,27 @@ class Game:
         """Démarrer une nouvelle partie"""
         self.player = Player("Nouveau Pilote", 16)  # Âge par défaut: 16 ans
         self.career = CareerPath(self.player)
+        self._attach_journal()
         self.career_ui = CareerUI(self, self.player, self.career)
         self.current_state = GameState.CAREER
     
+    def _attach_journal(self):
+        """Branche le journal sur le joueur (la prochaine auto-sauvegarde sera complète)"""
+        self.journal.reset()
+        self.player.journal = self.journal
+    
     def load_game(self):
         """Charger une partie sauvegardée"""
         loaded_data = load_game()
         if loaded_data:
             self.player = loaded_data.get('player')
             self.career = loaded_data.get('career')
+            # Après un chargement, la prochaine auto-sauvegarde est complète:
+            # une ancienne sauvegarde est alors réécrite au format courant
+            # (l'original reste dans les anciennes versions)
+            if loaded_data.get('migrated'):
+                print("Ancienne sauvegarde convertie, elle sera réécrite à la prochaine sauvegarde")
+            self._attach_journal()
             self.career_ui = CareerUI(self, self.player, self.career)
             self.current_state = GameState.CAREER
         else:
@@ -97,22 +175,71 @@ class Game:
         # Retour à l'interface de carrière
         self.current_state = GameState.CAREER
     
-    def save_game(self):
-        """Sauvegarder la partie en cours"""
+    def save_game(self, slot=None, callback=None):
+        """
+        Sauvegarder la partie en cours (écriture en arrière-plan)
+        
+        Entre deux courses, l'auto-save se limite à l'ajout des changements
+        au journal. Une sauvegarde complète (qui vide le journal) est écrite
+        quand le journal devient trop gros ou que la carrière a changé en
+        dehors des opérations journalisées.
+        
+        Args:
+            slot (int, optional): Emplacement de sauvegarde. Si None, utilise l'auto-save.
+            callback (callable, optional): Appelé avec le succès (bool) une fois la sauvegarde écrite
+        """
         save_data = {
             'player': self.player,
             'career': self.career
         }
-        save_game(save_data)
+        
+        def on_saved(success):
+            # Sans base ou journal valide, la prochaine auto-save sera complète
+            if not success and slot is None:
+                self.journal.reset()
+            # Une autre sauvegarde peut encore être en cours
+            if not self.save_writer.busy:
+                self.save_indicator.show_result(success)
+            if callback:
+                callback(success)
+        
+        self.save_indicator.show_saving()
+        
+        if slot is None and self.journal.can_append(self.player, self.career):
+            self.save_writer.submit_journal(self.journal.base_id, self.journal.take_pending(), on_saved)
+            return
+        
+        journal_id = None
+        if slot is None:
+            journal_id = int.from_bytes(os.urandom(8), 'little')
+            self.journal.reset(journal_id, structure_key(self.player, self.career))
+        
+        self.save_writer.submit(save_data, slot, on_saved, journal_id)
     
     def quit_game(self):
         """Quitter le jeu"""
         self.running = False
     
-    def handle_events(self):
-        for event in pygame.event.get():
+    def handle_events(self, events=None):
+        """
+        Traitement des événements
+        
+        Args:
+            events (list, optional): Événements de la frame. Si None, lus dans la file pygame.
+        """
+        if events is None:
+            events = pygame.event.get()
+        
+        if self.recorder is not None:
+            self.recorder.record_events(self.scheduler.frame_index, events)
+        
+        for event in events:
             if event.type == pygame.QUIT:
                 self.quit_game()
+            
+            # Raccourcis du profileur
+            if self.profiler_overlay.handle_event(event):
+                continue
         
         # Touche Échap pour retourner à l'écran précédent
             if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
@@ -131,6 +258,9 @@ class Game:
     
     def update(self):
         """Mise à jour de l'état du jeu"""
+        # Callbacks des sauvegardes terminées
+        self.save_writer.poll()
+        
         if self.current_state == GameState.MAIN_MENU:
             self.main_menu.update()
         elif self.current_state == GameState.CAREER:
@@ -138,6 +268,7 @@ class Game:
         elif self.current_state == GameState.RACE:
             self.race_ui.update()
     
+    @timed('game.render')
     def render(self):
         """Rendu graphique du jeu"""
         self.screen.fill((0, 0, 0))  # Fond noir
@@ -149,12 +280,105 @@ class Game:
         elif self.current_state == GameState.RACE:
             self.race_ui.render(self.screen)
         
+        self.save_indicator.render(self.screen)
+        self.profiler_overlay.render(self.screen)
+    
+    def is_animating(self):
+        """
+        Indique si l'écran actif a besoin d'être redessiné en continu
+        
+        Returns:
+            bool: True pendant une course, False pour les menus et la carrière
+        """
+        return (self.current_state == GameState.RACE
+                or self.profiler_overlay.visible
+                or self.save_indicator.active)
+    
+    def start_recording(self, path):
+        """
+        Enregistre les entrées de la partie pour un rejeu (le générateur
+        aléatoire est initialisé avec une graine conservée dans l'enregistrement)
+        
+        Args:
+            path (str): Chemin de l'enregistrement
+        """
+        seed = new_seed()
+        random.seed(seed)
+        self.recorder = InputRecorder(path, seed, self.screen.get_size())
+    
+    def _run_frame(self, events, steps):
+        """
+        Exécute une frame: événements, pas de simulation, rendu et affichage
+        
+        Args:
+            events (list): Événements de la frame
+            steps (int): Nombre de pas de simulation
+        """
+        self.profiler.begin_frame(SCREEN_NAMES.get(self.current_state, ''))
+        
+        self.profiler.start('events')
+        self.handle_events(events)
+        self.profiler.stop('events')
+        
+        # Simulation à pas fixe, indépendante de la fréquence de rendu
+        self.profiler.start('update')
+        for _ in range(steps):
+            self.update()
+        self.profiler.stop('update')
+        
+        self.profiler.start('render')
+        self.render()
+        self.profiler.stop('render')
+        
+        self.profiler.start('flip')
         pygame.display.flip()
+        self.profiler.stop('flip')
+        
+        self.profiler.end_frame()
     
     def run(self):
         """Boucle principale du jeu"""
         while self.running:
-            self.handle_events()
-            self.update()
-            self.render()
-            self.clock.tick(self.config['fps'])
\ No newline at end of file
+            animating = self.is_animating()
+            events = self.scheduler.poll_events(animating)
+            
+            # L'attente en veille est exclue des mesures du profileur
+            steps = self.scheduler.pending_steps(animating)
+            self._run_frame(events, steps)
+            
+            if self.recorder is not None:
+                self.recorder.record_steps(self.scheduler.frame_index, steps)
+            self.scheduler.end_frame(animating)
+        
+        # Terminer les sauvegardes en cours avant de quitter
+        self.save_writer.close()
+        if self.recorder is not None:
+            self.recorder.close()
+    
+    def replay(self, recording):
+        """
+        Rejoue un enregistrement en lockstep (mêmes événements et mêmes pas
+        de simulation à chaque frame), sans limite de fréquence, en mesurant
+        chaque frame. Les sauvegardes du rejeu sont écrites dans un dossier
+        temporaire.
+        
+        Args:
+            recording (InputRecording): Enregistrement chargé
+        
+        Returns:
+            dict: Temps de mise à jour et de rendu par écran (voir replay_stats)
+        """
+        random.seed(recording.seed)
+        self.profiler = FrameProfiler(history=max(1, len(recording)))
+        self.profiler_overlay.profiler = self.profiler
+        
+        with temporary_storage(prefix="dts_replay_"):
+            for frame_index, steps, events in recording.frames:
+                if not self.running:
+                    break
+                self.scheduler.frame_index = frame_index
+                self._run_frame(events, steps)
+            
+            self.save_writer.close()
+        
+        return replay_stats(self.profiler.frames)
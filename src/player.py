@@ -123,6 +123,9 @@ class Player:
         # Progression de carrière
         self.contract_years = 0  # Années restantes de contrat
         self.contract_value = 0  # Valeur du contrat
+        
+        # Journal des changements pour l'auto-sauvegarde incrémentale (optionnel)
+        self.journal = None
     
     def join_academy(self, academy):
         """
@@ -158,6 +161,11 @@ class Player:
         self.category = new_category
         self.reputation += 10  # Augmentation de la réputation
     
+    def advance_year(self):
+        """Passage à l'année suivante (âge et durée de contrat restante)"""
+        self.age += 1
+        self.contract_years -= 1  # Une année de moins de contrat
+    
     def update_stats(self, race_results):
         """
         Mise à jour des statistiques après une course
@@ -187,5 +195,7 @@ class Player:
         
         # Une année de plus
         if race_results.get('season_end', False):
-            self.age += 1
-            self.contract_years -= 1  # Une année de moins de contrat
\ No newline at end of file
+            self.advance_year()
+        
+        if self.journal is not None:
+            self.journal.record('update_stats', race_results)
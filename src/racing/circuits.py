@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Catalogue des circuits, chargé une seule fois, avec les constantes de
+course précalculées pour chaque circuit
+"""
+
+from collections import namedtuple
+
+# Temps de base d'un tour en course selon la catégorie, sur un circuit de
+# difficulté moyenne (secondes)
+CATEGORY_LAP_TIMES = {
+    'f3': 90.0,
+    'f2': 80.0,
+    'f1': 70.0
+}
+
+# Difficulté du circuit de référence de CATEGORY_LAP_TIMES
+REFERENCE_DIFFICULTY = 5
+
+# Difficulté maximale des circuits de chaque catégorie
+MAX_DIFFICULTY = {
+    'f3': 8,
+    'f2': 8,
+    'f1': 10
+}
+
+# Nom, pays, difficulté (1-10), difficulté de dépassement (1-10), zones DRS, probabilité de pluie (%)
+_CIRCUITS = (
+    ("Circuit de Monaco", "Monaco", 9, 10, 1, 25),
+    ("Silverstone", "Royaume-Uni", 7, 4, 2, 40),
+    ("Spa-Francorchamps", "Belgique", 8, 3, 2, 45),
+    ("Monza", "Italie", 6, 3, 2, 25),
+    ("Suzuka", "Japon", 8, 6, 1, 35),
+    ("Circuit des Amériques", "États-Unis", 7, 4, 2, 20),
+    ("Circuit de Barcelone-Catalogne", "Espagne", 6, 7, 2, 20),
+    ("Red Bull Ring", "Autriche", 5, 3, 3, 35),
+    ("Hungaroring", "Hongrie", 7, 8, 1, 25),
+    ("Circuit Gilles-Villeneuve", "Canada", 6, 4, 3, 30),
+    ("Yas Marina", "Émirats arabes unis", 5, 5, 2, 5),
+    ("Bahrain International Circuit", "Bahreïn", 5, 3, 3, 5),
+    ("Circuit de Djeddah", "Arabie Saoudite", 8, 5, 3, 5),
+    ("Circuit International de Shanghai", "Chine", 6, 4, 2, 35),
+    ("Autodromo Jose Carlos Pace", "Brésil", 7, 3, 2, 40),
+    ("Circuit de Zandvoort", "Pays-Bas", 7, 8, 2, 35),
+    ("Albert Park", "Australie", 6, 5, 4, 30),
+    ("Circuit Paul Ricard", "France", 5, 5, 2, 20),
+    ("Baku City Circuit", "Azerbaïdjan", 8, 3, 2, 10),
+    ("Losail International Circuit", "Qatar", 6, 6, 1, 5),
+    ("Autodromo Enzo e Dino Ferrari", "Italie", 7, 8, 1, 35),
+    ("Circuit de Mexico", "Mexique", 6, 5, 3, 20),
+    ("Marina Bay Street Circuit", "Singapour", 9, 8, 3, 30)
+)
+
+CircuitConstants = namedtuple('CircuitConstants', (
+    'lap_times',              # Temps de base d'un tour en course par catégorie
+    'qualifying_time',        # Temps de base d'un tour de qualification
+    'overtaking_difficulty',  # Difficulté de dépassement (1-10)
+    'drs_zones',              # Nombre de zones DRS
+    'rain_chance'             # Probabilité de pluie (%)
+))
+
+def _qualifying_time(difficulty):
+    """Temps de base d'un tour de qualification selon la difficulté du circuit"""
+    return 60 + difficulty * 2
+
+def _compute_constants(difficulty, overtaking_difficulty=5, drs_zones=2, rain_chance=30):
+    """Constantes de course d'un circuit"""
+    # Les temps de course suivent le même rapport à la difficulté que les qualifications
+    qualifying_time = _qualifying_time(difficulty)
+    scale = qualifying_time / _qualifying_time(REFERENCE_DIFFICULTY)
+    return CircuitConstants(
+        {category: round(lap_time * scale, 3) for category, lap_time in CATEGORY_LAP_TIMES.items()},
+        qualifying_time,
+        overtaking_difficulty,
+        drs_zones,
+        rain_chance
+    )
+
+# Circuits au format des saisons (nom, pays, difficulté)
+CIRCUITS = tuple(
+    {"name": name, "country": country, "difficulty": difficulty}
+    for name, country, difficulty, _, _, _ in _CIRCUITS
+)
+
+# Index: nom -> constantes, difficulté -> circuits, catégorie -> circuits éligibles
+CONSTANTS_BY_NAME = {
+    name: _compute_constants(difficulty, overtaking, drs_zones, rain_chance)
+    for name, _, difficulty, overtaking, drs_zones, rain_chance in _CIRCUITS
+}
+
+CIRCUITS_BY_DIFFICULTY = {
+    difficulty: tuple(circuit for circuit in CIRCUITS if circuit["difficulty"] == difficulty)
+    for difficulty in sorted({circuit["difficulty"] for circuit in CIRCUITS})
+}
+
+CIRCUITS_BY_CATEGORY = {
+    category: tuple(circuit for circuit in CIRCUITS if circuit["difficulty"] <= max_difficulty)
+    for category, max_difficulty in MAX_DIFFICULTY.items()
+}
+
+def circuits_for(category):
+    """
+    Circuits éligibles pour une catégorie
+
+    Args:
+        category (str): Catégorie ('f3', 'f2', 'f1')
+
+    Returns:
+        tuple: Circuits de la catégorie
+    """
+    return CIRCUITS_BY_CATEGORY.get(category, CIRCUITS)
+
+def circuits_with_difficulty(difficulty):
+    """
+    Circuits d'une difficulté donnée
+
+    Args:
+        difficulty (int): Difficulté (1-10)
+
+    Returns:
+        list: Circuits correspondants
+    """
+    return list(CIRCUITS_BY_DIFFICULTY.get(difficulty, ()))
+
+def get_constants(circuit):
+    """
+    Constantes de course d'un circuit (calculées à partir de la difficulté
+    pour un circuit absent du catalogue)
+
+    Args:
+        circuit (dict): Circuit (name, country, difficulty)
+
+    Returns:
+        CircuitConstants: Constantes du circuit
+    """
+    constants = CONSTANTS_BY_NAME.get(circuit.get('name'))
+    if constants is None:
+        constants = _compute_constants(circuit.get('difficulty', 5))
+    return constants
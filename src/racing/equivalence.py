@@ -0,0 +1,385 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Banc d'équivalence statistique entre le moteur de course de référence
+(Race.simulate_race) et un moteur candidat plus rapide
+
+Les deux moteurs disputent les mêmes courses (mêmes graines, plateaux,
+circuits et météo) pour chaque catégorie et chaque météo. Les distributions
+obtenues sont comparées par des tests à deux échantillons:
+- positions d'arrivée: gain de places (arrivée - grille) et grille du
+  vainqueur, test du khi-deux;
+- écarts: écart du deuxième et du dernier au vainqueur, test de
+  Kolmogorov-Smirnov;
+- dépassements: places gagnées par pilote et par tour, et proportion de
+  pilotes terminant devant leur place sur la grille, tests z de deux
+  proportions.
+
+Un moteur candidat qui ne passe pas par Race._update_position indique ses
+dépassements dans results['overtakes'].
+
+Utilisation:
+    python -m src.racing.equivalence --candidate mon_module:simulate --races 300
+"""
+
+import sys
+import json
+import random
+import argparse
+import importlib
+from collections import Counter
+from src.player import Player
+from src.racing.race import Race
+from src.racing.circuits import circuits_for
+from src.career.academy import create_all_academies
+from src.career.drivers import CATEGORIES, DriverRegistry
+from src.utils.stats import ks_two_sample, chi_square_two_sample, two_proportion_test
+
+# Météo imposée aux courses du banc (condition, intensité de la pluie)
+WEATHERS = {
+    'Sec': 0,
+    'Pluie légère': 2,
+    'Pluie forte': 7
+}
+
+# Effectif minimal d'une classe des tests du khi-deux (les classes rares sont regroupées)
+MIN_BIN_COUNT = 10
+
+# Seuil global des tests (corrigé par Bonferroni sur l'ensemble des tests)
+DEFAULT_ALPHA = 0.01
+
+# Décalage des graines du moteur candidat pour l'auto-contrôle (tirages indépendants)
+SELF_CHECK_SEED_OFFSET = 1000003
+
+
+def reference_engine(race):
+    """Moteur de référence: simulation complète en Python"""
+    return race.simulate_race()
+
+
+def build_race(category, weather, index, seed):
+    """
+    Course du banc, identique pour les deux moteurs
+
+    Args:
+        category (str): Catégorie ('f3', 'f2', 'f1')
+        weather (str): Condition météo imposée (clé de WEATHERS)
+        index (int): Numéro de la course (choix du circuit)
+        seed (int): Graine du plateau et de la course
+
+    Returns:
+        Race: Course prête à être simulée
+    """
+    random.seed(seed)
+    team_registry = create_all_academies()
+    teams = team_registry.in_category(category)
+    player = Player("Pilote du banc", 20)
+    player.sign_contract(teams[0], 1, 0)
+
+    drivers = {
+        "player": {
+            "name": player.name,
+            "team": player.team.name,
+            "skills": player.skills.overall,
+            "is_player": True
+        }
+    }
+    drivers.update(DriverRegistry().field(category, teams, player.team.name))
+
+    circuits = circuits_for(category)
+    race = Race(f"Banc {index + 1}", circuits[index % len(circuits)], category, drivers, player, team_registry)
+
+    # Météo imposée (les actions disponibles dépendent de la pluie)
+    race.weather = {'condition': weather, 'rain': WEATHERS[weather], 'temperature': 20}
+    race.available_events = race._generate_events()
+    return race
+
+
+def count_overtakes(race):
+    """
+    Compte les dépassements (places gagnées) d'une course en enveloppant
+    Race._update_position sur l'instance
+
+    Args:
+        race (Race): Course
+
+    Returns:
+        list: Compteur (un élément) mis à jour pendant la simulation
+    """
+    counter = [0]
+    update_position = race._update_position
+
+    def counting_update_position(driver_id, delta):
+        before = race.positions.get(driver_id, 0)
+        update_position(driver_id, delta)
+        counter[0] += max(0, before - race.positions.get(driver_id, 0))
+
+    race._update_position = counting_update_position
+    return counter
+
+
+def race_sample(results, overtakes, laps):
+    """
+    Mesures d'une course comparées entre les moteurs
+
+    Args:
+        results (dict): Résultats renvoyés par le moteur
+        overtakes (int): Dépassements comptés pendant la simulation
+        laps (int): Nombre de tours
+
+    Returns:
+        dict: Gains de places, grille du vainqueur, écarts, dépassements
+    """
+    record = results['record']
+    grid = {driver_id: position for position, driver_id in enumerate(record.grid, 1)}
+    changes = [position - grid[driver_id] for position, driver_id in enumerate(record.order, 1) if driver_id in grid]
+    return {
+        'position_change': changes,
+        'winner_grid': grid.get(record.order[0], 0),
+        'gap_p2': record.gaps[1] if len(record.gaps) > 1 else 0.0,
+        'gap_last': record.gaps[-1] if record.gaps else 0.0,
+        'gained': sum(1 for change in changes if change < 0),
+        'drivers': len(changes),
+        'overtakes': results.get('overtakes', overtakes),
+        'driver_laps': len(changes) * laps
+    }
+
+
+def _pooled_counts(counts_a, counts_b, min_count=MIN_BIN_COUNT):
+    """
+    Regroupe les classes consécutives trop rares pour le test du khi-deux
+
+    Args:
+        counts_a (Counter): Effectifs du premier échantillon par valeur
+        counts_b (Counter): Effectifs du second échantillon par valeur
+        min_count (int): Effectif total minimal d'une classe
+
+    Returns:
+        tuple: (effectifs regroupés du premier échantillon, du second)
+    """
+    pooled_a, pooled_b = {}, {}
+    bin_index = 0
+    total = 0
+    for value in sorted(set(counts_a) | set(counts_b)):
+        pooled_a[bin_index] = pooled_a.get(bin_index, 0) + counts_a.get(value, 0)
+        pooled_b[bin_index] = pooled_b.get(bin_index, 0) + counts_b.get(value, 0)
+        total += counts_a.get(value, 0) + counts_b.get(value, 0)
+        if total >= min_count:
+            bin_index += 1
+            total = 0
+
+    # La dernière classe incomplète rejoint la précédente
+    if total and bin_index > 0:
+        pooled_a[bin_index - 1] += pooled_a.pop(bin_index)
+        pooled_b[bin_index - 1] += pooled_b.pop(bin_index)
+    return pooled_a, pooled_b
+
+
+def compare_samples(reference, candidate):
+    """
+    Tests à deux échantillons entre les mesures des deux moteurs
+
+    Args:
+        reference (list): Mesures (race_sample) du moteur de référence
+        candidate (list): Mesures du moteur candidat
+
+    Returns:
+        list: Tests (métrique, test, statistique, p-valeur, valeurs moyennes)
+    """
+    tests = []
+
+    for metric in ('position_change', 'winner_grid'):
+        if metric == 'position_change':
+            values_a = [v for sample in reference for v in sample[metric]]
+            values_b = [v for sample in candidate for v in sample[metric]]
+        else:
+            values_a = [sample[metric] for sample in reference]
+            values_b = [sample[metric] for sample in candidate]
+        counts_a, counts_b = _pooled_counts(Counter(values_a), Counter(values_b))
+        statistic, _, p_value = chi_square_two_sample(counts_a, counts_b)
+        tests.append({
+            'metric': metric,
+            'test': 'khi-deux',
+            'statistic': statistic,
+            'p_value': p_value,
+            'reference': sum(values_a) / len(values_a) if values_a else 0.0,
+            'candidate': sum(values_b) / len(values_b) if values_b else 0.0
+        })
+
+    for metric in ('gap_p2', 'gap_last'):
+        values_a = [sample[metric] for sample in reference]
+        values_b = [sample[metric] for sample in candidate]
+        statistic, p_value = ks_two_sample(values_a, values_b)
+        tests.append({
+            'metric': metric,
+            'test': 'kolmogorov-smirnov',
+            'statistic': statistic,
+            'p_value': p_value,
+            'reference': sum(values_a) / len(values_a) if values_a else 0.0,
+            'candidate': sum(values_b) / len(values_b) if values_b else 0.0
+        })
+
+    for metric, successes, trials in (('overtake_rate', 'overtakes', 'driver_laps'),
+                                      ('gain_rate', 'gained', 'drivers')):
+        successes_a = sum(sample[successes] for sample in reference)
+        trials_a = sum(sample[trials] for sample in reference)
+        successes_b = sum(sample[successes] for sample in candidate)
+        trials_b = sum(sample[trials] for sample in candidate)
+        statistic, p_value = two_proportion_test(successes_a, trials_a, successes_b, trials_b)
+        tests.append({
+            'metric': metric,
+            'test': 'deux proportions',
+            'statistic': statistic,
+            'p_value': p_value,
+            'reference': successes_a / trials_a if trials_a else 0.0,
+            'candidate': successes_b / trials_b if trials_b else 0.0
+        })
+    return tests
+
+
+class EquivalenceHarness:
+    """Compare un moteur candidat au moteur de référence"""
+
+    def __init__(self, candidate, reference=reference_engine, races=200, categories=CATEGORIES,
+                 weathers=tuple(WEATHERS), alpha=DEFAULT_ALPHA, seed=0, candidate_seed_offset=0):
+        """
+        Initialisation du banc
+
+        Args:
+            candidate (callable): Moteur candidat, appelé avec une Race et renvoyant
+                                  des résultats au format de Race.simulate_race
+            reference (callable): Moteur de référence
+            races (int): Courses par catégorie et par météo
+            categories (tuple): Catégories testées
+            weathers (tuple): Météos testées (clés de WEATHERS)
+            alpha (float): Seuil global des tests
+            seed (int): Graine de la première course
+            candidate_seed_offset (int): Décalage des graines de simulation du candidat
+                                         (les plateaux, circuits et météos restent identiques)
+        """
+        self.candidate = candidate
+        self.reference = reference
+        self.races = races
+        self.categories = categories
+        self.weathers = weathers
+        self.alpha = alpha
+        self.seed = seed
+        self.candidate_seed_offset = candidate_seed_offset
+
+    def _run_engine(self, engine, category, weather, seed_offset=0):
+        """Mesures d'un moteur sur toutes les courses d'une catégorie et d'une météo"""
+        samples = []
+        for i in range(self.races):
+            seed = self.seed + i
+            race = build_race(category, weather, i, seed)
+            overtakes = count_overtakes(race)
+            random.seed(seed + seed_offset)
+            samples.append(race_sample(engine(race), overtakes[0], race.total_laps))
+        return samples
+
+    def run(self):
+        """
+        Exécute le banc
+
+        Returns:
+            dict: Tests par catégorie et météo, seuil corrigé et divergences
+        """
+        groups = []
+        for category in self.categories:
+            for weather in self.weathers:
+                reference = self._run_engine(self.reference, category, weather)
+                candidate = self._run_engine(self.candidate, category, weather, self.candidate_seed_offset)
+                groups.append({
+                    'category': category,
+                    'weather': weather,
+                    'tests': compare_samples(reference, candidate)
+                })
+
+        test_count = sum(len(group['tests']) for group in groups)
+        threshold = self.alpha / test_count if test_count else self.alpha
+        divergences = []
+        for group in groups:
+            for test in group['tests']:
+                test['diverges'] = test['p_value'] < threshold
+                if test['diverges']:
+                    divergences.append(f"{group['category']} / {group['weather']} / {test['metric']}")
+
+        return {
+            'races': self.races,
+            'alpha': self.alpha,
+            'threshold': threshold,
+            'groups': groups,
+            'divergences': divergences,
+            'equivalent': not divergences
+        }
+
+
+def format_report(report):
+    """
+    Rapport texte du banc
+
+    Args:
+        report (dict): Rapport renvoyé par EquivalenceHarness.run
+
+    Returns:
+        str: Rapport
+    """
+    lines = [f"Banc d'équivalence: {report['races']} courses par groupe, "
+             f"seuil {report['alpha']} (corrigé: {report['threshold']:.2e})"]
+    for group in report['groups']:
+        lines.append(f"{group['category'].upper()} - {group['weather']}")
+        for test in group['tests']:
+            flag = "DIVERGENCE" if test['diverges'] else "ok"
+            lines.append(f"    {test['metric']:<16} {test['test']:<19} stat={test['statistic']:8.3f} "
+                         f"p={test['p_value']:.4f}  réf={test['reference']:.3f} cand={test['candidate']:.3f}  {flag}")
+    lines.append("Moteurs équivalents" if report['equivalent']
+                 else f"Divergences: {', '.join(report['divergences'])}")
+    return "\n".join(lines)
+
+
+def load_engine(spec):
+    """
+    Charge un moteur à partir de son chemin "module:fonction"
+
+    Args:
+        spec (str): Chemin du moteur
+
+    Returns:
+        callable: Moteur
+    """
+    module_name, _, function_name = spec.partition(':')
+    return getattr(importlib.import_module(module_name), function_name or 'simulate_race')
+
+
+def main(argv=None):
+    """Point d'entrée en ligne de commande"""
+    parser = argparse.ArgumentParser(description="Équivalence statistique des moteurs de course")
+    parser.add_argument('--candidate', default=None,
+                        help="Moteur candidat (module:fonction). Par défaut, auto-contrôle: le moteur de "
+                             "référence avec d'autres tirages, qui ne doit signaler aucune divergence.")
+    parser.add_argument('--races', type=int, default=200, help="Courses par catégorie et par météo")
+    parser.add_argument('--categories', nargs='+', choices=CATEGORIES, default=list(CATEGORIES))
+    parser.add_argument('--alpha', type=float, default=DEFAULT_ALPHA, help="Seuil global des tests")
+    parser.add_argument('--seed', type=int, default=0, help="Graine de la première course")
+    parser.add_argument('--json', dest='json_path', default=None, help="Fichier de sortie du rapport")
+    args = parser.parse_args(argv)
+
+    if args.candidate:
+        candidate, offset = load_engine(args.candidate), 0
+    else:
+        candidate, offset = reference_engine, SELF_CHECK_SEED_OFFSET
+
+    harness = EquivalenceHarness(candidate, races=args.races, categories=tuple(args.categories),
+                                 alpha=args.alpha, seed=args.seed, candidate_seed_offset=offset)
+    report = harness.run()
+
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+    print(format_report(report))
+    return 0 if report['equivalent'] else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
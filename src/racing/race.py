@@ -6,12 +6,19 @@ Classe gérant une course individuelle et ses événements
 """
 
 import random
+from src.career.academy import TeamRegistry
 from src.racing.event import RaceEvent
+from src.racing.circuits import get_constants
+from src.racing.results import RaceRecord
+from src.utils.instrument import timed, counted, count
+
+# Système de points par défaut (F1)
+DEFAULT_POINTS_SYSTEM = [25, 18, 15, 12, 10, 8, 6, 4, 2, 1]
 
 class Race:
     """Classe représentant une course de Formule"""
     
-    def __init__(self, name, circuit, category, drivers, player):
+    def __init__(self, name, circuit, category, drivers, player, teams=None, points_system=None):
         """
         Initialisation d'une course
         
@@ -21,6 +28,8 @@ class Race:
             category (str): Catégorie ('f3', 'f2', 'f1')
             drivers (dict): Dictionnaire des pilotes
             player (Player): Joueur/pilote
+            teams (TeamRegistry, optional): Registre des équipes (par défaut, seulement celle du joueur)
+            points_system (list, optional): Points attribués par position (par défaut, système F1)
         """
         self.name = name
         self.circuit = circuit
@@ -28,6 +37,21 @@ class Race:
         self.drivers = drivers
         self.player = player
         
+        self.points_system = points_system or DEFAULT_POINTS_SYSTEM
+        
+        # Registre des équipes (voitures des pilotes)
+        self.teams = teams if teams is not None else TeamRegistry.from_teams([player.team])
+        
+        # Constantes du circuit (temps de base, dépassements, pluie)
+        constants = get_constants(circuit)
+        self.base_lap_time = constants.lap_times.get(category, 90.0)
+        self.qualifying_base_time = constants.qualifying_time
+        self.rain_chance = constants.rain_chance
+        self.drs = constants.drs_zones > 0
+        
+        # Modificateur des chances de dépassement: circuits étroits pénalisés, zones DRS favorables
+        self.overtake_modifier = (5 - constants.overtaking_difficulty) * 2 + constants.drs_zones
+        
         # Définir le nombre total de tours selon la catégorie
         self.total_laps = {
             'f3': 15,
@@ -51,6 +75,9 @@ class Race:
         # Temps de course cumulés pour calculer les écarts
         self.race_times = {driver_id: 0.0 for driver_id in self.drivers}
         
+        # Meilleur tour en course: (pilote, tour, temps)
+        self.fastest_lap = None
+        
         # Événements de course disponibles
         self.available_events = self._generate_events()
         
@@ -110,22 +137,23 @@ class Race:
         Returns:
             dict: Conditions météo
         """
-        # Probabilité de pluie (0-100)
-        rain_chance = random.randint(0, 100)
+        # Tirage (0-100) comparé à la probabilité de pluie du circuit
+        roll = random.randint(0, 100)
+        dry_limit = 100 - self.rain_chance
         
-        if rain_chance < 70:  # 70% de chance de temps sec
+        if roll < dry_limit:  # Temps sec
             return {
                 'condition': 'Sec',
                 'rain': 0,
                 'temperature': random.randint(15, 35)  # Température en °C
             }
-        elif rain_chance < 90:  # 20% de chance de pluie légère
+        elif roll < dry_limit + self.rain_chance * 2 // 3:  # Pluie légère (deux tiers des courses pluvieuses)
             return {
                 'condition': 'Pluie légère',
                 'rain': random.randint(1, 3),  # Intensité de la pluie (1-10)
                 'temperature': random.randint(10, 25)
             }
-        else:  # 10% de chance de pluie forte
+        else:  # Pluie forte (dernier tiers)
             return {
                 'condition': 'Pluie forte',
                 'rain': random.randint(4, 10),
@@ -160,12 +188,8 @@ class Race:
         """
         Met à jour les temps de course des pilotes
         """
-        # Temps de base pour un tour (60-120 secondes selon la catégorie)
-        base_lap_time = {
-            'f3': 90.0,
-            'f2': 80.0,
-            'f1': 70.0
-        }.get(self.category, 90.0)
+        # Temps de base pour un tour (précalculé selon le circuit et la catégorie)
+        base_lap_time = self.base_lap_time
         
         # Pour chaque pilote
         for driver_id in self.drivers:
@@ -204,6 +228,10 @@ class Race:
             
             # Ajouter au temps total
             self.race_times[driver_id] += final_lap_time
+            
+            # Meilleur tour
+            if self.fastest_lap is None or final_lap_time < self.fastest_lap[2]:
+                self.fastest_lap = (driver_id, self.current_lap, final_lap_time)
     
     def run_qualifying(self):
         """
@@ -217,14 +245,13 @@ class Race:
         # Pour chaque pilote, générer un temps de qualification
         for driver_id, driver_info in self.drivers.items():
             # Base de temps (en secondes) selon le circuit
-            base_time = 60 + (self.circuit['difficulty'] * 2)
+            base_time = self.qualifying_base_time
             
             # Facteur de compétence
             skill_factor = 1.0 - (driver_info['skills'] / 200)  # 0.5 à 0.95
             
             # Facteur équipe (voiture)
-            team_name = driver_info['team']
-            team = next((t for t in [self.player.team] if t.name == team_name), None)
+            team = self.teams.get(self.category, driver_info['team'])
             car_factor = 1.0
             if team:
                 car_factor = 1.0 - (team.performance / 200)  # 0.5 à 0.95
@@ -341,6 +368,8 @@ class Race:
         
         return actions
     
+    @timed('race.execute_player_action')
+    @counted('race.player_actions')
     def execute_player_action(self, action_id):
         """
         Exécute une action du joueur
@@ -380,6 +409,8 @@ class Race:
         
         # Ajuster les chances de réussite
         adjusted_chance = base_success_chance + (player_skill - 50) / 5
+        if action_id.startswith("overtake") or action_id == "wet_overtake":
+            adjusted_chance += self.overtake_modifier
         adjusted_chance = max(10, min(95, adjusted_chance))  # Limiter entre 10% et 95%
         
         # Déterminer si l'action est réussie
@@ -592,6 +623,7 @@ class Race:
         
         return result
     
+    @timed('race.update_position')
     def _update_position(self, driver_id, delta):
         """
         Met à jour la position d'un pilote
@@ -607,6 +639,9 @@ class Race:
         if new_position == current_position:
             return
         
+        if delta < 0:
+            count('race.overtakes', current_position - new_position)
+        
         # Mettre à jour les positions des autres pilotes concernés
         if delta < 0:  # Gagner des positions
             for other_id, pos in self.positions.items():
@@ -620,6 +655,7 @@ class Race:
         # Mettre à jour la position du pilote
         self.positions[driver_id] = new_position
     
+    @timed('race.advance_lap')
     def advance_lap(self):
         """
         Avance d'un tour et simule les actions des IA
@@ -664,6 +700,7 @@ class Race:
             'weather': self.weather
         }
     
+    @timed('race.simulate_ai_actions')
     def _simulate_ai_actions(self):
         """Simule les actions des pilotes IA pendant un tour"""
         # Pour chaque pilote IA, simuler une action
@@ -747,24 +784,28 @@ class Race:
         # Calculer les écarts de temps finaux
         final_time_gaps = self._calculate_time_gaps()
         
-        # Préparer les résultats
+        # Préparer les résultats (copies: la course peut encore être consultée par l'interface)
         results = {
             'name': self.name,
             'circuit': self.circuit['name'],
             'is_finished': True,
-            'positions': self.positions,
-            'qualifying': self.qualifying_results,
+            'positions': dict(self.positions),
+            'qualifying': dict(self.qualifying_results),
             'player_position': self.positions.get('player', 0),
             'player_qualifying': self.qualifying_results.get('player', 0),
             'events': self.event_history,
             'weather': self.weather,
             'time_gaps': final_time_gaps,
-            'car_status': self.car_status
+            'car_status': self.car_status,
+            'fastest_lap': self.fastest_lap
         }
         
+        # Résultat complet et immuable de la course (ordre, points, écarts, grille)
+        results['record'] = RaceRecord.from_results(0, results, self.points_system)
+        
         # Calculer les points pour le joueur
         player_position = results['player_position']
-        points_system = [25, 18, 15, 12, 10, 8, 6, 4, 2, 1]  # Système de points F1 standard
+        points_system = self.points_system
         
         if player_position <= len(points_system):
             results['points'] = points_system[player_position - 1]
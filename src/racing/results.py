@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Enregistrements compacts et immuables des courses et saisons terminées
+"""
+
+from collections import namedtuple
+
+_RaceRecord = namedtuple('RaceRecord', (
+    'round',          # Numéro de la course dans le calendrier
+    'name',           # Nom du Grand Prix
+    'circuit',        # Nom du circuit
+    'order',          # Identifiants des pilotes dans l'ordre d'arrivée
+    'grid',           # Identifiants des pilotes dans l'ordre de la grille
+    'points',         # Points marqués, alignés sur order
+    'fastest_lap',    # (pilote, tour, temps) ou None
+    'player_events',  # Actions du joueur: (tour, action, réussite, places gagnées)
+    'weather',        # Conditions météo
+    'gaps'            # Écarts au vainqueur (secondes), alignés sur order
+))
+
+def _ordered_gaps(time_gaps, order):
+    """Écarts au vainqueur dans l'ordre d'arrivée (jamais inférieurs à celui du pilote précédent)"""
+    gaps = []
+    previous = 0.0
+    for driver_id in order:
+        previous = max(previous, float(time_gaps.get(driver_id, 0.0)))
+        gaps.append(previous)
+    return tuple(gaps)
+
+class RaceRecord(_RaceRecord):
+    """Résultat d'une course terminée"""
+
+    __slots__ = ()
+
+    @classmethod
+    def from_results(cls, race_round, results, points_system):
+        """
+        Construit l'enregistrement à partir des résultats d'une course
+
+        Args:
+            race_round (int): Numéro de la course dans le calendrier
+            results (dict): Résultats renvoyés par Race.get_race_results
+            points_system (list): Points attribués par position
+
+        Returns:
+            RaceRecord: Enregistrement compact
+        """
+        positions = results.get('positions', {})
+        qualifying = results.get('qualifying', {})
+        time_gaps = results.get('time_gaps', {})
+        order = tuple(sorted(positions, key=positions.get))
+
+        return cls(
+            race_round,
+            results.get('name', ''),
+            results.get('circuit', ''),
+            order,
+            tuple(sorted(qualifying, key=qualifying.get)),
+            tuple(points_system[i] if i < len(points_system) else 0 for i in range(len(order))),
+            tuple(results['fastest_lap']) if results.get('fastest_lap') else None,
+            tuple(
+                (event['lap'], event['action'], event['success'], event['position_change'])
+                for event in results.get('events', ())
+            ),
+            (results.get('weather') or {}).get('condition', ''),
+            _ordered_gaps(time_gaps, order)
+        )
+
+    @classmethod
+    def from_state(cls, values):
+        """
+        Reconstruit l'enregistrement à partir de valeurs sérialisées (listes)
+
+        Args:
+            values (list): Champs dans l'ordre de RaceRecord
+
+        Returns:
+            RaceRecord: Enregistrement
+        """
+        race_round, name, circuit, order, grid, points, fastest_lap, player_events, weather, gaps = values
+        return cls(
+            race_round, name, circuit, tuple(order), tuple(grid), tuple(points),
+            tuple(fastest_lap) if fastest_lap else None,
+            tuple(tuple(event) for event in player_events),
+            weather, tuple(gaps)
+        )
+
+    def position_of(self, driver_id):
+        """
+        Position d'arrivée d'un pilote
+
+        Args:
+            driver_id (str): Identifiant du pilote
+
+        Returns:
+            int: Position (1 = vainqueur), 0 si le pilote n'a pas couru
+        """
+        try:
+            return self.order.index(driver_id) + 1
+        except ValueError:
+            return 0
+
+    def grid_position_of(self, driver_id):
+        """
+        Position de départ d'un pilote
+
+        Args:
+            driver_id (str): Identifiant du pilote
+
+        Returns:
+            int: Position sur la grille, 0 si inconnue
+        """
+        try:
+            return self.grid.index(driver_id) + 1
+        except ValueError:
+            return 0
+
+    @property
+    def winner(self):
+        """Identifiant du vainqueur"""
+        return self.order[0] if self.order else None
+
+
+SeasonSummary = namedtuple('SeasonSummary', (
+    'year',
+    'category',
+    'driver_standings',  # (nom, équipe, points) par position
+    'team_standings',    # (équipe, points) par position
+    'player_position',
+    'player_points',
+    'champion',
+    'team_champion'
+))
@@ -7,7 +7,14 @@ Interface utilisateur pour la gestion de la carrière
 
 import pygame
 from pygame import font, draw, Rect, Surface
-from src.ui.main_menu import Button
+from src.ui.fonts import get_font
+from src.ui.widgets import Button, WidgetGroup
+from src.utils.instrument import timed
+
+# Taille minimale du panneau des saisons passées (écran des statistiques)
+HISTORY_MIN_WIDTH = 260
+HISTORY_MIN_HEIGHT = 100
+HISTORY_ROW_HEIGHT = 23
 
 class AcademySelection:
     """Interface de sélection d'académie"""
@@ -25,7 +32,7 @@ class AcademySelection:
         self.selected_academy = None
         
         # Créer les boutons pour chaque académie
-        self.academy_buttons = []
+        self.academy_buttons = WidgetGroup()
         self._create_academy_buttons()
     
     def _create_academy_buttons(self):
@@ -68,7 +75,7 @@ class AcademySelection:
                 hover_color=hover_color
             )
             
-            self.academy_buttons.append(button)
+            self.academy_buttons.add(button)
     
     def select_academy(self, academy):
         """
@@ -87,11 +94,9 @@ class AcademySelection:
         Args:
             event (pygame.event.Event): Événement à gérer
         """
-        for button in self.academy_buttons:
-            if button.handle_event(event):
-                return True
-        return False
+        return self.academy_buttons.handle_event(event)
     
+    @timed('ui.academy_selection.render')
     def render(self, surface):
         """
         Dessine l'interface sur une surface
@@ -115,46 +120,8 @@ class AcademySelection:
         surface.blit(info_text, info_rect)
         
         # Boutons des académies
-        for button in self.academy_buttons:
-            button.draw(surface)
-
+        self.academy_buttons.draw(surface)
 
-# Modifiez la méthode handle_event dans la classe CareerUI
-def handle_event(self, event):
-    """
-    Gère les événements de l'interface
-    
-    Args:
-        event (pygame.event.Event): Événement à gérer
-    """
-    if self.current_state == self.STATES['select_academy']:
-        if self.academy_selection:
-            self.academy_selection.handle_event(event)
-    elif self.current_state == self.STATES['race_selection']:
-        # Gérer le bouton retour
-        if hasattr(self, 'back_button'):
-            if self.back_button.handle_event(event):
-                return True
-        
-        # Gérer les boutons de course
-        for button in self.race_buttons:
-            if button.handle_event(event):
-                break
-    elif self.current_state == self.STATES['season_overview']:
-        # Gérer les boutons d'action
-        for button in self.action_buttons:
-            if button.handle_event(event):
-                break
-    elif self.current_state == self.STATES['end_season']:
-        # Bouton continuer
-        for button in self.action_buttons:
-            if button.handle_event(event):
-                break
-    elif self.current_state == self.STATES['stats']:
-        # Gérer le bouton retour si présent
-        if hasattr(self, 'back_button'):
-            if self.back_button.handle_event(event):
-                return True
 
 class CareerUI:
     """Interface principale de gestion de carrière"""
@@ -178,9 +145,9 @@ class CareerUI:
         
         # Charger les polices
         font.init()
-        self.title_font = font.SysFont('Arial', 36, bold=True)
-        self.info_font = font.SysFont('Arial', 24)
-        self.status_font = font.SysFont('Arial', 18)
+        self.title_font = get_font('Arial', 36, bold=True)
+        self.info_font = get_font('Arial', 24)
+        self.status_font = get_font('Arial', 18)
         
         # Couleurs
         self.colors = {
@@ -212,10 +179,25 @@ class CareerUI:
         self.academy_selection = None
         
         # Boutons d'action
-        self.action_buttons = []
+        self.action_buttons = WidgetGroup()
         
         # Boutons pour les courses
-        self.race_buttons = []
+        self.race_buttons = WidgetGroup()
+        
+        # Bouton de retour (sélection de course et statistiques)
+        self.back_button = Button(
+            "RETOUR",
+            20,
+            self.screen_height - 70,
+            120,
+            50,
+            action=lambda: setattr(self, 'current_state', self.STATES['season_overview']),
+            bg_color=self.colors['warning'],
+            hover_color=(250, 80, 80)
+        )
+        
+        # Saisons passées affichées dans les statistiques
+        self.season_history = []
         
         # Initialisation
         self._init_ui()
@@ -245,7 +227,7 @@ class CareerUI:
     
     def _update_race_buttons(self):
         """Met à jour les boutons de course selon le calendrier actuel"""
-        self.race_buttons = []
+        self.race_buttons.clear()
         
         if not self.career.current_season:
             return
@@ -291,7 +273,7 @@ class CareerUI:
                 hover_color=self.colors['button_hover']
             )
             
-            self.race_buttons.append(button)
+            self.race_buttons.add(button)
     
     def start_race(self, race_index):
         """
@@ -317,19 +299,15 @@ class CareerUI:
         if self.current_state == self.STATES['select_academy']:
             self.academy_selection.handle_event(event)
         elif self.current_state == self.STATES['race_selection']:
-            for button in self.race_buttons:
-                if button.handle_event(event):
-                    break
-        elif self.current_state == self.STATES['season_overview']:
+            # Gérer le bouton retour puis les boutons de course
+            if not self.back_button.handle_event(event):
+                self.race_buttons.handle_event(event)
+        elif self.current_state == self.STATES['stats']:
+            self.back_button.handle_event(event)
+        elif self.current_state in (self.STATES['season_overview'], self.STATES['end_season'],
+                                    self.STATES['promotion'], self.STATES['contract_negotiation']):
             # Gérer les boutons d'action
-            for button in self.action_buttons:
-                if button.handle_event(event):
-                    break
-        elif self.current_state == self.STATES['end_season']:
-            # Bouton continuer
-            for button in self.action_buttons:
-                if button.handle_event(event):
-                    break
+            self.action_buttons.handle_event(event)
     
     def update(self):
         """Met à jour l'état de l'interface"""
@@ -355,7 +333,7 @@ class CareerUI:
         button_y = self.screen_height - 100
         
         # Vider les boutons existants
-        self.action_buttons = []
+        self.action_buttons.clear()
         
         # Ajouter le bouton pour continuer
         continue_button = Button(
@@ -369,7 +347,7 @@ class CareerUI:
             hover_color=(80, 210, 80)
         )
         
-        self.action_buttons.append(continue_button)
+        self.action_buttons.add(continue_button)
     
     def _handle_season_end(self):
         """Gère la fin de saison et la progression de carrière"""
@@ -390,7 +368,7 @@ class CareerUI:
     def _show_promotion_screen(self):
         """Affiche l'écran de promotion"""
         # Vider les boutons existants
-        self.action_buttons = []
+        self.action_buttons.clear()
         
         # Position et dimensions des boutons
         button_width = 300
@@ -422,8 +400,8 @@ class CareerUI:
             hover_color=(250, 80, 80)
         )
         
-        self.action_buttons.append(promote_button)
-        self.action_buttons.append(stay_button)
+        self.action_buttons.add(promote_button)
+        self.action_buttons.add(stay_button)
     
     def _accept_promotion(self):
         """Accepte la promotion à la catégorie supérieure"""
@@ -456,7 +434,7 @@ class CareerUI:
         self.contract_offers = self.season_results.get('new_contracts', [])
         
         # Vider les boutons existants
-        self.action_buttons = []
+        self.action_buttons.clear()
         
         # Position et dimensions des boutons
         button_width = 350
@@ -501,7 +479,7 @@ class CareerUI:
                 hover_color=hover_color
             )
             
-            self.action_buttons.append(button)
+            self.action_buttons.add(button)
     
     def _accept_contract(self, offer):
         """
@@ -525,6 +503,9 @@ class CareerUI:
     def show_stats(self):
         """Affiche les statistiques du joueur"""
         self.current_state = self.STATES['stats']
+        
+        # Saisons passées lues une seule fois depuis l'historique
+        self.season_history = self.career.history.season_summaries(limit=10)
     
     def show_standings(self):
         """Affiche les classements actuels"""
@@ -534,7 +515,7 @@ class CareerUI:
     def _create_action_buttons(self):
         """Crée les boutons d'action pour l'aperçu de saison"""
         # Vider les boutons existants
-        self.action_buttons = []
+        self.action_buttons.clear()
         
         # Position et dimensions des boutons
         button_width = 250
@@ -580,10 +561,11 @@ class CareerUI:
             hover_color=(80, 210, 80)
         )
         
-        self.action_buttons.append(race_button)
-        self.action_buttons.append(stats_button)
-        self.action_buttons.append(standings_button)
+        self.action_buttons.add(race_button)
+        self.action_buttons.add(stats_button)
+        self.action_buttons.add(standings_button)
     
+    @timed('ui.career.render')
     def render(self, surface):
         """
         Dessine l'interface sur une surface
@@ -700,8 +682,7 @@ class CareerUI:
             self._create_action_buttons()
         
         # Affichage des boutons
-        for button in self.action_buttons:
-            button.draw(surface)
+        self.action_buttons.draw(surface)
     
     def _render_race_selection(self, surface):
         """
@@ -721,24 +702,11 @@ class CareerUI:
         surface.blit(subtitle_text, subtitle_rect)
         
         # Affichage des boutons de course
-        for button in self.race_buttons:
-            button.draw(surface)
+        self.race_buttons.draw(surface)
         
         # Bouton retour
-        back_button = Button(
-            "RETOUR",
-            20,
-            self.screen_height - 70,
-            120,
-            50,
-            action=lambda: setattr(self, 'current_state', self.STATES['season_overview']),
-            bg_color=self.colors['warning'],
-            hover_color=(250, 80, 80)
-        )
-        
-        back_button.draw(surface)
-        # Stocker le bouton retour pour la gestion des événements
-        self.back_button = back_button
+        self.back_button.draw(surface)
+    
     def _set_current_state(self, state):
         print(f"Changement d'état: {self.current_state} -> {state}")
         self.current_state = state
@@ -854,19 +822,52 @@ class CareerUI:
         
         surface.blit(stats_surface, stats_rect)
         
+        # Historique des saisons terminées
+        history_rect = self._history_panel_rect(skills_rect, stats_rect)
+        history_surface = Surface((history_rect.width, history_rect.height), pygame.SRCALPHA)
+        history_surface.fill((0, 0, 0, 180))  # Fond semi-transparent
+        
+        history_title = self.info_font.render("SAISONS", True, self.colors['highlight'])
+        history_surface.blit(history_title, (20, 20))
+        
+        y_offset = 60
+        for season in self.season_history:
+            if y_offset + HISTORY_ROW_HEIGHT > history_rect.height:
+                break
+            season_text = self.status_font.render(
+                f"{season['year']}  {season['category'].upper()}  P{season['player_position']}  "
+                f"{season['player_points']:.0f} pts",
+                True, self.colors['text']
+            )
+            history_surface.blit(season_text, (20, y_offset))
+            y_offset += HISTORY_ROW_HEIGHT
+        
+        surface.blit(history_surface, history_rect)
+        
         # Bouton retour
-        back_button = Button(
-            "RETOUR",
-            20,
-            self.screen_height - 70,
-            120,
-            50,
-            action=lambda: setattr(self, 'current_state', self.STATES['season_overview']),
-            bg_color=self.colors['warning'],
-            hover_color=(250, 80, 80)
-        )
+        self.back_button.draw(surface)
+    
+    def _history_panel_rect(self, skills_rect, stats_rect):
+        """
+        Emplacement du panneau des saisons: entre les deux colonnes si la place
+        le permet, sinon sous les colonnes (au-dessus du bouton retour)
         
-        back_button.draw(surface)
+        Args:
+            skills_rect (pygame.Rect): Colonne des compétences
+            stats_rect (pygame.Rect): Colonne des statistiques de carrière
+            
+        Returns:
+            pygame.Rect: Rectangle du panneau
+        """
+        left = skills_rect.right + 20
+        width = stats_rect.left - 20 - left
+        if width >= HISTORY_MIN_WIDTH:
+            return Rect(left, stats_rect.top, width, stats_rect.height)
+        
+        top = max(skills_rect.bottom, stats_rect.bottom) + 20
+        width = self.screen_width - 2 * skills_rect.left
+        height = self.back_button.rect.top - 20 - top
+        return Rect(skills_rect.left, top, max(width, HISTORY_MIN_WIDTH), max(height, HISTORY_MIN_HEIGHT))
     
     def _render_season_results(self, surface):
         """
@@ -943,8 +944,7 @@ class CareerUI:
         surface.blit(results_surface, (results_x, results_y))
         
         # Affichage des boutons
-        for button in self.action_buttons:
-            button.draw(surface)
+        self.action_buttons.draw(surface)
     
     def _render_promotion_screen(self, surface):
         """
@@ -1010,8 +1010,7 @@ class CareerUI:
         surface.blit(info_surface, (info_x, info_y))
         
         # Affichage des boutons
-        for button in self.action_buttons:
-            button.draw(surface)
+        self.action_buttons.draw(surface)
     
     def _render_contract_offers(self, surface):
         """
@@ -1055,5 +1054,4 @@ class CareerUI:
         surface.blit(info_surface, (info_x, info_y))
         
         # Affichage des boutons
-        for button in self.action_buttons:
-            button.draw(surface)
\ No newline at end of file
+        self.action_buttons.draw(surface)
\ No newline at end of file
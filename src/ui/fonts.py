@@ -0,0 +1,204 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Résolution des polices avec cache persistant
+
+pygame.font.SysFont construit la table des polices du système au premier
+appel (fc-list sous Linux), ce qui ralentit le démarrage. Les polices
+résolues (famille et style -> fichier) sont conservées dans
+~/.drive_to_survive/fonts.json et chargées directement avec
+pygame.font.Font. Le cache n'est invalidé que si les dossiers de polices
+du système changent.
+"""
+
+import os
+import sys
+import json
+import pygame
+from src.utils.atomic import atomic_write
+
+# Fichier du cache des polices
+FONT_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.drive_to_survive', 'fonts.json')
+
+# Version du format du cache
+FONT_CACHE_VERSION = 1
+
+def _font_directories():
+    """Dossiers de polices du système et de l'utilisateur"""
+    home = os.path.expanduser('~')
+    if sys.platform.startswith('win'):
+        return [os.path.join(os.environ.get('WINDIR', 'C:\\Windows'), 'Fonts'),
+                os.path.join(os.environ.get('LOCALAPPDATA', home), 'Microsoft', 'Windows', 'Fonts')]
+    if sys.platform == 'darwin':
+        return ['/System/Library/Fonts', '/Library/Fonts', os.path.join(home, 'Library', 'Fonts')]
+    return ['/usr/share/fonts', '/usr/local/share/fonts', os.path.join(home, '.fonts'),
+            os.path.join(home, '.local', 'share', 'fonts')]
+
+# Dossiers surveillés pour l'invalidation du cache
+FONT_DIRS = _font_directories()
+
+# Constructeur des polices (remplacé par le profileur pour compter les rendus de texte)
+FONT_CONSTRUCTOR = None
+
+
+def _default_constructor(path, size, bold, italic):
+    """Crée une police à partir de son fichier (None = police par défaut de pygame)"""
+    font = pygame.font.Font(path, size)
+    if bold:
+        font.set_bold(True)
+    if italic:
+        font.set_italic(True)
+    return font
+
+def fonts_fingerprint(directories=None):
+    """
+    Empreinte des dossiers de polices: date de modification de chaque
+    dossier et sous-dossier (l'ajout ou la suppression d'une police modifie
+    la date de son dossier). Seuls les dossiers sont examinés, pas les fichiers.
+
+    Args:
+        directories (list, optional): Dossiers racines. Par défaut, FONT_DIRS.
+
+    Returns:
+        list: [dossier, date de modification (ns)] triés
+    """
+    fingerprint = []
+    for root in directories if directories is not None else FONT_DIRS:
+        if not os.path.isdir(root):
+            continue
+        for directory, _, _ in os.walk(root):
+            try:
+                fingerprint.append([directory, os.stat(directory).st_mtime_ns])
+            except OSError:
+                continue
+    fingerprint.sort()
+    return fingerprint
+
+
+class FontResolver:
+    """Polices résolues une fois, puis chargées depuis leur fichier"""
+
+    def __init__(self, cache_path=FONT_CACHE_PATH, directories=None):
+        """
+        Initialisation du résolveur (le cache est lu au premier appel)
+
+        Args:
+            cache_path (str): Fichier du cache
+            directories (list, optional): Dossiers de polices surveillés
+        """
+        self.cache_path = cache_path
+        self.directories = directories
+        self.entries = None  # clé "famille|gras|italique" -> [fichier, gras simulé, italique simulé]
+        self.fingerprint = None
+        self.fonts = {}  # (famille, taille, gras, italique) -> police chargée
+
+    @staticmethod
+    def _key(name, bold, italic):
+        """Clé du cache (nom normalisé comme pygame.font.SysFont)"""
+        return f"{name.lower().replace(' ', '')}|{int(bool(bold))}|{int(bool(italic))}"
+
+    def _load(self):
+        """Lit le cache et l'invalide si les dossiers de polices ont changé"""
+        self.fingerprint = fonts_fingerprint(self.directories)
+        self.entries = {}
+
+        if not os.path.exists(self.cache_path):
+            return
+
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+            if cache.get('version') == FONT_CACHE_VERSION and cache.get('fingerprint') == self.fingerprint:
+                self.entries = cache.get('fonts', {})
+        except Exception as e:
+            print(f"Erreur lors du chargement du cache des polices: {e}")
+
+    def _save(self):
+        """Écrit le cache de façon atomique"""
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            payload = json.dumps({
+                'version': FONT_CACHE_VERSION,
+                'fingerprint': self.fingerprint,
+                'fonts': self.entries
+            }, indent=2)
+            atomic_write(self.cache_path, [payload.encode('utf-8')])
+        except Exception as e:
+            print(f"Erreur lors de la sauvegarde du cache des polices: {e}")
+
+    def _resolve(self, name, size, bold, italic):
+        """
+        Résout une police par la table des polices du système (absente du cache)
+
+        Returns:
+            list: [fichier ou None, gras simulé, italique simulé]
+        """
+        resolved = []
+
+        def capture(path, size, set_bold, set_italic):
+            resolved.append([path, set_bold, set_italic])
+            return None
+
+        pygame.font.SysFont(name, size, bold, italic, capture)
+        return resolved[0]
+
+    def get_font(self, name, size, bold=False, italic=False):
+        """
+        Police d'une famille système
+
+        Les polices sont partagées entre les interfaces: elles ne doivent
+        pas être modifiées (set_bold, set_underline...) par les appelants.
+
+        Args:
+            name (str): Famille (ex: 'Arial')
+            size (int): Taille
+            bold (bool): Gras
+            italic (bool): Italique
+
+        Returns:
+            pygame.font.Font: Police
+        """
+        font_key = (name, size, bool(bold), bool(italic))
+        font = self.fonts.get(font_key)
+        if font is not None:
+            return font
+
+        if self.entries is None:
+            self._load()
+
+        key = self._key(name, bold, italic)
+        entry = self.entries.get(key)
+        if entry is not None and entry[0] is not None and not os.path.exists(entry[0]):
+            entry = None  # Fichier supprimé sans changement de dossier détecté
+
+        if entry is None:
+            entry = self._resolve(name, size, bold, italic)
+            self.entries[key] = entry
+            self._save()
+
+        if not pygame.font.get_init():
+            pygame.font.init()
+        constructor = FONT_CONSTRUCTOR or _default_constructor
+        font = constructor(entry[0], size, entry[1], entry[2])
+        self.fonts[font_key] = font
+        return font
+
+
+# Résolveur du processus
+_resolver = FontResolver()
+
+def get_font(name, size, bold=False, italic=False):
+    """
+    Police d'une famille système (voir FontResolver.get_font)
+
+    Args:
+        name (str): Famille (ex: 'Arial')
+        size (int): Taille
+        bold (bool): Gras
+        italic (bool): Italique
+
+    Returns:
+        pygame.font.Font: Police
+    """
+    return _resolver.get_font(name, size, bold, italic)
@@ -8,43 +8,9 @@ Menu principal du jeu
 import pygame
 import os
 from pygame import font, draw, Rect
-
-# À mettre dans src/ui/main_menu.py
-class Button:
-    """Classe pour créer des boutons interactifs"""
-    
-    def __init__(self, text, x, y, width, height, action=None, bg_color=(100, 100, 100), hover_color=(150, 150, 150)):
-        self.text = text
-        self.rect = pygame.Rect(x, y, width, height)
-        self.action = action
-        self.bg_color = bg_color
-        self.hover_color = hover_color
-        self.is_hovered = False
-    
-    def draw(self, surface):
-        # Mise à jour de l'état de survol
-        mouse_pos = pygame.mouse.get_pos()
-        self.is_hovered = self.rect.collidepoint(mouse_pos)
-        
-        # Fond du bouton
-        pygame.draw.rect(surface, self.hover_color if self.is_hovered else self.bg_color, self.rect, border_radius=10)
-        pygame.draw.rect(surface, (50, 50, 50), self.rect, 2, border_radius=10)  # Bordure
-        
-        # Texte du bouton
-        button_font = pygame.font.SysFont('Arial', 24)
-        text_surf = button_font.render(self.text, True, (255, 255, 255))
-        text_rect = text_surf.get_rect(center=self.rect.center)
-        surface.blit(text_surf, text_rect)
-    
-    def handle_event(self, event):
-        # Simplification : on ne vérifie que les clics
-        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            if self.rect.collidepoint(event.pos):
-                if self.action:
-                    print(f"Bouton cliqué: {self.text}")
-                    self.action()
-                    return True
-        return False
+from src.ui.fonts import get_font
+from src.ui.widgets import Button, WidgetGroup
+from src.utils.instrument import timed
 
 class MainMenu:
     """Classe pour le menu principal du jeu"""
@@ -71,23 +37,22 @@ class MainMenu:
         
         start_y = self.screen_height // 2 - 50
         
-        self.buttons = [
-            Button("NOUVELLE CARRIÈRE", button_x, start_y, button_width, button_height, 
-                  action=self.start_new_career, bg_color=(50, 100, 180), hover_color=(70, 130, 210)),
-            Button("CHARGER PARTIE", button_x, start_y + button_height + button_spacing, button_width, button_height, 
-                  action=self.load_game, bg_color=(50, 180, 100), hover_color=(70, 210, 130)),
-            Button("OPTIONS", button_x, start_y + (button_height + button_spacing) * 2, button_width, button_height, 
-                  action=self.show_options),
-            Button("QUITTER", button_x, start_y + (button_height + button_spacing) * 3, button_width, button_height, 
-                  action=self.game.quit_game, bg_color=(180, 50, 50), hover_color=(210, 70, 70))
-        ]
+        self.buttons = WidgetGroup()
+        self.buttons.add(Button("NOUVELLE CARRIÈRE", button_x, start_y, button_width, button_height, 
+                  action=self.start_new_career, bg_color=(50, 100, 180), hover_color=(70, 130, 210)))
+        self.buttons.add(Button("CHARGER PARTIE", button_x, start_y + button_height + button_spacing, button_width, button_height, 
+                  action=self.load_game, bg_color=(50, 180, 100), hover_color=(70, 210, 130)))
+        self.buttons.add(Button("OPTIONS", button_x, start_y + (button_height + button_spacing) * 2, button_width, button_height, 
+                  action=self.show_options))
+        self.buttons.add(Button("QUITTER", button_x, start_y + (button_height + button_spacing) * 3, button_width, button_height, 
+                  action=self.game.quit_game, bg_color=(180, 50, 50), hover_color=(210, 70, 70)))
     
     def load_resources(self):
         """Charge les ressources pour le menu"""
         # Charger les polices
         font.init()
-        self.title_font = font.SysFont('Arial', 48, bold=True)
-        self.subtitle_font = font.SysFont('Arial', 32)
+        self.title_font = get_font('Arial', 48, bold=True)
+        self.subtitle_font = get_font('Arial', 32)
         
         # Créer un arrière-plan en dégradé au lieu de charger une image
         self.background = pygame.Surface((self.screen_width, self.screen_height))
@@ -111,9 +76,7 @@ class MainMenu:
         Args:
             event (pygame.event.Event): Événement à gérer
         """
-        for button in self.buttons:
-            if button.handle_event(event):
-                break
+        self.buttons.handle_event(event)
     
     def start_new_career(self):
         """Démarre une nouvelle carrière"""
@@ -128,6 +91,7 @@ class MainMenu:
         # À implémenter: affichage des options
         pass
     
+    @timed('ui.main_menu.render')
     def render(self, surface):
         """
         Dessine le menu sur une surface
@@ -152,5 +116,4 @@ class MainMenu:
         surface.blit(subtitle_surf, subtitle_rect)
         
         # Dessiner les boutons
-        for button in self.buttons:
-            button.draw(surface)
\ No newline at end of file
+        self.buttons.draw(surface)
\ No newline at end of file
@@ -0,0 +1,145 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Surcouche d'affichage du profileur de frames
+"""
+
+import pygame
+from pygame import font, draw, Rect, Surface
+from src.ui.fonts import get_font
+from src.utils.profiler import PHASES, HISTOGRAM_BOUNDS
+from src.utils.instrument import timed
+
+class ProfilerOverlay:
+    """Surcouche affichant les temps de frame (touche F12, export CSV avec F10)"""
+
+    # Nombre de frames entre deux recalculs des statistiques
+    REFRESH_FRAMES = 15
+
+    def __init__(self, profiler):
+        """
+        Initialisation de la surcouche
+
+        Args:
+            profiler (FrameProfiler): Profileur de frames
+        """
+        self.profiler = profiler
+        self.visible = False
+
+        font.init()
+        self.font = get_font('Consolas', 14)
+
+        self.colors = {
+            'panel': (0, 0, 0, 200),
+            'text': (255, 255, 255),
+            'highlight': (255, 220, 50),
+            'bar': (50, 150, 220),
+            'bar_slow': (220, 50, 50)
+        }
+
+        self._panel = None
+        self._frames_since_refresh = 0
+
+    def toggle(self):
+        """Affiche ou masque la surcouche"""
+        self.visible = not self.visible
+        self._panel = None
+
+    def handle_event(self, event):
+        """
+        Gère les raccourcis clavier du profileur
+
+        Args:
+            event (pygame.event.Event): Événement à gérer
+
+        Returns:
+            bool: True si l'événement a été traité
+        """
+        if event.type != pygame.KEYDOWN:
+            return False
+
+        if event.key == pygame.K_F12:
+            self.toggle()
+            return True
+
+        if event.key == pygame.K_F10:
+            path = self.profiler.export_csv()
+            if path:
+                print(f"Profil de frames exporté: {path}")
+            return True
+
+        return False
+
+    @timed('ui.profiler_overlay.render')
+    def render(self, surface):
+        """
+        Dessine la surcouche sur une surface
+
+        Args:
+            surface (pygame.Surface): Surface sur laquelle dessiner
+        """
+        if not self.visible:
+            return
+
+        # Le panneau n'est recalculé que périodiquement
+        self._frames_since_refresh += 1
+        if self._panel is None or self._frames_since_refresh >= self.REFRESH_FRAMES:
+            self._panel = self._build_panel(self.profiler.get_stats())
+            self._frames_since_refresh = 0
+
+        surface.blit(self._panel, (surface.get_width() - self._panel.get_width() - 10, 10))
+
+    def _build_panel(self, stats):
+        """
+        Construit le panneau de statistiques
+
+        Args:
+            stats (dict): Statistiques du profileur
+
+        Returns:
+            pygame.Surface: Panneau prêt à être affiché
+        """
+        line_height = 16
+        width = 330
+        height = 40 + line_height * (len(PHASES) + 4) + 90
+
+        panel = Surface((width, height), pygame.SRCALPHA)
+        panel.fill(self.colors['panel'])
+
+        total = stats['phases']['total']
+        fps = 1000 / total['mean'] if total['mean'] > 0 else 0
+        lines = [
+            (f"PROFILEUR - {self.profiler.screen} - {stats['frames']} frames", self.colors['highlight']),
+            (f"{'phase':<8}{'moy':>8}{'p50':>8}{'p95':>8}{'p99':>8}", self.colors['highlight'])
+        ]
+        for phase in PHASES + ('total',):
+            values = stats['phases'][phase]
+            lines.append((
+                f"{phase:<8}{values['mean']:>8.2f}{values['p50']:>8.2f}{values['p95']:>8.2f}{values['p99']:>8.2f}",
+                self.colors['text']
+            ))
+        lines.append((f"~{fps:.0f} FPS (hors attente) | ms", self.colors['text']))
+        if stats['counting']:
+            counters = f"Textes: {stats['text_renders']}  Surfaces: {stats['surfaces']} / frame"
+        else:
+            counters = "Allocations non comptées (DTS_PROFILE=1)"
+        lines.append((counters, self.colors['text']))
+
+        y = 8
+        for text, color in lines:
+            panel.blit(self.font.render(text, True, color), (8, y))
+            y += line_height
+
+        # Histogramme des temps de frame
+        histogram = stats['histogram']
+        peak = max(histogram) or 1
+        bar_area = Rect(8, y + 8, width - 16, 70)
+        bar_width = bar_area.width // len(histogram)
+        for i, count in enumerate(histogram):
+            bar_height = int(bar_area.height * count / peak)
+            color = self.colors['bar_slow'] if i >= HISTOGRAM_BOUNDS.index(16.7) + 1 else self.colors['bar']
+            draw.rect(panel, color, (bar_area.left + i * bar_width, bar_area.bottom - bar_height,
+                                     bar_width - 2, bar_height))
+
+        return panel
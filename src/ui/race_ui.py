@@ -8,7 +8,10 @@ Interface utilisateur pendant une course
 import pygame
 from pygame import font, draw, Rect, Surface
 import random
-from src.ui.main_menu import Button
+from src.ui.fonts import get_font
+from src.ui.widgets import Button, WidgetGroup
+from src.ui.table import VirtualTable
+from src.utils.instrument import timed
 
 class RaceUI:
     """Interface utilisateur pour une course"""
@@ -32,10 +35,10 @@ class RaceUI:
         
         # Charger les polices
         font.init()
-        self.title_font = font.SysFont('Arial', 36, bold=True)
-        self.info_font = font.SysFont('Arial', 24)
-        self.action_font = font.SysFont('Arial', 20)
-        self.status_font = font.SysFont('Arial', 18)
+        self.title_font = get_font('Arial', 36, bold=True)
+        self.info_font = get_font('Arial', 24)
+        self.action_font = get_font('Arial', 20)
+        self.status_font = get_font('Arial', 18)
         
         # Couleurs
         self.colors = {
@@ -72,12 +75,17 @@ class RaceUI:
             }
         }
         
-        # Horloge pour animations et timings
-        self.clock = pygame.time.Clock()
+        # Temps écoulé (ms), cadencé par l'ordonnanceur du jeu
         self.elapsed_time = 0
         
+        # Délai restant (ms) avant de passer au tour suivant
+        self.lap_delay = 0
+        
+        # Classement défilant (seules les lignes visibles sont dessinées)
+        self.standings_table = VirtualTable(Rect(20, 200, 300, 320), 40, self._render_standings_row)
+        
         # Boutons d'actions
-        self.action_buttons = []
+        self.action_buttons = WidgetGroup()
         
         # Bouton de retour
         self.back_button = Button(
@@ -134,6 +142,7 @@ class RaceUI:
         
         # Générer les actions disponibles pour le joueur
         self.update_available_actions()
+        self._refresh_standings_rows()
     
     def update_available_actions(self):
         """Met à jour les actions disponibles pour le joueur"""
@@ -152,7 +161,7 @@ class RaceUI:
     
     def create_action_buttons(self):
         """Crée les boutons pour les actions disponibles"""
-        self.action_buttons = []
+        self.action_buttons.clear()
         
         # Position et dimensions des boutons
         button_width = 250
@@ -196,7 +205,7 @@ class RaceUI:
                 hover_color=hover_color
             )
             
-            self.action_buttons.append(button)
+            self.action_buttons.add(button)
     
     def handle_action(self, action_id):
         """
@@ -205,11 +214,12 @@ class RaceUI:
         Args:
             action_id (str): ID de l'action choisie
         """
-        if self.race_finished:
+        if self.race_finished or self.lap_delay > 0:
             return
         
         # Exécuter l'action
         self.action_result = self.race.execute_player_action(action_id)
+        self._refresh_standings_rows()
         
         # Mise à jour de l'état de la voiture
         car_status = self.current_state.get('car_status', {})
@@ -228,11 +238,16 @@ class RaceUI:
         # Mettre à jour l'état
         self.current_state['car_status'] = car_status
         
-        # Attendre un peu avant de passer au tour suivant
-        pygame.time.delay(1000)  # 1 seconde
+        # Attendre un peu avant de passer au tour suivant (sans bloquer le rendu)
+        self.lap_delay = 1000  # 1 seconde
+    
+    def _advance_lap(self):
+        """Passe au tour suivant une fois le délai écoulé"""
+        car_status = self.current_state.get('car_status', {})
         
         # Avancer d'un tour
         self.current_state = self.race.advance_lap()
+        self._refresh_standings_rows()
         
         # S'assurer que current_state a toutes les clés nécessaires
         if 'lap' not in self.current_state:
@@ -268,6 +283,11 @@ class RaceUI:
         # Récupérer les résultats
         self.race_results = self.race.get_race_results()
         
+        # Enregistrer le résultat complet dans la saison (points et classements de tous les pilotes)
+        career = self.game.career
+        if career is not None and career.current_season is not None:
+            career.current_season.complete_race(self.race_results)
+        
         # Mettre à jour le joueur avec les résultats
         race_results_for_player = {
             'position': self.race_results['player_position'],
@@ -278,6 +298,9 @@ class RaceUI:
         
         # Mettre à jour les statistiques du joueur
         self.player.update_stats(race_results_for_player)
+        
+        # Sauvegarde automatique (écrite en arrière-plan)
+        self.game.save_game()
     
     def handle_event(self, event):
         """
@@ -292,23 +315,74 @@ class RaceUI:
             self.game.current_state = 1  # Retour à l'interface de carrière
             return True
     
-    # Gestion des boutons d'action
-        for button in self.action_buttons:
-            if button.handle_event(event):
-                return True
+    # Défilement du classement
+        if self.standings_table.handle_event(event):
+            return True
     
     # Gestion du bouton retour si la course est terminée
-        if self.race_finished and event.type == pygame.MOUSEBUTTONDOWN:
-            if self.back_button.rect.collidepoint(event.pos):
-                print("Retour à la carrière via clic sur bouton")
-                self.game.current_state = 1  # Retour à l'interface de carrière
-                return True
+        if self.race_finished:
+            return self.back_button.handle_event(event)
     
-        return False
+    # Gestion des boutons d'action
+        return self.action_buttons.handle_event(event)
     
     def update(self):
-        """Met à jour l'état de l'interface"""
-        self.elapsed_time += self.clock.tick(60)  # 60 FPS
+        """Met à jour l'état de l'interface (un pas de simulation)"""
+        step_ms = self.game.scheduler.step_ms
+        self.elapsed_time += step_ms
+        
+        # Tour suivant une fois le délai écoulé
+        if self.lap_delay > 0:
+            self.lap_delay -= step_ms
+            if self.lap_delay <= 0:
+                self.lap_delay = 0
+                self._advance_lap()
+    
+    def _refresh_standings_rows(self):
+        """Met à jour les lignes du classement après un changement de positions"""
+        positions = sorted(self.race.positions.items(), key=lambda x: x[1])
+        leader_id = positions[0][0] if positions else None
+        time_gaps = self.current_state.get('time_gaps', {})
+        
+        rows = []
+        for i, (driver_id, position) in enumerate(positions):
+            driver_info = self.race.drivers[driver_id]
+            driver_name = driver_info['name'] if driver_id != 'player' else f"{self.player.name} (Vous)"
+            
+            # Écart de temps avec le leader
+            time_gap = ""
+            if driver_id != leader_id and i > 0:
+                time_gap_value = time_gaps.get(driver_id, 0)
+                if time_gap_value > 0:
+                    time_gap = f"+{time_gap_value:.1f}s"
+            
+            rows.append((position, driver_name, time_gap, driver_info['team'], driver_id == 'player'))
+        
+        self.standings_table.set_rows(rows)
+    
+    def _render_standings_row(self, row, index):
+        """
+        Dessine une ligne du classement
+        
+        Args:
+            row (tuple): Position, nom, écart, équipe et indicateur joueur
+            index (int): Index de la ligne
+            
+        Returns:
+            pygame.Surface: Surface de la ligne
+        """
+        position, driver_name, time_gap, team_name, is_player = row
+        row_surface = Surface((self.standings_table.rect.width, self.standings_table.row_height), pygame.SRCALPHA)
+        
+        # Couleur pour le joueur
+        text_color = self.colors['highlight'] if is_player else self.colors['text']
+        
+        row_surface.blit(self.status_font.render(f"{position}.", True, text_color), (15, 0))
+        row_surface.blit(self.status_font.render(driver_name, True, text_color), (40, 0))
+        row_surface.blit(self.status_font.render(time_gap, True, text_color), (170, 0))
+        row_surface.blit(self.status_font.render(team_name, True, text_color), (40, 20))
+        
+        return row_surface
     
     def draw_standings(self, surface):
         """
@@ -331,43 +405,10 @@ class RaceUI:
         player_pos_text = self.info_font.render(f"Votre position: {player_pos}", True, self.colors['highlight'])
         standings_surface.blit(player_pos_text, (10, 40))
         
-        # Afficher le classement
-        positions = sorted(self.race.positions.items(), key=lambda x: x[1])
-        
-        y_offset = 80
-        leader_id = positions[0][0] if positions else None
-        
-        for i, (driver_id, position) in enumerate(positions[:15]):  # Limiter aux 15 premiers
-            driver_info = self.race.drivers[driver_id]
-            driver_name = driver_info['name'] if driver_id != 'player' else f"{self.player.name} (Vous)"
-            team_name = driver_info['team']
-            
-            # Couleur pour le joueur
-            text_color = self.colors['highlight'] if driver_id == 'player' else self.colors['text']
-            
-            pos_text = self.status_font.render(f"{position}.", True, text_color)
-            name_text = self.status_font.render(driver_name, True, text_color)
-            
-            # Afficher les écarts de temps
-            time_gap = ""
-            if driver_id != leader_id and i > 0:  # Pas le leader
-                time_gap_value = self.current_state.get('time_gaps', {}).get(driver_id, 0)
-                if time_gap_value > 0:
-                    time_gap = f"+{time_gap_value:.1f}s"
-            
-            gap_text = self.status_font.render(time_gap, True, text_color)
-            
-            standings_surface.blit(pos_text, (15, y_offset))
-            standings_surface.blit(name_text, (40, y_offset))
-            standings_surface.blit(gap_text, (170, y_offset))
-            
-            team_text_y = y_offset + 20
-            team_text = self.status_font.render(team_name, True, text_color)
-            standings_surface.blit(team_text, (40, team_text_y))
-            
-            y_offset += 40
-        
         surface.blit(standings_surface, standings_rect)
+        
+        # Lignes du classement (tout le plateau, avec défilement)
+        self.standings_table.draw(surface)
     
     def draw_race_info(self, surface):
         """
@@ -589,6 +630,7 @@ class RaceUI:
         
         surface.blit(results_surface, (results_x, results_y))
     
+    @timed('ui.race.render')
     def render(self, surface):
         """
         Dessine l'interface de course sur une surface
@@ -616,8 +658,7 @@ class RaceUI:
         
         # Boutons d'action
         if not self.race_finished:
-            for button in self.action_buttons:
-                button.draw(surface)
+            self.action_buttons.draw(surface)
         
         # Bouton retour
         if self.race_finished:
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Indicateur de sauvegarde affiché en bas de l'écran
+"""
+
+import pygame
+from pygame import font
+from src.ui.fonts import get_font
+from src.utils.instrument import timed
+
+class SaveIndicator:
+    """Indicateur de sauvegarde en cours / terminée"""
+
+    # Durée d'affichage (ms) du résultat d'une sauvegarde
+    RESULT_DURATION = 2000
+
+    def __init__(self):
+        """Initialisation de l'indicateur"""
+        font.init()
+        self.font = get_font('Arial', 18)
+
+        self.saving = False
+        self.success = True
+        self.result_until = 0
+
+    @property
+    def active(self):
+        """True tant que l'indicateur est affiché"""
+        return self.saving or pygame.time.get_ticks() < self.result_until
+
+    def show_saving(self):
+        """Signale le début d'une sauvegarde"""
+        self.saving = True
+
+    def show_result(self, success):
+        """
+        Signale la fin d'une sauvegarde
+
+        Args:
+            success (bool): True si la sauvegarde a réussi
+        """
+        self.saving = False
+        self.success = success
+        self.result_until = pygame.time.get_ticks() + self.RESULT_DURATION
+
+    @timed('ui.save_indicator.render')
+    def render(self, surface):
+        """
+        Dessine l'indicateur sur une surface
+
+        Args:
+            surface (pygame.Surface): Surface sur laquelle dessiner
+        """
+        if not self.active:
+            return
+
+        if self.saving:
+            # Points animés pendant l'écriture
+            dots = "." * (1 + pygame.time.get_ticks() // 300 % 3)
+            text, color = f"Sauvegarde{dots}", (255, 220, 50)
+        elif self.success:
+            text, color = "Partie sauvegardée", (50, 180, 50)
+        else:
+            text, color = "Échec de la sauvegarde", (220, 50, 50)
+
+        text_surf = self.font.render(text, True, color)
+        text_rect = text_surf.get_rect(bottomright=(surface.get_width() - 15, surface.get_height() - 10))
+        surface.blit(text_surf, text_rect)
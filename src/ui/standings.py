@@ -7,6 +7,9 @@ Interface de classements et statistiques
 
 import pygame
 from pygame import font, draw, Rect, Surface
+from src.ui.fonts import get_font
+from src.ui.table import VirtualTable
+from src.utils.instrument import timed
 
 class StandingsUI:
     """Interface des classements et statistiques"""
@@ -26,9 +29,9 @@ class StandingsUI:
         
         # Charger les polices
         font.init()
-        self.title_font = font.SysFont('Arial', 36, bold=True)
-        self.subtitle_font = font.SysFont('Arial', 24)
-        self.entry_font = font.SysFont('Arial', 18)
+        self.title_font = get_font('Arial', 36, bold=True)
+        self.subtitle_font = get_font('Arial', 24)
+        self.entry_font = get_font('Arial', 18)
         
         # Couleurs
         self.colors = {
@@ -45,8 +48,34 @@ class StandingsUI:
         # État de l'interface
         self.view_mode = 'drivers'  # 'drivers' ou 'teams'
         
+        # Géométrie des tableaux
+        self.table_y = 150
+        self.header_height = 40
+        self.row_height = 30
+        rows_area_height = 460
+        
+        self.driver_col_widths = [60, 300, 280, 160]  # Pos, Pilote, Équipe, Points
+        self.team_col_widths = [60, 380, 160]  # Pos, Équipe, Points
+        
+        # Tableaux virtualisés (seules les lignes visibles sont dessinées)
+        driver_width = sum(self.driver_col_widths)
+        self.driver_table = VirtualTable(
+            Rect(self.screen_width // 2 - driver_width // 2, self.table_y + self.header_height,
+                 driver_width, rows_area_height),
+            self.row_height,
+            self._render_driver_row
+        )
+        team_width = sum(self.team_col_widths)
+        self.team_table = VirtualTable(
+            Rect(self.screen_width // 2 - team_width // 2, self.table_y + self.header_height,
+                 team_width, rows_area_height),
+            self.row_height,
+            self._render_team_row
+        )
+        
         # Obtenir les classements actuels
         self.standings = self.season.get_current_standings()
+        self._update_rows()
     
     def update(self, season=None):
         """
@@ -60,11 +89,30 @@ class StandingsUI:
         
         # Mettre à jour les classements
         self.standings = self.season.get_current_standings()
+        self._update_rows()
+    
+    def _update_rows(self):
+        """Met à jour le contenu des tableaux à partir des classements"""
+        driver_rows = []
+        for i, (driver_id, points) in enumerate(self.standings['driver_standings']):
+            driver_info = self.season.drivers.get(driver_id, {})
+            driver_name = driver_info.get('name', 'Inconnu')
+            if driver_id == 'player':
+                driver_name += " (Vous)"
+            driver_rows.append((i + 1, driver_name, driver_info.get('team', 'Inconnue'), points, driver_id == 'player'))
+        self.driver_table.set_rows(driver_rows)
+        
+        player_team = self.season.drivers['player']['team']
+        team_rows = []
+        for i, (team_name, points) in enumerate(self.standings['team_standings']):
+            team_rows.append((i + 1, team_name, points, team_name == player_team))
+        self.team_table.set_rows(team_rows)
     
     def toggle_view(self):
         """Bascule entre les classements pilotes et équipes"""
         self.view_mode = 'teams' if self.view_mode == 'drivers' else 'drivers'
     
+    @timed('ui.standings.render')
     def render(self, surface):
         """
         Dessine l'interface sur une surface
@@ -107,143 +155,91 @@ class StandingsUI:
         toggle_text_rect = toggle_text.get_rect(center=toggle_rect.center)
         surface.blit(toggle_text, toggle_text_rect)
     
-    def _render_driver_standings(self, surface):
+    def _render_header(self, surface, table, col_widths, headers):
         """
-        Dessine le classement des pilotes
+        Dessine l'en-tête d'un tableau
         
         Args:
             surface (pygame.Surface): Surface sur laquelle dessiner
+            table (VirtualTable): Tableau concerné
+            col_widths (list): Largeurs des colonnes
+            headers (list): Titres des colonnes
         """
-        # Tableau de classement
-        table_width = 800
-        table_height = 500
-        table_x = self.screen_width // 2 - table_width // 2
-        table_y = 150
-        
-        # En-tête du tableau
-        header_height = 40
-        header_rect = Rect(table_x, table_y, table_width, header_height)
+        table_x = table.rect.left
+        header_rect = Rect(table_x, self.table_y, table.rect.width, self.header_height)
         draw.rect(surface, self.colors['header'], header_rect)
         
-        # Colonnes
-        col_widths = [60, 300, 280, 160]  # Pos, Pilote, Équipe, Points
-        col_x = [table_x]
-        for i in range(len(col_widths) - 1):
-            col_x.append(col_x[i] + col_widths[i])
-        
-        # Titres des colonnes
-        headers = ["Pos", "Pilote", "Équipe", "Points"]
-        for i, header in enumerate(headers):
+        col_x = table_x
+        for width, header in zip(col_widths, headers):
             header_text = self.subtitle_font.render(header, True, self.colors['text'])
-            header_rect = header_text.get_rect(midleft=(col_x[i] + 20, table_y + header_height // 2))
+            header_rect = header_text.get_rect(midleft=(col_x + 20, self.table_y + self.header_height // 2))
             surface.blit(header_text, header_rect)
-        
-        # Lignes du tableau (classement)
-        row_height = 30
-        drivers_standings = self.standings['driver_standings']
-        
-        for i, (driver_id, points) in enumerate(drivers_standings):
-            row_y = table_y + header_height + i * row_height
-            
-            # Alterner les couleurs de ligne
-            row_color = self.colors['row_even'] if i % 2 == 0 else self.colors['row_odd']
-            
-            # Surbrillance pour le joueur
-            if driver_id == 'player':
-                row_color = self.colors['player']
-            
-            row_rect = Rect(table_x, row_y, table_width, row_height)
-            draw.rect(surface, row_color, row_rect)
-            
-            # Position
-            pos_text = self.entry_font.render(str(i + 1), True, self.colors['text'])
-            pos_rect = pos_text.get_rect(midleft=(col_x[0] + 20, row_y + row_height // 2))
-            surface.blit(pos_text, pos_rect)
-            
-            # Nom du pilote
-            driver_info = self.season.drivers.get(driver_id, {})
-            driver_name = driver_info.get('name', 'Inconnu')
-            if driver_id == 'player':
-                driver_name += " (Vous)"
-            
-            driver_text = self.entry_font.render(driver_name, True, self.colors['text'])
-            driver_rect = driver_text.get_rect(midleft=(col_x[1] + 20, row_y + row_height // 2))
-            surface.blit(driver_text, driver_rect)
-            
-            # Équipe
-            team_name = driver_info.get('team', 'Inconnue')
-            team_text = self.entry_font.render(team_name, True, self.colors['text'])
-            team_rect = team_text.get_rect(midleft=(col_x[2] + 20, row_y + row_height // 2))
-            surface.blit(team_text, team_rect)
-            
-            # Points
-            points_text = self.entry_font.render(f"{points:.1f}", True, self.colors['text'])
-            points_rect = points_text.get_rect(midleft=(col_x[3] + 20, row_y + row_height // 2))
-            surface.blit(points_text, points_rect)
+            col_x += width
     
-    def _render_team_standings(self, surface):
+    def _render_row(self, cells, col_widths, index, highlighted):
         """
-        Dessine le classement des équipes
+        Dessine une ligne de tableau sur sa propre surface
         
         Args:
-            surface (pygame.Surface): Surface sur laquelle dessiner
+            cells (list): Textes des cellules
+            col_widths (list): Largeurs des colonnes
+            index (int): Index de la ligne
+            highlighted (bool): True pour la ligne du joueur ou de son équipe
+            
+        Returns:
+            pygame.Surface: Surface de la ligne
         """
-        # Tableau de classement
-        table_width = 600
-        table_height = 500
-        table_x = self.screen_width // 2 - table_width // 2
-        table_y = 150
+        row_surface = Surface((sum(col_widths), self.row_height))
         
-        # En-tête du tableau
-        header_height = 40
-        header_rect = Rect(table_x, table_y, table_width, header_height)
-        draw.rect(surface, self.colors['header'], header_rect)
+        # Alterner les couleurs de ligne, surbrillance pour le joueur
+        if highlighted:
+            row_color = self.colors['player']
+        else:
+            row_color = self.colors['row_even'] if index % 2 == 0 else self.colors['row_odd']
+        row_surface.fill(row_color[:3])
         
-        # Colonnes
-        col_widths = [60, 380, 160]  # Pos, Équipe, Points
-        col_x = [table_x]
-        for i in range(len(col_widths) - 1):
-            col_x.append(col_x[i] + col_widths[i])
+        col_x = 0
+        for width, cell in zip(col_widths, cells):
+            cell_text = self.entry_font.render(cell, True, self.colors['text'])
+            cell_rect = cell_text.get_rect(midleft=(col_x + 20, self.row_height // 2))
+            row_surface.blit(cell_text, cell_rect)
+            col_x += width
         
-        # Titres des colonnes
-        headers = ["Pos", "Équipe", "Points"]
-        for i, header in enumerate(headers):
-            header_text = self.subtitle_font.render(header, True, self.colors['text'])
-            header_rect = header_text.get_rect(midleft=(col_x[i] + 20, table_y + header_height // 2))
-            surface.blit(header_text, header_rect)
+        return row_surface
+    
+    def _render_driver_row(self, row, index):
+        """Dessine une ligne du classement des pilotes"""
+        position, driver_name, team_name, points, is_player = row
+        return self._render_row([str(position), driver_name, team_name, f"{points:.1f}"],
+                                self.driver_col_widths, index, is_player)
+    
+    def _render_team_row(self, row, index):
+        """Dessine une ligne du classement des équipes"""
+        position, team_name, points, is_player_team = row
+        return self._render_row([str(position), team_name, f"{points:.1f}"],
+                                self.team_col_widths, index, is_player_team)
+    
+    def _render_driver_standings(self, surface):
+        """
+        Dessine le classement des pilotes
         
-        # Lignes du tableau (classement)
-        row_height = 30
-        team_standings = self.standings['team_standings']
-        player_team = self.season.drivers['player']['team']
+        Args:
+            surface (pygame.Surface): Surface sur laquelle dessiner
+        """
+        self._render_header(surface, self.driver_table, self.driver_col_widths,
+                            ["Pos", "Pilote", "Équipe", "Points"])
+        self.driver_table.draw(surface)
+    
+    def _render_team_standings(self, surface):
+        """
+        Dessine le classement des équipes
         
-        for i, (team_name, points) in enumerate(team_standings):
-            row_y = table_y + header_height + i * row_height
-            
-            # Alterner les couleurs de ligne
-            row_color = self.colors['row_even'] if i % 2 == 0 else self.colors['row_odd']
-            
-            # Surbrillance pour l'équipe du joueur
-            if team_name == player_team:
-                row_color = self.colors['player']
-            
-            row_rect = Rect(table_x, row_y, table_width, row_height)
-            draw.rect(surface, row_color, row_rect)
-            
-            # Position
-            pos_text = self.entry_font.render(str(i + 1), True, self.colors['text'])
-            pos_rect = pos_text.get_rect(midleft=(col_x[0] + 20, row_y + row_height // 2))
-            surface.blit(pos_text, pos_rect)
-            
-            # Nom de l'équipe
-            team_text = self.entry_font.render(team_name, True, self.colors['text'])
-            team_rect = team_text.get_rect(midleft=(col_x[1] + 20, row_y + row_height // 2))
-            surface.blit(team_text, team_rect)
-            
-            # Points
-            points_text = self.entry_font.render(f"{points:.1f}", True, self.colors['text'])
-            points_rect = points_text.get_rect(midleft=(col_x[2] + 20, row_y + row_height // 2))
-            surface.blit(points_text, points_rect)
+        Args:
+            surface (pygame.Surface): Surface sur laquelle dessiner
+        """
+        self._render_header(surface, self.team_table, self.team_col_widths,
+                            ["Pos", "Équipe", "Points"])
+        self.team_table.draw(surface)
     
     def handle_event(self, event):
         """
@@ -255,6 +251,11 @@ class StandingsUI:
         Returns:
             bool: True si l'événement a été traité
         """
+        # Défilement du tableau affiché
+        table = self.driver_table if self.view_mode == 'drivers' else self.team_table
+        if table.handle_event(event):
+            return True
+        
         if event.type == pygame.MOUSEBUTTONDOWN:
             # Clic sur le bouton de basculement
             toggle_rect = Rect(self.screen_width - 150, 40, 130, 40)
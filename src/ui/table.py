@@ -0,0 +1,181 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tableau virtualisé: seules les lignes visibles sont dessinées, les lignes
+déjà rendues sont mises en cache et le défilement se fait par simple blit
+"""
+
+from collections import OrderedDict
+import pygame
+from pygame import draw, Rect, Surface
+
+class VirtualTable:
+    """Tableau défilant qui ne rend que la fenêtre visible"""
+
+    def __init__(self, rect, row_height, render_row, overscan=8, cache_size=512):
+        """
+        Initialisation du tableau
+
+        Args:
+            rect (pygame.Rect): Zone du tableau à l'écran
+            row_height (int): Hauteur d'une ligne en pixels
+            render_row (callable): Fonction (row, index) -> pygame.Surface qui dessine une ligne
+            overscan (int): Lignes rendues en plus au-dessus et au-dessous de la zone visible
+            cache_size (int): Nombre maximum de lignes gardées en cache
+        """
+        self.rect = Rect(rect)
+        self.row_height = row_height
+        self.render_row = render_row
+        self.overscan = overscan
+        self.cache_size = cache_size
+
+        self.rows = []
+        self.scroll = 0  # Décalage vertical en pixels
+
+        # Cache des lignes rendues, indexé par contenu
+        self._row_cache = OrderedDict()
+
+        # Bande pré-rendue couvrant la zone visible et ses marges
+        self._strip = None
+        self._strip_first = 0
+        self._strip_count = 0
+
+    @property
+    def content_height(self):
+        """Hauteur totale du contenu en pixels"""
+        return len(self.rows) * self.row_height
+
+    @property
+    def max_scroll(self):
+        """Décalage maximal"""
+        return max(0, self.content_height - self.rect.height)
+
+    def set_rows(self, rows):
+        """
+        Remplace le contenu du tableau
+
+        Args:
+            rows (list): Lignes (tuples hachables décrivant le contenu de chaque ligne)
+        """
+        rows = list(rows)
+        if rows == self.rows:
+            return
+
+        self.rows = rows
+        self._strip = None
+        self.scroll = min(self.scroll, self.max_scroll)
+
+    def scroll_by(self, pixels):
+        """
+        Fait défiler le tableau
+
+        Args:
+            pixels (int): Décalage (positif vers le bas)
+        """
+        self.scroll = max(0, min(self.max_scroll, self.scroll + pixels))
+
+    def scroll_to_row(self, index):
+        """
+        Fait défiler le tableau pour que la ligne donnée soit visible
+
+        Args:
+            index (int): Index de la ligne
+        """
+        top = index * self.row_height
+        if top < self.scroll:
+            self.scroll = top
+        elif top + self.row_height > self.scroll + self.rect.height:
+            self.scroll = min(self.max_scroll, top + self.row_height - self.rect.height)
+
+    def handle_event(self, event):
+        """
+        Gère la molette de la souris au-dessus du tableau
+
+        Args:
+            event (pygame.event.Event): Événement à gérer
+
+        Returns:
+            bool: True si l'événement a été traité
+        """
+        if event.type != pygame.MOUSEWHEEL:
+            return False
+
+        # Position enregistrée avec l'événement (rejeu), sinon celle du curseur
+        pos = event.dict.get('pos') or pygame.mouse.get_pos()
+        if self.rect.collidepoint(pos):
+            self.scroll_by(-event.y * self.row_height * 3)
+            return True
+        return False
+
+    def _get_row_surface(self, index):
+        """
+        Récupère la surface d'une ligne depuis le cache, ou la rend
+
+        Args:
+            index (int): Index de la ligne
+
+        Returns:
+            pygame.Surface: Surface de la ligne
+        """
+        # La parité fait partie de la clé (couleurs de lignes alternées)
+        key = (self.rows[index], index & 1)
+        row_surface = self._row_cache.get(key)
+        if row_surface is not None:
+            self._row_cache.move_to_end(key)
+            return row_surface
+
+        row_surface = self.render_row(self.rows[index], index)
+        self._row_cache[key] = row_surface
+        if len(self._row_cache) > self.cache_size:
+            self._row_cache.popitem(last=False)
+        return row_surface
+
+    def _build_strip(self, first_visible):
+        """
+        Reconstruit la bande pré-rendue autour de la première ligne visible
+
+        Args:
+            first_visible (int): Index de la première ligne visible
+        """
+        visible_rows = self.rect.height // self.row_height + 2
+        first = max(0, first_visible - self.overscan)
+        count = min(len(self.rows) - first, visible_rows + 2 * self.overscan)
+
+        if self._strip is None or self._strip.get_height() < count * self.row_height:
+            self._strip = Surface((self.rect.width, max(1, count) * self.row_height), pygame.SRCALPHA)
+        self._strip.fill((0, 0, 0, 0))
+
+        for i in range(count):
+            self._strip.blit(self._get_row_surface(first + i), (0, i * self.row_height))
+
+        self._strip_first = first
+        self._strip_count = count
+
+    def draw(self, surface):
+        """
+        Dessine la partie visible du tableau
+
+        Args:
+            surface (pygame.Surface): Surface sur laquelle dessiner
+        """
+        if not self.rows:
+            return
+
+        first_visible = self.scroll // self.row_height
+        last_visible = min(len(self.rows), (self.scroll + self.rect.height - 1) // self.row_height + 1)
+
+        # Reconstruire la bande seulement si la fenêtre visible en sort
+        if (self._strip is None or first_visible < self._strip_first
+                or last_visible > self._strip_first + self._strip_count):
+            self._build_strip(first_visible)
+
+        offset = self.scroll - self._strip_first * self.row_height
+        height = min(self.rect.height, self._strip_count * self.row_height - offset)
+        surface.blit(self._strip, self.rect.topleft, Rect(0, offset, self.rect.width, height))
+
+        # Barre de défilement si le contenu dépasse
+        if self.max_scroll > 0:
+            bar_height = max(20, self.rect.height * self.rect.height // self.content_height)
+            bar_y = self.rect.top + (self.rect.height - bar_height) * self.scroll // self.max_scroll
+            draw.rect(surface, (150, 150, 150), (self.rect.right - 6, bar_y, 4, bar_height), border_radius=2)
@@ -0,0 +1,285 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Couche de widgets retenus: état de survol mis à jour sur MOUSEMOTION,
+tests de collision via une grille spatiale et rendu mis en cache
+"""
+
+import pygame
+from pygame import font, Rect, Surface
+from src.ui.fonts import get_font
+
+class Widget:
+    """Élément d'interface retenu (position fixe, rendu mis en cache)"""
+
+    def __init__(self, x, y, width, height):
+        """
+        Initialisation du widget
+
+        Args:
+            x (int): Position horizontale
+            y (int): Position verticale
+            width (int): Largeur
+            height (int): Hauteur
+        """
+        self.rect = Rect(x, y, width, height)
+        self.is_hovered = False
+        self.dirty = True
+        self._cache = None
+
+    def mark_dirty(self):
+        """Demande un nouveau rendu du widget"""
+        self.dirty = True
+
+    def set_hovered(self, hovered):
+        """
+        Met à jour l'état de survol
+
+        Args:
+            hovered (bool): True si la souris est sur le widget
+        """
+        if hovered != self.is_hovered:
+            self.is_hovered = hovered
+            self.mark_dirty()
+
+    def click(self):
+        """
+        Réagit à un clic
+
+        Returns:
+            bool: True si le clic a été traité
+        """
+        return False
+
+    def render(self):
+        """
+        Dessine le widget sur sa propre surface (à redéfinir, par défaut une
+        surface transparente: le widget ne dessine rien mais reste cliquable)
+
+        Returns:
+            pygame.Surface: Surface du widget
+        """
+        return Surface(self.rect.size, pygame.SRCALPHA)
+
+    def draw(self, surface):
+        """
+        Dessine le widget, en ne le rendant à nouveau que s'il a changé
+
+        Args:
+            surface (pygame.Surface): Surface sur laquelle dessiner
+        """
+        if self.dirty or self._cache is None:
+            self._cache = self.render()
+            self.dirty = False
+        surface.blit(self._cache, self.rect)
+
+
+class Button(Widget):
+    """Classe pour créer des boutons interactifs"""
+
+    _font = None
+
+    def __init__(self, text, x, y, width, height, action=None, bg_color=(100, 100, 100), hover_color=(150, 150, 150)):
+        super().__init__(x, y, width, height)
+        self.text = text
+        self.action = action
+        self.bg_color = bg_color
+        self.hover_color = hover_color
+
+    @classmethod
+    def get_font(cls):
+        """Police partagée par tous les boutons"""
+        if cls._font is None:
+            font.init()
+            cls._font = get_font('Arial', 24)
+        return cls._font
+
+    def render(self):
+        button_surface = Surface(self.rect.size, pygame.SRCALPHA)
+        local_rect = button_surface.get_rect()
+
+        # Fond du bouton
+        pygame.draw.rect(button_surface, self.hover_color if self.is_hovered else self.bg_color, local_rect, border_radius=10)
+        pygame.draw.rect(button_surface, (50, 50, 50), local_rect, 2, border_radius=10)  # Bordure
+
+        # Texte du bouton
+        text_surf = self.get_font().render(self.text, True, (255, 255, 255))
+        text_rect = text_surf.get_rect(center=local_rect.center)
+        button_surface.blit(text_surf, text_rect)
+
+        return button_surface
+
+    def click(self):
+        if self.action:
+            print(f"Bouton cliqué: {self.text}")
+            self.action()
+            return True
+        return False
+
+    def handle_event(self, event):
+        """
+        Gère un événement pour un bouton isolé (hors WidgetGroup)
+
+        Args:
+            event (pygame.event.Event): Événement à gérer
+
+        Returns:
+            bool: True si le bouton a été cliqué
+        """
+        if event.type == pygame.MOUSEMOTION:
+            self.set_hovered(self.rect.collidepoint(event.pos))
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            if self.rect.collidepoint(event.pos):
+                return self.click()
+        return False
+
+
+class SpatialGrid:
+    """Index spatial en grille uniforme pour les tests de collision"""
+
+    def __init__(self, cell_size=64):
+        """
+        Initialisation de la grille
+
+        Args:
+            cell_size (int): Taille d'une cellule en pixels
+        """
+        self.cell_size = cell_size
+        self.cells = {}
+
+    def _cells_for(self, rect):
+        """Cellules couvertes par un rectangle"""
+        size = self.cell_size
+        for cx in range(rect.left // size, (rect.right - 1) // size + 1):
+            for cy in range(rect.top // size, (rect.bottom - 1) // size + 1):
+                yield (cx, cy)
+
+    def insert(self, widget):
+        """
+        Ajoute un widget à la grille
+
+        Args:
+            widget (Widget): Widget à indexer
+        """
+        for cell in self._cells_for(widget.rect):
+            self.cells.setdefault(cell, []).append(widget)
+
+    def clear(self):
+        """Vide la grille"""
+        self.cells.clear()
+
+    def query(self, pos):
+        """
+        Trouve le widget situé sous un point
+
+        Args:
+            pos (tuple): Position (x, y)
+
+        Returns:
+            Widget: Widget le plus haut sous le point, ou None
+        """
+        candidates = self.cells.get((pos[0] // self.cell_size, pos[1] // self.cell_size))
+        if not candidates:
+            return None
+
+        # Le dernier widget ajouté est dessiné au-dessus
+        for widget in reversed(candidates):
+            if widget.rect.collidepoint(pos):
+                return widget
+        return None
+
+
+class WidgetGroup:
+    """Ensemble de widgets avec survol et clics résolus par la grille spatiale"""
+
+    def __init__(self, cell_size=64):
+        """
+        Initialisation du groupe
+
+        Args:
+            cell_size (int): Taille des cellules de la grille spatiale
+        """
+        self.widgets = []
+        self.grid = SpatialGrid(cell_size)
+        self.hovered = None
+        self._needs_hover_sync = False
+
+    def __iter__(self):
+        return iter(self.widgets)
+
+    def __len__(self):
+        return len(self.widgets)
+
+    def add(self, widget):
+        """
+        Ajoute un widget au groupe
+
+        Args:
+            widget (Widget): Widget à ajouter
+        """
+        self.widgets.append(widget)
+        self.grid.insert(widget)
+        self._needs_hover_sync = True
+
+    def clear(self):
+        """Retire tous les widgets"""
+        self.widgets = []
+        self.grid.clear()
+        self.hovered = None
+
+    def widget_at(self, pos):
+        """
+        Trouve le widget situé sous un point
+
+        Args:
+            pos (tuple): Position (x, y)
+
+        Returns:
+            Widget: Widget sous le point, ou None
+        """
+        return self.grid.query(pos)
+
+    def _set_hovered(self, widget):
+        """Déplace l'état de survol vers un widget"""
+        if widget is self.hovered:
+            return
+        if self.hovered:
+            self.hovered.set_hovered(False)
+        if widget:
+            widget.set_hovered(True)
+        self.hovered = widget
+
+    def handle_event(self, event):
+        """
+        Gère un événement pour l'ensemble des widgets
+
+        Args:
+            event (pygame.event.Event): Événement à gérer
+
+        Returns:
+            bool: True si un widget a traité l'événement
+        """
+        if event.type == pygame.MOUSEMOTION:
+            self._set_hovered(self.widget_at(event.pos))
+            self._needs_hover_sync = False
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            widget = self.widget_at(event.pos)
+            if widget:
+                return widget.click()
+        return False
+
+    def draw(self, surface):
+        """
+        Dessine les widgets du groupe
+
+        Args:
+            surface (pygame.Surface): Surface sur laquelle dessiner
+        """
+        # Après une reconstruction, le survol est resynchronisé une seule fois
+        if self._needs_hover_sync:
+            self._set_hovered(self.widget_at(pygame.mouse.get_pos()))
+            self._needs_hover_sync = False
+
+        for widget in self.widgets:
+            widget.draw(surface)
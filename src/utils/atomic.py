@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Écriture atomique de fichiers: écriture dans un fichier temporaire,
+synchronisation sur le disque puis renommage, avec rotation optionnelle
+des anciennes versions
+"""
+
+import os
+
+def backup_path(path, generation):
+    """
+    Chemin d'une ancienne version d'un fichier
+
+    Args:
+        path (str): Chemin du fichier
+        generation (int): Génération (0 = version courante, 1 = précédente, ...)
+
+    Returns:
+        str: Chemin de la génération
+    """
+    return path if generation == 0 else f"{path}.{generation}"
+
+def generation_paths(path, backups):
+    """
+    Chemins de toutes les générations d'un fichier, de la plus récente à la plus ancienne
+
+    Args:
+        path (str): Chemin du fichier
+        backups (int): Nombre d'anciennes versions conservées
+
+    Returns:
+        list: Chemins des générations
+    """
+    return [backup_path(path, generation) for generation in range(backups + 1)]
+
+def _fsync_dir(directory):
+    """Synchronise un dossier (le renommage devient durable)"""
+    if not hasattr(os, 'O_DIRECTORY'):
+        return  # Non supporté (Windows)
+    fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+def atomic_write(path, chunks, backups=0):
+    """
+    Écrit un fichier de façon atomique
+
+    En cas d'interruption, le fichier vaut soit l'ancienne, soit la nouvelle
+    version, jamais un mélange des deux.
+
+    Args:
+        path (str): Chemin du fichier
+        chunks (iterable): Blocs d'octets à écrire
+        backups (int): Nombre d'anciennes versions conservées (path.1, path.2, ...)
+    """
+    tmp_path = f"{path}.tmp"
+
+    try:
+        with open(tmp_path, 'wb') as f:
+            for chunk in chunks:
+                f.write(chunk)
+            f.flush()
+            os.fsync(f.fileno())
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    # Rotation des anciennes versions (la plus ancienne est écrasée). Entre
+    # les deux renommages, la version précédente reste lisible en path.1
+    for generation in range(backups, 0, -1):
+        previous = backup_path(path, generation - 1)
+        if os.path.exists(previous):
+            os.replace(previous, backup_path(path, generation))
+
+    os.replace(tmp_path, path)
+    _fsync_dir(os.path.dirname(os.path.abspath(path)))
+
+def remove_generations(path, backups):
+    """
+    Supprime un fichier et toutes ses anciennes versions
+
+    Args:
+        path (str): Chemin du fichier
+        backups (int): Nombre d'anciennes versions conservées
+
+    Returns:
+        bool: True si au moins un fichier a été supprimé
+    """
+    removed = False
+    for generation_path in generation_paths(path, backups):
+        if os.path.exists(generation_path):
+            os.remove(generation_path)
+            removed = True
+    return removed
@@ -3,17 +3,30 @@
 
 """
 Gestion de la configuration du jeu
+
+La configuration est chargée une seule fois par un service partagé par
+tout le processus. Les modifications sont appliquées en mémoire, notifiées
+aux abonnés puis écrites sur le disque en arrière-plan (écriture atomique,
+regroupée après un court délai): le thread de rendu ne touche jamais au
+disque.
 """
 
 import os
 import json
+import time
+import atexit
+import threading
+from types import MappingProxyType
+from src.utils.atomic import atomic_write
 
-# Configuration par défaut
-DEFAULT_CONFIG = {
+# Configuration par défaut (non modifiable, les appelants reçoivent des copies)
+DEFAULT_CONFIG = MappingProxyType({
     'screen_width': 1024,
     'screen_height': 768,
     'fullscreen': False,
     'fps': 60,
+    'update_rate': 60,  # Pas de simulation par seconde
+    'idle_timeout': 500,  # Attente maximale (ms) d'un événement quand l'écran est immobile
     'sound_enabled': True,
     'sound_volume': 0.7,
     'music_enabled': True,
@@ -21,82 +34,302 @@ DEFAULT_CONFIG = {
     'difficulty': 'normal',  # 'easy', 'normal', 'hard'
     'language': 'fr',
     'first_run': True
-}
+})
 
 # Chemin du fichier de configuration
 CONFIG_PATH = os.path.join(os.path.expanduser('~'), '.drive_to_survive', 'config.json')
 
+# Délai (secondes) entre la dernière modification et l'écriture sur le disque
+WRITE_DELAY = 0.5
+
+
+class ConfigService:
+    """Configuration en mémoire avec abonnés et écriture différée"""
+
+    def __init__(self, path=CONFIG_PATH, write_delay=WRITE_DELAY):
+        """
+        Charge la configuration (une seule lecture du disque)
+
+        Args:
+            path (str): Chemin du fichier de configuration
+            write_delay (float): Délai de regroupement des écritures (secondes)
+        """
+        self.path = path
+        self.write_delay = write_delay
+        self._values = dict(DEFAULT_CONFIG)
+        self._subscribers = []  # (callback, clés suivies ou None pour toutes)
+
+        self._condition = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._dirty = False
+        self._generation = 0  # Numéro de la dernière modification
+        self._written = 0  # Numéro de la modification écrite sur le disque
+        self._deadline = 0.0
+        self._closed = False
+        self._thread = None
+
+        if os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self._values.update(json.load(f))
+            except Exception as e:
+                print(f"Erreur lors du chargement de la configuration: {e}")
+        else:
+            # Premier lancement: le fichier est créé en arrière-plan
+            self._schedule_write()
+
+    def get(self, key, default=None):
+        """
+        Valeur d'un paramètre
+
+        Args:
+            key (str): Paramètre
+            default: Valeur si le paramètre est absent
+
+        Returns:
+            Valeur du paramètre
+        """
+        with self._condition:
+            return self._values.get(key, default)
+
+    def snapshot(self):
+        """
+        Copie de la configuration (modifiable sans effet sur le service)
+
+        Returns:
+            dict: Configuration
+        """
+        with self._condition:
+            return dict(self._values)
+
+    def set(self, key, value):
+        """
+        Modifie un paramètre
+
+        Args:
+            key (str): Paramètre
+            value: Nouvelle valeur
+        """
+        self.update({key: value})
+
+    def update(self, values):
+        """
+        Modifie plusieurs paramètres, notifie les abonnés des valeurs
+        changées et planifie l'écriture
+
+        Args:
+            values (dict): Paramètres et nouvelles valeurs
+        """
+        with self._condition:
+            changes = {key: value for key, value in values.items() if self._values.get(key, object()) != value}
+            self._values.update(changes)
+
+        if changes:
+            self._schedule_write()
+            self._notify(changes)
+
+    def reset(self):
+        """Rétablit la configuration par défaut"""
+        with self._condition:
+            removed = [key for key in self._values if key not in DEFAULT_CONFIG]
+            for key in removed:
+                del self._values[key]
+        self.update(DEFAULT_CONFIG)
+        if removed:
+            self._schedule_write()
+
+    def subscribe(self, callback, keys=None):
+        """
+        Abonne une fonction aux changements de configuration
+
+        Les abonnés sont appelés sur le thread qui modifie la configuration.
+
+        Args:
+            callback (callable): Appelée avec (clé, nouvelle valeur)
+            keys (iterable, optional): Paramètres suivis. Par défaut, tous.
+        """
+        with self._condition:
+            self._subscribers.append((callback, frozenset(keys) if keys is not None else None))
+
+    def unsubscribe(self, callback):
+        """Désabonne une fonction"""
+        with self._condition:
+            self._subscribers = [(cb, keys) for cb, keys in self._subscribers if cb != callback]
+
+    def _notify(self, changes):
+        """Notifie les abonnés des paramètres modifiés"""
+        with self._condition:
+            subscribers = list(self._subscribers)
+
+        for key, value in changes.items():
+            for callback, keys in subscribers:
+                if keys is None or key in keys:
+                    try:
+                        callback(key, value)
+                    except Exception as e:
+                        print(f"Erreur lors de la notification du paramètre {key}: {e}")
+
+    def _schedule_write(self):
+        """Planifie l'écriture après le délai de regroupement"""
+        with self._condition:
+            if self._closed:
+                return
+            self._dirty = True
+            self._generation += 1
+            self._deadline = time.monotonic() + self.write_delay
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="ConfigWriter", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+
+    def _run(self):
+        """Thread d'écriture: attend la fin des modifications puis écrit"""
+        with self._condition:
+            while not self._closed:
+                if not self._dirty:
+                    self._condition.wait()
+                    continue
+
+                remaining = self._deadline - time.monotonic()
+                if remaining > 0:
+                    self._condition.wait(remaining)
+                    continue
+
+                values, generation = dict(self._values), self._generation
+                self._dirty = False
+                self._condition.release()
+                written = False
+                try:
+                    written = self._write(values, generation)
+                finally:
+                    self._condition.acquire()
+
+                if not written:
+                    self._retry_later()
+
+    def _retry_later(self):
+        """Replanifie une écriture qui a échoué (appelée avec la condition acquise)"""
+        self._dirty = True
+        self._deadline = time.monotonic() + self.write_delay
+        self._condition.notify()
+
+    def _write(self, values, generation):
+        """
+        Écrit la configuration de façon atomique
+
+        Le thread d'écriture et flush() passent tous deux par cette méthode:
+        une copie plus ancienne que la configuration déjà écrite est ignorée,
+        le fichier ne peut donc pas revenir en arrière.
+
+        Args:
+            values (dict): Configuration à écrire
+            generation (int): Numéro de la modification copiée
+
+        Returns:
+            bool: True si la configuration est à jour sur le disque, False sinon
+        """
+        with self._write_lock:
+            if generation <= self._written:
+                return True
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                atomic_write(self.path, [json.dumps(values, indent=4).encode('utf-8')])
+                self._written = generation
+                return True
+            except Exception as e:
+                print(f"Erreur lors de la sauvegarde de la configuration: {e}")
+                return False
+
+    def flush(self):
+        """
+        Écrit immédiatement les modifications en attente (fin du jeu)
+
+        Returns:
+            bool: True si la configuration est à jour sur le disque, False sinon
+        """
+        with self._condition:
+            if not self._dirty:
+                return True
+            values, generation = dict(self._values), self._generation
+            self._dirty = False
+
+        written = self._write(values, generation)
+        if not written:
+            with self._condition:
+                self._retry_later()
+        return written
+
+    def close(self):
+        """Écrit les modifications en attente puis arrête le thread d'écriture"""
+        self.flush()
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+
+
+_service = None
+_service_lock = threading.Lock()
+
+def get_config_service():
+    """
+    Service de configuration du processus (créé au premier appel)
+
+    Returns:
+        ConfigService: Service partagé
+    """
+    global _service
+
+    with _service_lock:
+        if _service is None:
+            _service = ConfigService()
+            atexit.register(_service.close)
+        return _service
+
 def load_config():
     """
     Charge la configuration du jeu
-    
+
     Returns:
-        dict: Configuration du jeu
+        dict: Copie de la configuration du jeu
     """
-    # Vérifier si le fichier de configuration existe
-    if os.path.exists(CONFIG_PATH):
-        try:
-            with open(CONFIG_PATH, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-                
-            # Fusionner avec la configuration par défaut pour les nouveaux paramètres
-            merged_config = DEFAULT_CONFIG.copy()
-            merged_config.update(config)
-            return merged_config
-        
-        except Exception as e:
-            print(f"Erreur lors du chargement de la configuration: {e}")
-            # En cas d'erreur, utiliser la configuration par défaut
-            return DEFAULT_CONFIG
-    else:
-        # Créer le fichier de configuration avec les valeurs par défaut
-        save_config(DEFAULT_CONFIG)
-        return DEFAULT_CONFIG
+    return get_config_service().snapshot()
 
 def save_config(config):
     """
-    Sauvegarde la configuration du jeu
-    
+    Sauvegarde la configuration du jeu (écriture en arrière-plan)
+
     Args:
         config (dict): Configuration à sauvegarder
-    
+
     Returns:
-        bool: True si la sauvegarde a réussi, False sinon
+        bool: True (l'écriture sur le disque est différée)
     """
-    try:
-        # Créer le dossier si nécessaire
-        os.makedirs(os.path.dirname(CONFIG_PATH), exist_ok=True)
-        
-        # Sauvegarder la configuration
-        with open(CONFIG_PATH, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=4)
-        
-        return True
-    
-    except Exception as e:
-        print(f"Erreur lors de la sauvegarde de la configuration: {e}")
-        return False
+    get_config_service().update(config)
+    return True
 
 def update_config(key, value):
     """
     Met à jour une valeur dans la configuration
-    
+
     Args:
         key (str): Clé à mettre à jour
         value: Nouvelle valeur
-    
+
     Returns:
-        bool: True si la mise à jour a réussi, False sinon
+        bool: True (l'écriture sur le disque est différée)
     """
-    config = load_config()
-    config[key] = value
-    return save_config(config)
+    get_config_service().set(key, value)
+    return True
 
 def reset_config():
     """
     Réinitialise la configuration aux valeurs par défaut
-    
+
     Returns:
-        bool: True si la réinitialisation a réussi, False sinon
+        bool: True (l'écriture sur le disque est différée)
     """
-    return save_config(DEFAULT_CONFIG)
\ No newline at end of file
+    get_config_service().reset()
+    return True
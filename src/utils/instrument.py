@@ -0,0 +1,240 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Instrumentation des chemins critiques: minuteurs et compteurs nommés,
+activés par la variable d'environnement DTS_INSTRUMENT
+
+Désactivés, les décorateurs renvoient la fonction d'origine (aucun coût).
+Activés, chaque appel alimente un histogramme lisible depuis le code et
+exportable en JSON ou au format texte Prometheus.
+
+Utilisation:
+    DTS_INSTRUMENT=1 python main.py
+"""
+
+import os
+import json
+import time
+import atexit
+import datetime
+import threading
+from functools import wraps
+
+# Instrumentation activée pour toute la durée du processus
+ENABLED = os.environ.get('DTS_INSTRUMENT', '') not in ('', '0')
+
+# Dossier des exports
+METRICS_DIR = os.path.join(os.path.expanduser('~'), '.drive_to_survive', 'metrics')
+
+# Bornes (ms) des barres des histogrammes
+TIMER_BOUNDS = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 1000)
+
+
+class Histogram:
+    """Distribution des durées d'un minuteur"""
+
+    def __init__(self, bounds=TIMER_BOUNDS):
+        self.bounds = bounds
+        self.buckets = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def observe(self, value):
+        """
+        Ajoute une mesure
+
+        Args:
+            value (float): Durée (ms)
+        """
+        bucket = len(self.bounds)
+        for i, bound in enumerate(self.bounds):
+            if value <= bound:
+                bucket = i
+                break
+        self.buckets[bucket] += 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def to_dict(self):
+        """Statistiques de l'histogramme"""
+        return {
+            'count': self.count,
+            'total_ms': self.total,
+            'mean_ms': self.total / self.count if self.count else 0.0,
+            'min_ms': self.min,
+            'max_ms': self.max,
+            'bounds_ms': list(self.bounds),
+            'buckets': list(self.buckets)
+        }
+
+
+class Metrics:
+    """Minuteurs et compteurs nommés (partagés entre les threads)"""
+
+    def __init__(self):
+        self.timers = {}
+        self.counters = {}
+        self.lock = threading.Lock()
+
+    def observe(self, name, duration_ms):
+        """Enregistre la durée d'un appel"""
+        with self.lock:
+            histogram = self.timers.get(name)
+            if histogram is None:
+                histogram = self.timers[name] = Histogram()
+            histogram.observe(duration_ms)
+
+    def increment(self, name, amount=1):
+        """Incrémente un compteur"""
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def reset(self):
+        """Remet les mesures à zéro"""
+        with self.lock:
+            self.timers = {}
+            self.counters = {}
+
+    def snapshot(self):
+        """
+        Copie des mesures
+
+        Returns:
+            dict: {'timers': {nom: statistiques}, 'counters': {nom: valeur}}
+        """
+        with self.lock:
+            return {
+                'timers': {name: histogram.to_dict() for name, histogram in self.timers.items()},
+                'counters': dict(self.counters)
+            }
+
+    def to_prometheus(self):
+        """
+        Mesures au format texte Prometheus
+
+        Returns:
+            str: Texte d'exposition
+        """
+        data = self.snapshot()
+        lines = [
+            "# HELP dts_call_duration_ms Durée des appels instrumentés",
+            "# TYPE dts_call_duration_ms histogram"
+        ]
+        for name, timer in sorted(data['timers'].items()):
+            cumulative = 0
+            for bound, count in zip(timer['bounds_ms'], timer['buckets']):
+                cumulative += count
+                lines.append(f'dts_call_duration_ms_bucket{{name="{name}",le="{bound}"}} {cumulative}')
+            lines.append(f'dts_call_duration_ms_bucket{{name="{name}",le="+Inf"}} {timer["count"]}')
+            lines.append(f'dts_call_duration_ms_sum{{name="{name}"}} {timer["total_ms"]:.6f}')
+            lines.append(f'dts_call_duration_ms_count{{name="{name}"}} {timer["count"]}')
+
+        lines.append("# HELP dts_events_total Compteurs instrumentés")
+        lines.append("# TYPE dts_events_total counter")
+        for name, value in sorted(data['counters'].items()):
+            lines.append(f'dts_events_total{{name="{name}"}} {value}')
+        return "\n".join(lines) + "\n"
+
+    def dump(self, path=None, fmt='json'):
+        """
+        Écrit les mesures dans un fichier local
+
+        Args:
+            path (str, optional): Chemin du fichier. Par défaut, un fichier horodaté dans METRICS_DIR.
+            fmt (str): 'json' ou 'prometheus'
+
+        Returns:
+            str: Chemin du fichier écrit ou None en cas d'erreur
+        """
+        try:
+            if path is None:
+                os.makedirs(METRICS_DIR, exist_ok=True)
+                timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+                extension = 'prom' if fmt == 'prometheus' else 'json'
+                path = os.path.join(METRICS_DIR, f"metrics_{timestamp}_{os.getpid()}.{extension}")
+
+            with open(path, 'w', encoding='utf-8') as f:
+                if fmt == 'prometheus':
+                    f.write(self.to_prometheus())
+                else:
+                    json.dump(self.snapshot(), f, indent=2)
+            return path
+        except Exception as e:
+            print(f"Erreur lors de l'export des mesures: {e}")
+            return None
+
+
+# Mesures du processus
+METRICS = Metrics()
+
+def timed(name):
+    """
+    Décorateur: mesure la durée de chaque appel
+
+    Args:
+        name (str): Nom du minuteur
+
+    Returns:
+        function: Décorateur (identité si l'instrumentation est désactivée)
+    """
+    def decorator(function):
+        if not ENABLED:
+            return function
+
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                METRICS.observe(name, (time.perf_counter() - start) * 1000)
+        return wrapper
+    return decorator
+
+def counted(name):
+    """
+    Décorateur: compte les appels
+
+    Args:
+        name (str): Nom du compteur
+
+    Returns:
+        function: Décorateur (identité si l'instrumentation est désactivée)
+    """
+    def decorator(function):
+        if not ENABLED:
+            return function
+
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            METRICS.increment(name)
+            return function(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def count(name, amount=1):
+    """
+    Incrémente un compteur (sans effet si l'instrumentation est désactivée)
+
+    Args:
+        name (str): Nom du compteur
+        amount (int): Incrément
+    """
+    if ENABLED:
+        METRICS.increment(name, amount)
+
+def _dump_at_exit():
+    """Export JSON et Prometheus des mesures en fin de processus"""
+    if METRICS.timers or METRICS.counters:
+        for fmt in ('json', 'prometheus'):
+            path = METRICS.dump(fmt=fmt)
+            if path:
+                print(f"Mesures exportées: {path}")
+
+if ENABLED:
+    atexit.register(_dump_at_exit)
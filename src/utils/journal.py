@@ -0,0 +1,233 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Journal d'auto-sauvegarde: les changements entre deux sauvegardes
+complètes sont ajoutés en fin de fichier sous forme de petits
+enregistrements, rejoués au chargement
+"""
+
+import os
+import struct
+import zlib
+from src.utils.serialization import RecordWriter, RecordReader
+
+# En-tête du fichier: signature + identifiant de la sauvegarde de base
+JOURNAL_MAGIC = b'DTSJRNL1'
+JOURNAL_PREFIX = struct.Struct('<8sQ')
+
+# En-tête de chaque enregistrement: taille + somme de contrôle
+RECORD_PREFIX = struct.Struct('<II')
+
+# Au-delà de cette taille (octets), l'auto-sauvegarde suivante est complète
+COMPACT_THRESHOLD = 32 * 1024
+
+# Champs conservés par opération (None = tous)
+JOURNAL_FIELDS = {
+    'update_stats': None,
+    'complete_race': ('record',)
+}
+
+def _replay_update_stats(save_data, args):
+    save_data['player'].update_stats(args)
+
+def _replay_complete_race(save_data, args):
+    save_data['career'].current_season.complete_race(args)
+
+# Rejeu des opérations sur les données chargées
+REPLAY_OPS = {
+    'update_stats': _replay_update_stats,
+    'complete_race': _replay_complete_race
+}
+
+def structure_key(player, career):
+    """
+    Résumé des éléments de la carrière qui ne sont pas journalisés
+
+    Si ce résumé change (fin de saison, promotion, contrat...), le journal ne
+    suffit plus et une sauvegarde complète est nécessaire.
+
+    Args:
+        player (Player): Joueur
+        career (CareerPath): Carrière
+
+    Returns:
+        tuple: Résumé comparable
+    """
+    return (
+        career.current_year,
+        career.current_season.year if career.current_season else None,
+        player.category,
+        player.team.name if player.team else None,
+        player.academy.name if player.academy else None,
+        player.contract_value
+    )
+
+def encode_record(op, args):
+    """
+    Encode une opération du journal
+
+    Args:
+        op (str): Nom de l'opération
+        args (dict): Arguments de l'opération
+
+    Returns:
+        bytes: Enregistrement (en-tête compris)
+    """
+    fields = JOURNAL_FIELDS[op]
+    if fields is not None:
+        args = {key: args[key] for key in fields if key in args}
+
+    w = RecordWriter()
+    w.write_str(op)
+    w.write_value(args)
+    body = w.getvalue()
+    return RECORD_PREFIX.pack(len(body), zlib.crc32(body)) + body
+
+def append_records(path, journal_id, records):
+    """
+    Ajoute des enregistrements à la fin du journal
+
+    Le journal est recréé s'il appartient à une autre sauvegarde de base.
+
+    Args:
+        path (str): Chemin du journal
+        journal_id (int): Identifiant de la sauvegarde de base
+        records (list): Enregistrements encodés
+
+    Returns:
+        int: Taille du journal après l'ajout
+    """
+    prefix = JOURNAL_PREFIX.pack(JOURNAL_MAGIC, journal_id)
+
+    mode = 'ab'
+    if os.path.exists(path):
+        with open(path, 'rb') as f:
+            if f.read(JOURNAL_PREFIX.size) != prefix:
+                mode = 'wb'
+    else:
+        mode = 'wb'
+
+    with open(path, mode) as f:
+        if mode == 'wb':
+            f.write(prefix)
+        for record in records:
+            f.write(record)
+        f.flush()
+        os.fsync(f.fileno())
+        return f.tell()
+
+def read_journal(path, journal_id):
+    """
+    Lit les opérations du journal d'une sauvegarde de base
+
+    La lecture s'arrête au premier enregistrement incomplet ou invalide
+    (écriture interrompue).
+
+    Args:
+        path (str): Chemin du journal
+        journal_id (int): Identifiant de la sauvegarde de base
+
+    Returns:
+        list: Opérations (nom, arguments), vide si le journal appartient à une autre base
+    """
+    if not os.path.exists(path):
+        return []
+
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    if data[:JOURNAL_PREFIX.size] != JOURNAL_PREFIX.pack(JOURNAL_MAGIC, journal_id):
+        return []
+
+    ops = []
+    pos = JOURNAL_PREFIX.size
+    while pos + RECORD_PREFIX.size <= len(data):
+        size, crc = RECORD_PREFIX.unpack_from(data, pos)
+        body = data[pos + RECORD_PREFIX.size:pos + RECORD_PREFIX.size + size]
+        if len(body) < size or zlib.crc32(body) != crc:
+            break
+
+        r = RecordReader(body)
+        op = r.read_str()
+        ops.append((op, r.read_value()))
+        pos += RECORD_PREFIX.size + size
+
+    return ops
+
+def replay(save_data, ops):
+    """
+    Rejoue les opérations du journal sur des données chargées
+
+    Args:
+        save_data (dict): Données chargées ('player', 'career')
+        ops (list): Opérations renvoyées par read_journal
+    """
+    for op, args in ops:
+        REPLAY_OPS[op](save_data, args)
+
+
+class CareerJournal:
+    """Opérations enregistrées depuis la dernière sauvegarde complète"""
+
+    def __init__(self, threshold=COMPACT_THRESHOLD):
+        """
+        Initialisation du journal
+
+        Args:
+            threshold (int): Taille maximale du journal avant compaction
+        """
+        self.threshold = threshold
+        self.pending = []
+        self.base_id = None
+        self.base_key = None
+        self.size = 0
+
+    def record(self, op, args):
+        """
+        Enregistre une opération (encodée immédiatement, les arguments peuvent ensuite changer)
+
+        Args:
+            op (str): Nom de l'opération
+            args (dict): Arguments de l'opération
+        """
+        self.pending.append(encode_record(op, args))
+
+    def can_append(self, player, career):
+        """
+        Indique si l'auto-sauvegarde peut se limiter à un ajout au journal
+
+        Args:
+            player (Player): Joueur
+            career (CareerPath): Carrière
+
+        Returns:
+            bool: True si le journal suffit
+        """
+        return (self.base_id is not None
+                and self.size < self.threshold
+                and structure_key(player, career) == self.base_key)
+
+    def take_pending(self):
+        """
+        Récupère et vide les opérations en attente
+
+        Returns:
+            list: Enregistrements encodés
+        """
+        records, self.pending = self.pending, []
+        self.size += sum(len(record) for record in records)
+        return records
+
+    def reset(self, base_id=None, base_key=None):
+        """
+        Repart d'une nouvelle sauvegarde de base
+
+        Args:
+            base_id (int, optional): Identifiant de la sauvegarde de base (None = aucune)
+            base_key (tuple, optional): Résumé de la carrière au moment de la sauvegarde
+        """
+        self.pending = []
+        self.base_id = base_id
+        self.base_key = base_key
+        self.size = JOURNAL_PREFIX.size
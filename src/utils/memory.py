@@ -0,0 +1,217 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Suivi de la mémoire au fil d'une carrière (tracemalloc), activé par la
+variable d'environnement DTS_MEMTRACK
+
+Un relevé est pris à la fin de chaque course et à chaque changement de
+saison: croissance des allocations par fichier et ligne depuis le relevé
+précédent et depuis le premier, et nombre d'objets des classes suivies.
+Le rapport est écrit sur le disque en fin de processus.
+
+Utilisation:
+    DTS_MEMTRACK=1 python main.py
+    DTS_MEMTRACK=1 python -m src.career.simulator --careers 1 --workers 1
+"""
+
+import os
+import gc
+import atexit
+import datetime
+import tracemalloc
+from collections import Counter
+
+# Suivi activé pour toute la durée du processus
+ENABLED = os.environ.get('DTS_MEMTRACK', '') not in ('', '0')
+
+# Dossier des rapports
+MEMORY_DIR = os.path.join(os.path.expanduser('~'), '.drive_to_survive', 'memory')
+
+# Profondeur des piles enregistrées par tracemalloc
+TRACEBACK_DEPTH = 1
+
+# Lignes les plus en croissance rapportées à chaque relevé
+TOP_LINES = 10
+
+# Classes dont les instances sont comptées
+# (les pygame.Surface ne sont pas suivies par le ramasse-miettes, voir
+# les compteurs du profileur de frames)
+TRACKED_TYPES = ('Race', 'Season', 'AIDriver')
+
+
+def count_objects(type_names=TRACKED_TYPES):
+    """
+    Compte les objets suivis par le ramasse-miettes, par nom de classe
+
+    Les sous-classes sont comptées avec leur classe de base suivie. Les
+    objets sans référence vers d'autres objets Python ne sont pas suivis
+    par le ramasse-miettes et ne peuvent pas être comptés ainsi.
+
+    Args:
+        type_names (tuple): Noms des classes à compter
+
+    Returns:
+        dict: Nom de classe -> nombre d'instances
+    """
+    counts = Counter({name: 0 for name in type_names})
+    wanted = set(type_names)
+    for obj in gc.get_objects():
+        for cls in type(obj).__mro__:
+            if cls.__name__ in wanted:
+                counts[cls.__name__] += 1
+                break
+    return dict(counts)
+
+
+class MemoryTracker:
+    """Relevés tracemalloc aux points de passage de la carrière"""
+
+    def __init__(self, top_lines=TOP_LINES):
+        """
+        Initialisation du suivi
+
+        Args:
+            top_lines (int): Nombre de lignes rapportées par relevé
+        """
+        self.top_lines = top_lines
+        self.first_snapshot = None
+        self.last_snapshot = None
+        self.checkpoints = []
+
+    def start(self):
+        """Démarre tracemalloc (si ce n'est pas déjà fait)"""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(TRACEBACK_DEPTH)
+
+    def _filtered_snapshot(self):
+        """Relevé sans les allocations de tracemalloc et de l'import des modules"""
+        return tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+            tracemalloc.Filter(False, "<unknown>")
+        ))
+
+    def checkpoint(self, label):
+        """
+        Prend un relevé
+
+        Args:
+            label (str): Point de passage (fin de course, fin de saison...)
+
+        Returns:
+            dict: Relevé (mémoire courante et pic, objets, croissance par ligne)
+        """
+        self.start()
+        snapshot = self._filtered_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+
+        growth = []
+        if self.last_snapshot is not None:
+            growth = [
+                (str(stat.traceback[0]), stat.size_diff, stat.count_diff)
+                for stat in snapshot.compare_to(self.last_snapshot, 'lineno')[:self.top_lines]
+                if stat.size_diff > 0
+            ]
+
+        checkpoint = {
+            'label': label,
+            'time': datetime.datetime.now().strftime("%H:%M:%S"),
+            'current': current,
+            'peak': peak,
+            'objects': count_objects(),
+            'growth': growth
+        }
+        self.checkpoints.append(checkpoint)
+
+        if self.first_snapshot is None:
+            self.first_snapshot = snapshot
+        self.last_snapshot = snapshot
+        return checkpoint
+
+    def total_growth(self):
+        """
+        Croissance par ligne entre le premier et le dernier relevé
+
+        Returns:
+            list: (fichier:ligne, octets, allocations) des lignes les plus en croissance
+        """
+        if self.first_snapshot is None or self.last_snapshot is self.first_snapshot:
+            return []
+        return [
+            (str(stat.traceback[0]), stat.size_diff, stat.count_diff)
+            for stat in self.last_snapshot.compare_to(self.first_snapshot, 'lineno')[:self.top_lines]
+            if stat.size_diff > 0
+        ]
+
+    def format_report(self):
+        """
+        Rapport texte des relevés
+
+        Returns:
+            str: Rapport
+        """
+        lines = ["Suivi mémoire Drive to Survive", ""]
+        for checkpoint in self.checkpoints:
+            objects = ", ".join(f"{name}={count}" for name, count in checkpoint['objects'].items())
+            lines.append(f"[{checkpoint['time']}] {checkpoint['label']}: "
+                         f"{checkpoint['current'] / 1024:.1f} Ko (pic {checkpoint['peak'] / 1024:.1f} Ko) - {objects}")
+            for location, size, count in checkpoint['growth']:
+                lines.append(f"    +{size / 1024:.1f} Ko (+{count} allocations) {location}")
+
+        lines.append("")
+        lines.append("Croissance depuis le premier relevé:")
+        for location, size, count in self.total_growth():
+            lines.append(f"    +{size / 1024:.1f} Ko (+{count} allocations) {location}")
+        return "\n".join(lines) + "\n"
+
+    def write_report(self, path=None):
+        """
+        Écrit le rapport sur le disque
+
+        Args:
+            path (str, optional): Chemin du fichier. Par défaut, un fichier horodaté dans MEMORY_DIR.
+
+        Returns:
+            str: Chemin du fichier écrit ou None en cas d'erreur
+        """
+        try:
+            if path is None:
+                os.makedirs(MEMORY_DIR, exist_ok=True)
+                timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+                path = os.path.join(MEMORY_DIR, f"memory_{timestamp}_{os.getpid()}.txt")
+
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(self.format_report())
+            return path
+        except Exception as e:
+            print(f"Erreur lors de l'écriture du rapport mémoire: {e}")
+            return None
+
+
+# Suivi du processus
+TRACKER = MemoryTracker()
+
+def checkpoint(label):
+    """
+    Prend un relevé (sans effet si le suivi est désactivé)
+
+    Args:
+        label (str): Point de passage
+    """
+    if ENABLED:
+        TRACKER.checkpoint(label)
+
+def _report_at_exit():
+    """Écrit le rapport en fin de processus"""
+    if TRACKER.checkpoints:
+        path = TRACKER.write_report()
+        if path:
+            print(f"Rapport mémoire: {path}")
+
+if ENABLED:
+    # Démarré à l'import pour que les allocations des premiers objets soient suivies
+    TRACKER.start()
+    atexit.register(_report_at_exit)
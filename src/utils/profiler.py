@@ -0,0 +1,218 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Profileur de frames: temps par phase de la boucle de jeu et compteurs
+d'allocations (rendus de texte, surfaces) par frame
+
+Les compteurs remplacent les constructeurs de polices et de surfaces des
+interfaces: ils ne sont installés qu'à la demande (variable
+d'environnement DTS_PROFILE ou rejeu d'un enregistrement).
+
+Utilisation:
+    DTS_PROFILE=1 python main.py
+"""
+
+import os
+import csv
+import time
+import datetime
+from collections import deque
+import pygame
+import src.ui.fonts
+from src.utils.stats import percentile
+
+# Phases mesurées dans la boucle de jeu
+PHASES = ('events', 'update', 'render', 'flip')
+
+# Bornes (ms) des barres de l'histogramme des temps de frame
+HISTOGRAM_BOUNDS = (2, 4, 8, 12, 16.7, 20, 25, 33.3, 50)
+
+# Dossier des exports CSV
+PROFILE_DIR = os.path.join(os.path.expanduser('~'), '.drive_to_survive', 'profiles')
+
+# Compteurs d'allocations installés au démarrage du jeu
+COUNTERS_ENABLED = os.environ.get('DTS_PROFILE', '') not in ('', '0')
+
+# Compteurs d'allocations de la frame en cours
+COUNTERS = {
+    'text_renders': 0,
+    'surfaces': 0
+}
+
+class CountingFont(pygame.font.Font):
+    """Police qui compte ses rendus de texte"""
+
+    def render(self, *args, **kwargs):
+        COUNTERS['text_renders'] += 1
+        return super().render(*args, **kwargs)
+
+
+class CountingSurface(pygame.Surface):
+    """Surface qui compte ses allocations"""
+
+    def __init__(self, *args, **kwargs):
+        COUNTERS['surfaces'] += 1
+        super().__init__(*args, **kwargs)
+
+
+def _counting_font_constructor(fontpath, size, bold, italic):
+    """Constructeur de police pour pygame.font.SysFont"""
+    font = CountingFont(fontpath, size)
+    if bold:
+        font.set_bold(True)
+    if italic:
+        font.set_italic(True)
+    return font
+
+_installed = False
+
+def install_counters(*modules):
+    """
+    Installe les compteurs de rendus de texte et d'allocations de surfaces
+
+    Les polices créées par pygame.font.SysFont ou par le résolveur de
+    polices (src.ui.fonts) après l'appel sont comptées: l'appel doit donc
+    précéder la création des interfaces.
+    Le nom Surface des modules donnés est remplacé par une surface comptée.
+
+    Args:
+        *modules: Modules dont les allocations de Surface doivent être comptées
+    """
+    global _installed
+
+    if not _installed:
+        sys_font = pygame.font.SysFont
+
+        def counting_sys_font(name, size, bold=False, italic=False, constructor=None):
+            return sys_font(name, size, bold, italic, constructor or _counting_font_constructor)
+
+        pygame.font.SysFont = counting_sys_font
+        src.ui.fonts.FONT_CONSTRUCTOR = _counting_font_constructor
+        _installed = True
+
+    for module in modules:
+        if getattr(module, 'Surface', None) is pygame.Surface:
+            module.Surface = CountingSurface
+
+class FrameProfiler:
+    """Mesures glissantes des temps de frame"""
+
+    def __init__(self, history=600):
+        """
+        Initialisation du profileur
+
+        Args:
+            history (int): Nombre de frames conservées
+        """
+        self.frames = deque(maxlen=history)
+        self.frame_index = 0
+        self.screen = ''
+        self.timings = dict.fromkeys(PHASES, 0.0)
+        self._phase_start = 0.0
+
+    def begin_frame(self, screen=''):
+        """
+        Démarre une nouvelle frame
+
+        Args:
+            screen (str): Nom de l'écran actif
+        """
+        self.screen = screen
+        for phase in PHASES:
+            self.timings[phase] = 0.0
+        COUNTERS['text_renders'] = 0
+        COUNTERS['surfaces'] = 0
+
+    def start(self, phase):
+        """Démarre la mesure d'une phase"""
+        self._phase_start = time.perf_counter()
+
+    def stop(self, phase):
+        """Termine la mesure d'une phase"""
+        self.timings[phase] += (time.perf_counter() - self._phase_start) * 1000
+
+    def end_frame(self):
+        """Enregistre la frame terminée dans l'historique"""
+        total = sum(self.timings.values())
+        self.frames.append((
+            self.frame_index,
+            self.screen,
+            *(self.timings[phase] for phase in PHASES),
+            total,
+            COUNTERS['text_renders'],
+            COUNTERS['surfaces']
+        ))
+        self.frame_index += 1
+
+    def get_stats(self):
+        """
+        Calcule les statistiques sur l'historique
+
+        Returns:
+            dict: Statistiques par phase (moyenne, p50, p95, p99), histogramme
+                  des temps de frame et compteurs de la dernière frame
+        """
+        stats = {'phases': {}, 'frames': len(self.frames)}
+
+        columns = PHASES + ('total',)
+        for i, name in enumerate(columns):
+            values = sorted(frame[2 + i] for frame in self.frames)
+            stats['phases'][name] = {
+                'mean': sum(values) / len(values) if values else 0.0,
+                'p50': percentile(values, 50),
+                'p95': percentile(values, 95),
+                'p99': percentile(values, 99)
+            }
+
+        # Histogramme des temps de frame
+        histogram = [0] * (len(HISTOGRAM_BOUNDS) + 1)
+        for frame in self.frames:
+            total = frame[2 + len(PHASES)]
+            bucket = len(HISTOGRAM_BOUNDS)
+            for j, bound in enumerate(HISTOGRAM_BOUNDS):
+                if total < bound:
+                    bucket = j
+                    break
+            histogram[bucket] += 1
+        stats['histogram'] = histogram
+
+        last = self.frames[-1] if self.frames else None
+        stats['text_renders'] = last[-2] if last else 0
+        stats['surfaces'] = last[-1] if last else 0
+        stats['counting'] = _installed
+
+        return stats
+
+    def export_csv(self, path=None):
+        """
+        Exporte l'historique des frames au format CSV
+
+        Args:
+            path (str, optional): Chemin du fichier. Par défaut, un fichier horodaté dans PROFILE_DIR.
+
+        Returns:
+            str: Chemin du fichier écrit ou None en cas d'erreur
+        """
+        try:
+            if path is None:
+                os.makedirs(PROFILE_DIR, exist_ok=True)
+                timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+                path = os.path.join(PROFILE_DIR, f"frames_{timestamp}.csv")
+
+            with open(path, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(['frame', 'screen'] + [f"{phase}_ms" for phase in PHASES]
+                                + ['total_ms', 'text_renders', 'surfaces'])
+                for frame in self.frames:
+                    writer.writerow([
+                        frame[0], frame[1],
+                        *(f"{value:.3f}" for value in frame[2:3 + len(PHASES)]),
+                        frame[-2], frame[-1]
+                    ])
+
+            return path
+
+        except Exception as e:
+            print(f"Erreur lors de l'export du profil: {e}")
+            return None
@@ -0,0 +1,265 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Sessions de profilage scriptées: un scénario reproductible (nouvelle
+carrière, N courses, fin de saison, sauvegarde et chargement) exécuté sous
+cProfile et sous un profileur par échantillonnage
+
+Chaque session écrit un fichier pstats (python -m pstats, snakeviz...) et
+un fichier de piles agrégées (une ligne "f1;f2;f3 n" par pile) lisible
+par flamegraph.pl, speedscope ou inferno.
+"""
+
+import os
+import sys
+import time
+import pstats
+import random
+import cProfile
+import datetime
+import tempfile
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from src.utils import save_load
+from src.career import history
+from src.player import Player
+from src.career.career_path import CareerPath
+
+# Dossier des sessions de profilage
+PROFILE_DIR = os.path.join(os.path.expanduser('~'), '.drive_to_survive', 'profiles')
+
+# Intervalle d'échantillonnage des piles (secondes)
+SAMPLE_INTERVAL = 0.001
+
+# Nombre de courses du scénario par défaut
+DEFAULT_RACES = 3
+
+
+class StackSampler:
+    """Profileur par échantillonnage: relève la pile d'un thread à intervalle fixe"""
+
+    def __init__(self, interval=SAMPLE_INTERVAL, thread_id=None):
+        """
+        Initialisation de l'échantillonneur
+
+        Args:
+            interval (float): Intervalle entre deux relevés (secondes)
+            thread_id (int, optional): Thread observé. Par défaut, le thread appelant.
+        """
+        self.interval = interval
+        self.thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = None
+        self._switch_interval = None
+
+    @staticmethod
+    def _label(code):
+        """Nom d'une frame dans les piles agrégées"""
+        return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+    def start(self):
+        """Démarre l'échantillonnage"""
+        # Le thread principal rend la main au moins à chaque intervalle d'échantillonnage
+        self._switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(min(self._switch_interval, self.interval))
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="StackSampler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Arrête l'échantillonnage"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._switch_interval is not None:
+            sys.setswitchinterval(self._switch_interval)
+            self._switch_interval = None
+
+    def _run(self):
+        """Boucle d'échantillonnage"""
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                stack.append(self._label(frame.f_code))
+                frame = frame.f_back
+            if stack:
+                self.stacks[tuple(reversed(stack))] += 1
+
+    def write_collapsed(self, path):
+        """
+        Écrit les piles agrégées (format "collapsed" de flamegraph.pl)
+
+        Args:
+            path (str): Chemin du fichier
+        """
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, count in sorted(self.stacks.items()):
+                f.write(f"{';'.join(stack)} {count}\n")
+
+
+@contextmanager
+def temporary_storage(prefix="dts_profile_"):
+    """
+    Redirige les sauvegardes et les bases d'historique vers un dossier
+    temporaire (les emplacements et l'historique du joueur restent intacts)
+
+    Args:
+        prefix (str): Préfixe du nom du dossier temporaire
+    """
+    previous = (save_load.SAVE_DIR, history.HISTORY_DIR)
+    with tempfile.TemporaryDirectory(prefix=prefix) as directory:
+        save_load.SAVE_DIR = os.path.join(directory, 'saves')
+        history.HISTORY_DIR = os.path.join(directory, 'history')
+        try:
+            yield directory
+        finally:
+            save_load.SAVE_DIR, history.HISTORY_DIR = previous
+
+def profile_session(scenario, name, output_dir=None, interval=SAMPLE_INTERVAL):
+    """
+    Exécute un scénario sous cProfile et sous l'échantillonneur de piles
+
+    Args:
+        scenario (callable): Scénario à profiler (sans argument)
+        name (str): Préfixe des fichiers écrits
+        output_dir (str, optional): Dossier de sortie. Par défaut, PROFILE_DIR.
+        interval (float): Intervalle d'échantillonnage (secondes)
+
+    Returns:
+        dict: Chemins des fichiers écrits ('pstats', 'collapsed') ou None en cas d'erreur
+    """
+    output_dir = output_dir or PROFILE_DIR
+    profiler = cProfile.Profile()
+    sampler = StackSampler(interval)
+
+    sampler.start()
+    profiler.enable()
+    start = time.perf_counter()
+    try:
+        scenario()
+    finally:
+        elapsed = time.perf_counter() - start
+        profiler.disable()
+        sampler.stop()
+
+    try:
+        os.makedirs(output_dir, exist_ok=True)
+        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        paths = {
+            'pstats': os.path.join(output_dir, f"{name}_{timestamp}.pstats"),
+            'collapsed': os.path.join(output_dir, f"{name}_{timestamp}.folded")
+        }
+        profiler.dump_stats(paths['pstats'])
+        sampler.write_collapsed(paths['collapsed'])
+    except Exception as e:
+        print(f"Erreur lors de l'export du profil: {e}")
+        return None
+
+    print(f"Scénario '{name}' exécuté en {elapsed:.2f} s ({sum(sampler.stacks.values())} échantillons)")
+    pstats.Stats(profiler).sort_stats('cumulative').print_stats(15)
+    print(f"Profil: {paths['pstats']}")
+    print(f"Piles agrégées: {paths['collapsed']}")
+    return paths
+
+def _play_races(career, races):
+    """Dispute jusqu'à `races` courses de la saison en cours, sans interface"""
+    season = career.current_season
+    player = career.player
+
+    for _ in range(races):
+        race_info = season.get_next_race()
+        if race_info is None:
+            break
+        results = race_info["race_obj"].simulate_race()
+        season.complete_race(results)
+        player.update_stats({
+            'position': results['player_position'],
+            'points': results['points'],
+            'prize_money': results['prize_money'],
+            'skill_improvements': results['skill_improvements']
+        })
+
+def _end_season_and_reload(career):
+    """Fin de saison, nouvelle saison, puis sauvegarde et chargement (dossier temporaire)"""
+    career.player.advance_year()
+    career.end_season()
+    career.start_new_season()
+
+    save_load.save_game({'player': career.player, 'career': career}, slot=1)
+    loaded = save_load.load_game(slot=1)
+
+    # La base du dossier temporaire est fermée avant sa suppression
+    if loaded is not None:
+        loaded['career'].history.close()
+    return loaded
+
+def run_headless_scenario(races=DEFAULT_RACES, seed=0):
+    """
+    Scénario sans interface: nouvelle carrière, N courses, fin de saison,
+    sauvegarde et chargement
+
+    Args:
+        races (int): Nombre de courses disputées avant la fin de saison
+        seed (int): Graine du générateur aléatoire
+
+    Returns:
+        dict: Données rechargées en fin de scénario
+    """
+    random.seed(seed)
+    with temporary_storage():
+        player = Player("Pilote profilé", 16)
+        career = CareerPath(player, history_path=':memory:')
+        career.start_career(career.academies[0])
+        try:
+            _play_races(career, races)
+            loaded = _end_season_and_reload(career)
+        finally:
+            career.history.close()
+
+    return loaded
+
+def run_ui_scenario(game, races=DEFAULT_RACES, seed=0):
+    """
+    Scénario avec interface: le même parcours que run_headless_scenario,
+    les courses étant disputées tour par tour par l'interface de course
+    avec un rendu à chaque tour
+
+    Args:
+        game (Game): Jeu (écran initialisé)
+        races (int): Nombre de courses disputées avant la fin de saison
+        seed (int): Graine du générateur aléatoire
+
+    Returns:
+        dict: Données rechargées en fin de scénario
+    """
+    random.seed(seed)
+    with temporary_storage():
+        game.new_game()
+        game.career.history_path = ':memory:'
+        game.career_ui.start_career_with_academy(game.career.academies[0])
+        game.render()
+
+        season = game.career.current_season
+        for _ in range(min(races, len(season.race_calendar))):
+            game.career_ui.start_race(season.current_race_index)
+            race_ui = game.race_ui
+            while not race_ui.race_finished:
+                race_ui._advance_lap()
+                game.render()
+            game.current_state = 1  # Retour à l'interface de carrière
+            game.update()
+            game.render()
+
+        # Les auto-sauvegardes des courses sont écrites dans le dossier temporaire
+        game.save_writer.flush()
+        try:
+            loaded = _end_season_and_reload(game.career)
+        finally:
+            game.career.history.close()
+
+    return loaded
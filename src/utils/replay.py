@@ -0,0 +1,214 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Enregistrement des entrées du joueur et rejeu sans écran
+
+Un enregistrement contient la graine du générateur aléatoire puis, pour
+chaque frame, les événements pygame et le nombre de pas de simulation
+exécutés. Le rejeu applique les mêmes événements et les mêmes pas à chaque
+frame (en lockstep, indépendamment de la vitesse de la machine), ce qui
+reproduit la partie et permet de mesurer les temps de mise à jour et de
+rendu de chaque frame.
+
+Utilisation:
+    python main.py --record parcours.jsonl
+    python main.py --replay parcours.jsonl
+"""
+
+import os
+import json
+import pygame
+from src.utils.profiler import PHASES
+from src.utils.stats import percentile
+
+# Identification du format des enregistrements
+RECORDING_FORMAT = 'dts-input'
+RECORDING_VERSION = 1
+
+# Types des attributs d'événement conservés
+_VALUE_TYPES = (bool, int, float, str)
+
+
+def _encode_value(value):
+    """Attribut d'événement en valeur JSON (None si non sérialisable)"""
+    if value is None or isinstance(value, _VALUE_TYPES):
+        return value
+    if isinstance(value, (tuple, list)) and all(isinstance(item, _VALUE_TYPES) for item in value):
+        return list(value)
+    return None
+
+def encode_event(event):
+    """
+    Événement pygame en structure JSON
+
+    Args:
+        event (pygame.event.Event): Événement
+
+    Returns:
+        list: [type, attributs]
+    """
+    attributes = {}
+    for name, value in event.dict.items():
+        encoded = _encode_value(value)
+        if encoded is not None or value is None:
+            attributes[name] = encoded
+
+    # La molette n'a pas de position: celle du curseur est enregistrée, le
+    # rejeu ne déplaçant pas le curseur réel
+    if event.type == pygame.MOUSEWHEEL and 'pos' not in attributes:
+        attributes['pos'] = list(pygame.mouse.get_pos())
+    return [event.type, attributes]
+
+def decode_event(data):
+    """
+    Événement pygame à partir de sa structure JSON
+
+    Args:
+        data (list): [type, attributs] renvoyé par encode_event
+
+    Returns:
+        pygame.event.Event: Événement
+    """
+    event_type, attributes = data
+    return pygame.event.Event(event_type, {
+        name: tuple(value) if isinstance(value, list) else value
+        for name, value in attributes.items()
+    })
+
+
+class InputRecorder:
+    """Enregistre les événements et les pas de simulation de chaque frame"""
+
+    def __init__(self, path, seed, screen_size):
+        """
+        Ouvre l'enregistrement et écrit son en-tête
+
+        Args:
+            path (str): Chemin du fichier (JSON, une ligne par frame)
+            seed (int): Graine du générateur aléatoire de la partie
+            screen_size (tuple): Taille de l'écran (largeur, hauteur)
+        """
+        self.path = path
+        self.file = open(path, 'w', encoding='utf-8')
+        self.file.write(json.dumps({
+            'format': RECORDING_FORMAT,
+            'version': RECORDING_VERSION,
+            'seed': seed,
+            'screen': list(screen_size)
+        }) + "\n")
+        self.frame_index = None
+        self.events = []
+
+    def record_events(self, frame_index, events):
+        """
+        Enregistre les événements d'une frame
+
+        Args:
+            frame_index (int): Numéro de la frame
+            events (list): Événements pygame
+        """
+        if frame_index != self.frame_index:
+            self.frame_index = frame_index
+            self.events = []
+        self.events.extend(encode_event(event) for event in events)
+
+    def record_steps(self, frame_index, steps):
+        """
+        Termine la frame avec son nombre de pas de simulation
+
+        Args:
+            frame_index (int): Numéro de la frame
+            steps (int): Pas de simulation exécutés
+        """
+        events = self.events if frame_index == self.frame_index else []
+        self.file.write(json.dumps([frame_index, steps, events], separators=(',', ':')) + "\n")
+        self.frame_index = None
+        self.events = []
+
+    def close(self):
+        """Ferme l'enregistrement"""
+        if not self.file.closed:
+            self.file.close()
+
+
+class InputRecording:
+    """Enregistrement chargé pour un rejeu"""
+
+    def __init__(self, seed, screen_size, frames):
+        """
+        Args:
+            seed (int): Graine du générateur aléatoire
+            screen_size (tuple): Taille de l'écran (largeur, hauteur)
+            frames (list): (numéro de frame, pas de simulation, événements pygame)
+        """
+        self.seed = seed
+        self.screen_size = screen_size
+        self.frames = frames
+
+    def __len__(self):
+        return len(self.frames)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Charge un enregistrement
+
+        Args:
+            path (str): Chemin du fichier
+
+        Returns:
+            InputRecording: Enregistrement ou None en cas d'erreur
+        """
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                header = json.loads(f.readline())
+                if header.get('format') != RECORDING_FORMAT or header.get('version') != RECORDING_VERSION:
+                    raise ValueError("format d'enregistrement inconnu")
+
+                frames = []
+                for line in f:
+                    if not line.strip():
+                        continue
+                    frame_index, steps, events = json.loads(line)
+                    frames.append((frame_index, steps, [decode_event(event) for event in events]))
+
+            return cls(header['seed'], tuple(header['screen']), frames)
+        except Exception as e:
+            print(f"Erreur lors du chargement de l'enregistrement: {e}")
+            return None
+
+
+def new_seed():
+    """Graine aléatoire pour une partie enregistrée"""
+    return int.from_bytes(os.urandom(4), 'little')
+
+def replay_stats(frames):
+    """
+    Statistiques des frames d'un rejeu, par écran
+
+    Args:
+        frames (iterable): Frames du profileur (numéro, écran, temps par phase, total, compteurs)
+
+    Returns:
+        dict: Écran -> phase ('update', 'render', 'total') -> moyenne, p50, p95, p99, max (ms)
+    """
+    columns = {name: 2 + i for i, name in enumerate(PHASES + ('total',))}
+    by_screen = {}
+    for frame in frames:
+        by_screen.setdefault(frame[1], []).append(frame)
+        by_screen.setdefault('all', []).append(frame)
+
+    stats = {}
+    for screen, screen_frames in by_screen.items():
+        stats[screen] = {'frames': len(screen_frames)}
+        for phase in ('update', 'render', 'total'):
+            values = sorted(frame[columns[phase]] for frame in screen_frames)
+            stats[screen][phase] = {
+                'mean': sum(values) / len(values),
+                'p50': percentile(values, 50),
+                'p95': percentile(values, 95),
+                'p99': percentile(values, 99),
+                'max': values[-1]
+            }
+    return stats
@@ -6,24 +6,173 @@ Fonctions pour sauvegarder et charger les parties
 """
 
 import os
+import re
+import json
+import struct
+import zlib
 import pickle
+import hashlib
 import datetime
 import glob
+import queue
+import threading
+from collections import deque
+from src.utils.atomic import atomic_write, generation_paths, remove_generations
+from src.utils.journal import append_records, read_journal, replay
+from src.utils.serialization import SAVE_FORMAT, FORMAT_VERSION, extract_state, encode_state, decode_state, restore_state
+from src.utils.instrument import timed, counted
+from src.career.history import get_history_path
 
 # Dossier de sauvegarde
 SAVE_DIR = os.path.join(os.path.expanduser('~'), '.drive_to_survive', 'saves')
 
+# En-tête de fichier: signature + taille de l'en-tête JSON (métadonnées de l'emplacement)
+SAVE_MAGIC = b'DTSSAVE\x01'
+HEADER_PREFIX = struct.Struct('<8sI')
+MAX_HEADER_SIZE = 4096
+
+# Nombre de versions conservées par emplacement (courante + anciennes)
+SAVE_GENERATIONS = 3
+
+# Nom des fichiers d'emplacements manuels (et de leurs anciennes versions)
+SLOT_PATTERN = re.compile(r'^save_(\d+)\.dat(?:\.\d+)?$')
+
+# Nom de tous les fichiers de sauvegarde (auto-save comprise)
+SAVE_FILE_PATTERN = re.compile(r'^(?:autosave|save_\d+)\.dat(?:\.\d+)?$')
+
 def ensure_save_dir():
     """Crée le dossier de sauvegarde s'il n'existe pas"""
     os.makedirs(SAVE_DIR, exist_ok=True)
 
-def save_game(save_data, slot=None):
+def snapshot_save_data(save_data, journal_id=None):
     """
-    Sauvegarde une partie
+    Prend une image cohérente des données à sauvegarder
+    
+    L'image est prise sur le thread principal: l'état de la carrière est
+    extrait en structures simples, indépendantes des objets du jeu, qui
+    peuvent ensuite continuer à évoluer pendant que le thread d'écriture
+    encode et compresse l'image.
     
     Args:
-        save_data (dict): Données à sauvegarder
-        slot (int, optional): Emplacement de sauvegarde (1-5). Si None, utilise l'auto-save.
+        save_data (dict): Données à sauvegarder (joueur, carrière)
+        journal_id (int, optional): Identifiant du journal associé (auto-save)
+    
+    Returns:
+        dict: Image datée des données
+    """
+    save_data = dict(save_data)
+    save_data['save_date'] = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    
+    header = build_save_header(save_data)
+    if journal_id is not None:
+        header['journal_id'] = journal_id
+    
+    return {
+        'header': header,
+        'state': extract_state(save_data['player'], save_data['career'])
+    }
+
+def build_save_header(save_data):
+    """
+    Construit les métadonnées affichées dans la liste des sauvegardes
+    
+    Args:
+        save_data (dict): Données à sauvegarder (joueur, carrière, date)
+    
+    Returns:
+        dict: Métadonnées de la sauvegarde
+    """
+    player = save_data.get('player')
+    career = save_data.get('career')
+    
+    return {
+        'save_date': save_data.get('save_date', 'Date inconnue'),
+        'player_name': player.name if player else 'Inconnu',
+        'player_age': player.age if player else 0,
+        'player_category': player.category if player else 'Inconnue',
+        'player_team': player.team.name if player and player.team else 'Inconnue',
+        'current_year': career.current_year if career else 0,
+        'career_id': getattr(career, 'career_id', None),
+        'format': SAVE_FORMAT,
+        'version': FORMAT_VERSION
+    }
+
+def read_save_header(f):
+    """
+    Lit l'en-tête d'un fichier de sauvegarde ouvert
+    
+    Seuls quelques centaines d'octets sont lus. Les anciennes sauvegardes
+    (pickle brut, sans en-tête) renvoient None et le fichier est rembobiné.
+    
+    Args:
+        f: Fichier ouvert en lecture binaire, positionné au début
+    
+    Returns:
+        dict: Métadonnées de la sauvegarde, ou None pour un ancien fichier
+    """
+    prefix = f.read(HEADER_PREFIX.size)
+    if len(prefix) < HEADER_PREFIX.size or not prefix.startswith(SAVE_MAGIC):
+        f.seek(0)
+        return None
+    
+    _, header_size = HEADER_PREFIX.unpack(prefix)
+    if header_size > MAX_HEADER_SIZE:
+        raise ValueError(f"En-tête de sauvegarde invalide ({header_size} octets)")
+    
+    return json.loads(f.read(header_size).decode('utf-8'))
+
+def get_save_path(slot=None):
+    """
+    Chemin du fichier d'un emplacement de sauvegarde
+    
+    Args:
+        slot (int, optional): Emplacement de sauvegarde. Si None, utilise l'auto-save.
+    
+    Returns:
+        str: Chemin du fichier
+    """
+    if slot is None:
+        filename = "autosave.dat"
+    else:
+        filename = f"save_{slot}.dat"
+    
+    return os.path.join(SAVE_DIR, filename)
+
+def get_journal_path():
+    """
+    Chemin du journal de l'auto-save
+    
+    Returns:
+        str: Chemin du fichier
+    """
+    return os.path.join(SAVE_DIR, "autosave.journal")
+
+def _file_chunks(header, state):
+    """
+    Blocs d'un fichier de sauvegarde: préfixe, en-tête JSON et charge utile
+    
+    Args:
+        header (dict): Métadonnées de la sauvegarde
+        state (dict): État extrait de la carrière
+    
+    Returns:
+        tuple: Blocs d'octets à écrire
+    """
+    payload = encode_state(state)
+    
+    # Taille et somme de contrôle de la charge utile
+    header = dict(header, size=len(payload), crc32=zlib.crc32(payload))
+    header = json.dumps(header).encode('utf-8')
+    
+    return (HEADER_PREFIX.pack(SAVE_MAGIC, len(header)), header, payload)
+
+def write_snapshot(snapshot, slot=None):
+    """
+    Écrit une image de sauvegarde sur le disque
+    
+    Args:
+        snapshot (dict): Image prise par snapshot_save_data
+        slot (int, optional): Emplacement de sauvegarde (1, 2, ...). Si None, utilise l'auto-save.
     
     Returns:
         bool: True si la sauvegarde a réussi, False sinon
@@ -31,107 +180,264 @@ def save_game(save_data, slot=None):
     ensure_save_dir()
     
     try:
-        # Nom du fichier de sauvegarde
-        if slot is None:
-            filename = "autosave.dat"
-        else:
-            filename = f"save_{slot}.dat"
-        
-        save_path = os.path.join(SAVE_DIR, filename)
+        # Carrières des versions remplacées (la plus ancienne disparaît)
+        replaced = _career_ids(get_generation_paths(slot))
         
-        # Ajouter la date et l'heure de sauvegarde
-        save_data['save_date'] = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        # Écriture atomique, les anciennes versions sont conservées
+        atomic_write(get_save_path(slot),
+                     _file_chunks(snapshot['header'], snapshot['state']),
+                     backups=SAVE_GENERATIONS - 1)
         
-        # Sauvegarder les données
-        with open(save_path, 'wb') as f:
-            pickle.dump(save_data, f)
+        # Nouvelle base: l'ancien journal est périmé
+        if slot is None and os.path.exists(get_journal_path()):
+            os.remove(get_journal_path())
         
+        remove_unused_histories(replaced - {snapshot['header'].get('career_id')})
         return True
     
     except Exception as e:
         print(f"Erreur lors de la sauvegarde: {e}")
         return False
 
+def append_journal(journal_id, records):
+    """
+    Ajoute des opérations au journal de l'auto-save
+    
+    Args:
+        journal_id (int): Identifiant de la sauvegarde de base
+        records (list): Enregistrements encodés
+    
+    Returns:
+        bool: True si l'ajout a réussi, False sinon
+    """
+    ensure_save_dir()
+    
+    try:
+        append_records(get_journal_path(), journal_id, records)
+        return True
+    
+    except Exception as e:
+        print(f"Erreur lors de l'écriture du journal: {e}")
+        return False
+
+@timed('save_load.save_game')
+def save_game(save_data, slot=None):
+    """
+    Sauvegarde une partie
+    
+    Args:
+        save_data (dict): Données à sauvegarder
+        slot (int, optional): Emplacement de sauvegarde (1, 2, ...). Si None, utilise l'auto-save.
+    
+    Returns:
+        bool: True si la sauvegarde a réussi, False sinon
+    """
+    try:
+        snapshot = snapshot_save_data(save_data)
+    except Exception as e:
+        print(f"Erreur lors de la sauvegarde: {e}")
+        return False
+    
+    return write_snapshot(snapshot, slot)
+
+def get_generation_paths(slot=None):
+    """
+    Chemins des versions d'un emplacement, de la plus récente à la plus ancienne
+    
+    Args:
+        slot (int, optional): Emplacement de sauvegarde. Si None, utilise l'auto-save.
+    
+    Returns:
+        list: Chemins des fichiers
+    """
+    return generation_paths(get_save_path(slot), SAVE_GENERATIONS - 1)
+
+def _header_matches_size(header, path, f):
+    """Vérification rapide: la taille du fichier correspond à celle annoncée"""
+    return 'size' not in header or os.path.getsize(path) == f.tell() + header['size']
+
+def _load_file(path):
+    """
+    Charge un fichier de sauvegarde en vérifiant sa somme de contrôle
+    
+    Args:
+        path (str): Chemin du fichier
+    
+    Returns:
+        dict: Données chargées (migrated: ancienne sauvegarde convertie en mémoire)
+    """
+    with open(path, 'rb') as f:
+        header = read_save_header(f)
+        
+        # Anciennes sauvegardes: graphe d'objets picklé, remis au format
+        # des objets actuels en mémoire (le fichier n'est pas modifié, la
+        # prochaine sauvegarde complète l'écrira au format courant)
+        migrated = header is None or header.get('format') != SAVE_FORMAT
+        if migrated:
+            content = f.read()
+            legacy = pickle.loads(content)
+            state = extract_state(legacy['player'], legacy['career'])
+            header = {'save_date': legacy.get('save_date', 'Date inconnue')}
+            
+            # Identifiant de carrière tiré du contenu: chaque chargement du
+            # même fichier retrouve la même base d'historique
+            if state['career']['career_id'] is None:
+                state['career']['career_id'] = hashlib.sha256(content).hexdigest()[:32]
+        else:
+            payload = f.read()
+            if 'size' in header and (len(payload) != header['size'] or zlib.crc32(payload) != header['crc32']):
+                raise ValueError("somme de contrôle invalide")
+            state = decode_state(payload)
+    
+    save_data = restore_state(state)
+    save_data['save_date'] = header.get('save_date', 'Date inconnue')
+    save_data['journal_id'] = header.get('journal_id')
+    save_data['migrated'] = migrated
+    return save_data
+
+@timed('save_load.load_game')
 def load_game(slot=None):
     """
     Charge une partie sauvegardée
     
+    Si la version la plus récente est endommagée, la plus récente des
+    anciennes versions valides est chargée.
+    
     Args:
-        slot (int, optional): Emplacement de sauvegarde (1-5). Si None, utilise l'auto-save.
+        slot (int, optional): Emplacement de sauvegarde (1, 2, ...). Si None, utilise l'auto-save.
     
     Returns:
         dict: Données chargées ou None en cas d'erreur
     """
     ensure_save_dir()
     
-    try:
-        # Nom du fichier de sauvegarde
-        if slot is None:
-            filename = "autosave.dat"
-        else:
-            filename = f"save_{slot}.dat"
-        
-        save_path = os.path.join(SAVE_DIR, filename)
-        
+    for save_path in get_generation_paths(slot):
         # Vérifier si le fichier existe
         if not os.path.exists(save_path):
-            return None
-        
-        # Charger les données
-        with open(save_path, 'rb') as f:
-            save_data = pickle.load(f)
+            continue
         
-        return save_data
+        try:
+            save_data = _load_file(save_path)
+            
+            # Rejouer le journal de l'auto-save sur la base
+            if slot is None and save_data.get('journal_id') is not None:
+                replay(save_data, read_journal(get_journal_path(), save_data['journal_id']))
+            
+            return save_data
+        except Exception as e:
+            print(f"Erreur lors du chargement de {os.path.basename(save_path)}: {e}")
     
-    except Exception as e:
-        print(f"Erreur lors du chargement: {e}")
-        return None
+    return None
 
 def get_save_info(slot=None):
     """
     Récupère les informations d'une sauvegarde
     
     Args:
-        slot (int, optional): Emplacement de sauvegarde (1-5). Si None, utilise l'auto-save.
+        slot (int, optional): Emplacement de sauvegarde (1, 2, ...). Si None, utilise l'auto-save.
     
     Returns:
         dict: Informations sur la sauvegarde ou None si elle n'existe pas
     """
     ensure_save_dir()
     
-    try:
-        # Nom du fichier de sauvegarde
-        if slot is None:
-            filename = "autosave.dat"
-        else:
-            filename = f"save_{slot}.dat"
-        
-        save_path = os.path.join(SAVE_DIR, filename)
-        
+    for save_path in get_generation_paths(slot):
         # Vérifier si le fichier existe
         if not os.path.exists(save_path):
-            return None
-        
-        # Charger les données juste pour récupérer les infos
-        with open(save_path, 'rb') as f:
-            save_data = pickle.load(f)
+            continue
         
-        # Récupérer les informations essentielles
-        player = save_data.get('player', {})
-        career = save_data.get('career', {})
+        try:
+            with open(save_path, 'rb') as f:
+                header = read_save_header(f)
+                
+                # Ancienne sauvegarde sans en-tête: chargement complet
+                if header is None:
+                    return build_save_header(pickle.load(f))
+                
+                # Fichier tronqué: on passe à la version précédente
+                if _header_matches_size(header, save_path, f):
+                    return header
         
-        return {
-            'save_date': save_data.get('save_date', 'Date inconnue'),
-            'player_name': player.name if player else 'Inconnu',
-            'player_age': player.age if player else 0,
-            'player_category': player.category if player else 'Inconnue',
-            'player_team': player.team.name if player and player.team else 'Inconnue',
-            'current_year': career.current_year if career else 0
-        }
+        except Exception as e:
+            print(f"Erreur lors de la récupération des infos: {e}")
     
-    except Exception as e:
-        print(f"Erreur lors de la récupération des infos: {e}")
-        return None
+    return None
+
+def _career_ids(paths):
+    """
+    Identifiants de carrière de fichiers de sauvegarde (lecture des en-têtes seulement)
+    
+    Args:
+        paths (iterable): Chemins des fichiers (les fichiers absents ou illisibles sont ignorés)
+    
+    Returns:
+        set: Identifiants de carrière
+    """
+    career_ids = set()
+    for path in paths:
+        try:
+            with open(path, 'rb') as f:
+                header = read_save_header(f)
+        except (OSError, ValueError):
+            continue
+        if header and header.get('career_id'):
+            career_ids.add(header['career_id'])
+    return career_ids
+
+def remove_unused_histories(career_ids):
+    """
+    Supprime les bases d'historique des carrières qu'aucune sauvegarde
+    (emplacements, auto-save et anciennes versions) n'utilise plus
+    
+    Args:
+        career_ids (iterable): Identifiants des carrières à vérifier
+    """
+    career_ids = set(career_ids)
+    if not career_ids:
+        return
+    
+    save_files = [
+        path for path in glob.glob(os.path.join(SAVE_DIR, "*.dat*"))
+        if SAVE_FILE_PATTERN.match(os.path.basename(path))
+    ]
+    for career_id in career_ids - _career_ids(save_files):
+        path = get_history_path(career_id)
+        try:
+            for history_file in (path, f"{path}-journal"):
+                if os.path.exists(history_file):
+                    os.remove(history_file)
+        except OSError as e:
+            print(f"Erreur lors de la suppression de l'historique: {e}")
+
+def list_save_slots():
+    """
+    Liste les numéros des emplacements de sauvegarde manuelle existants
+    
+    Returns:
+        list: Numéros d'emplacements triés
+    """
+    ensure_save_dir()
+    
+    slots = set()
+    for path in glob.glob(os.path.join(SAVE_DIR, "save_*.dat*")):
+        match = SLOT_PATTERN.match(os.path.basename(path))
+        if match:
+            slots.add(int(match.group(1)))
+    
+    return sorted(slots)
+
+def next_free_slot():
+    """
+    Premier numéro d'emplacement manuel libre
+    
+    Returns:
+        int: Numéro d'emplacement
+    """
+    used = set(list_save_slots())
+    slot = 1
+    while slot in used:
+        slot += 1
+    return slot
 
 def list_saves():
     """
@@ -152,8 +458,8 @@ def list_saves():
             'info': autosave_info
         })
     
-    # Sauvegardes manuelles
-    for slot in range(1, 6):
+    # Sauvegardes manuelles (tous les emplacements présents sur le disque)
+    for slot in list_save_slots():
         save_info = get_save_info(slot)
         if save_info:
             saves.append({
@@ -168,7 +474,7 @@ def delete_save(slot=None):
     Supprime une sauvegarde
     
     Args:
-        slot (int, optional): Emplacement de sauvegarde (1-5). Si None, supprime l'auto-save.
+        slot (int, optional): Emplacement de sauvegarde (1, 2, ...). Si None, supprime l'auto-save.
     
     Returns:
         bool: True si la suppression a réussi, False sinon
@@ -176,22 +482,117 @@ def delete_save(slot=None):
     ensure_save_dir()
     
     try:
-        # Nom du fichier de sauvegarde
-        if slot is None:
-            filename = "autosave.dat"
-        else:
-            filename = f"save_{slot}.dat"
+        # Supprimer le fichier et ses anciennes versions, puis l'historique
+        # de la carrière si plus aucune sauvegarde ne l'utilise
+        career_ids = _career_ids(get_generation_paths(slot))
+        removed = remove_generations(get_save_path(slot), SAVE_GENERATIONS - 1)
+        if slot is None and os.path.exists(get_journal_path()):
+            os.remove(get_journal_path())
+        remove_unused_histories(career_ids)
+        return removed
+    
+    except Exception as e:
+        print(f"Erreur lors de la suppression: {e}")
+        return False
+
+class SaveWriter:
+    """Thread d'écriture des sauvegardes en arrière-plan"""
+    
+    def __init__(self):
+        """Initialisation et démarrage du thread d'écriture"""
+        self._jobs = queue.Queue()
+        self._completed = deque()
+        self._pending = 0
+        self._lock = threading.Lock()
         
-        save_path = os.path.join(SAVE_DIR, filename)
+        self._thread = threading.Thread(target=self._run, name="save-writer", daemon=True)
+        self._thread.start()
+    
+    @property
+    def busy(self):
+        """True si une sauvegarde est en attente ou en cours d'écriture"""
+        with self._lock:
+            return self._pending > 0
+    
+    @counted('save_load.save_submissions')
+    def submit(self, save_data, slot=None, callback=None, journal_id=None):
+        """
+        Demande une sauvegarde en arrière-plan
         
-        # Vérifier si le fichier existe
-        if not os.path.exists(save_path):
-            return False
+        L'image des données est prise immédiatement (thread principal),
+        l'écriture a lieu sur le thread d'écriture.
         
-        # Supprimer le fichier
-        os.remove(save_path)
-        return True
+        Args:
+            save_data (dict): Données à sauvegarder
+            slot (int, optional): Emplacement de sauvegarde. Si None, utilise l'auto-save.
+            callback (callable, optional): Appelé avec le succès (bool) depuis poll()
+            journal_id (int, optional): Identifiant du nouveau journal (auto-save)
+        """
+        try:
+            snapshot = snapshot_save_data(save_data, journal_id)
+        except Exception as e:
+            print(f"Erreur lors de la sauvegarde: {e}")
+            self._completed.append((callback, False))
+            return
+        
+        self._put(write_snapshot, (snapshot, slot), callback)
     
-    except Exception as e:
-        print(f"Erreur lors de la suppression: {e}")
-        return False
\ No newline at end of file
+    @counted('save_load.journal_submissions')
+    def submit_journal(self, journal_id, records, callback=None):
+        """
+        Demande l'ajout d'opérations au journal de l'auto-save
+        
+        Args:
+            journal_id (int): Identifiant de la sauvegarde de base
+            records (list): Enregistrements encodés
+            callback (callable, optional): Appelé avec le succès (bool) depuis poll()
+        """
+        self._put(append_journal, (journal_id, records), callback)
+    
+    def _put(self, function, args, callback):
+        """Ajoute une écriture à la file du thread d'écriture"""
+        with self._lock:
+            self._pending += 1
+        self._jobs.put((function, args, callback))
+    
+    def poll(self):
+        """
+        Appelle les callbacks des sauvegardes terminées (à appeler depuis le thread principal)
+        
+        Returns:
+            int: Nombre de sauvegardes terminées depuis le dernier appel
+        """
+        count = 0
+        while self._completed:
+            callback, success = self._completed.popleft()
+            if callback:
+                callback(success)
+            count += 1
+        return count
+    
+    def flush(self):
+        """Attend la fin de toutes les sauvegardes en attente"""
+        self._jobs.join()
+        self.poll()
+    
+    def close(self):
+        """Termine les écritures en attente puis arrête le thread"""
+        self.flush()
+        self._jobs.put(None)
+        self._thread.join()
+    
+    def _run(self):
+        """Boucle du thread d'écriture"""
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                self._jobs.task_done()
+                break
+            
+            function, args, callback = job
+            success = function(*args)
+            
+            self._completed.append((callback, success))
+            with self._lock:
+                self._pending -= 1
+            self._jobs.task_done()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Ordonnanceur de frames: pas de simulation fixe, rendu découplé et
+mise en veille quand rien ne bouge à l'écran
+"""
+
+import pygame
+
+class FrameScheduler:
+    """Horloge unique de la boucle de jeu"""
+
+    def __init__(self, fps=60, update_rate=60, idle_timeout=500, max_steps=5):
+        """
+        Initialisation de l'ordonnanceur
+
+        Args:
+            fps (int): Nombre maximum d'images par seconde en mode animé
+            update_rate (int): Nombre de pas de simulation par seconde
+            idle_timeout (int): Attente maximale (ms) d'un événement en mode veille
+            max_steps (int): Nombre maximum de pas de simulation rattrapés par frame
+        """
+        self.fps = fps
+        self.update_rate = update_rate
+        self.idle_timeout = idle_timeout
+        self.max_steps = max_steps
+
+        self.clock = pygame.time.Clock()
+        self.accumulator = 0.0
+        self.last_ticks = pygame.time.get_ticks()
+        self.frame_index = 0
+
+    @property
+    def update_rate(self):
+        """Nombre de pas de simulation par seconde"""
+        return self._update_rate
+
+    @update_rate.setter
+    def update_rate(self, update_rate):
+        self._update_rate = update_rate
+        self.step_ms = 1000.0 / update_rate  # Durée d'un pas de simulation
+
+    def poll_events(self, animating):
+        """
+        Récupère les événements de la frame
+
+        En mode veille (aucune animation en cours), bloque sur
+        pygame.event.wait jusqu'au prochain événement ou au délai maximal.
+
+        Args:
+            animating (bool): True si l'écran actif a une animation en cours
+
+        Returns:
+            list: Événements à traiter
+        """
+        events = pygame.event.get()
+        if events or animating:
+            return events
+
+        event = pygame.event.wait(self.idle_timeout)
+        if event.type == pygame.NOEVENT:
+            return []
+        return [event] + pygame.event.get()
+
+    def pending_steps(self, animating):
+        """
+        Calcule le nombre de pas de simulation à exécuter pour cette frame
+
+        Args:
+            animating (bool): True si l'écran actif a une animation en cours
+
+        Returns:
+            int: Nombre de pas de simulation
+        """
+        now = pygame.time.get_ticks()
+        elapsed = now - self.last_ticks
+        self.last_ticks = now
+
+        # En veille, le temps passé à attendre ne doit pas être rattrapé
+        if not animating:
+            self.accumulator = 0.0
+            return 1
+
+        self.accumulator += elapsed
+        steps = int(self.accumulator // self.step_ms)
+        if steps > self.max_steps:
+            # Trop de retard: abandonner le temps non rattrapable
+            steps = self.max_steps
+            self.accumulator = 0.0
+        else:
+            self.accumulator -= steps * self.step_ms
+
+        return steps
+
+    def end_frame(self, animating):
+        """
+        Termine la frame en limitant le nombre d'images par seconde
+
+        Args:
+            animating (bool): True si l'écran actif a une animation en cours
+
+        Returns:
+            int: Durée de la frame en millisecondes
+        """
+        self.frame_index += 1
+
+        # En veille, l'attente a déjà eu lieu dans poll_events
+        if animating:
+            return self.clock.tick(self.fps)
+        return self.clock.tick()
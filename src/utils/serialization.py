@@ -0,0 +1,608 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Format de sauvegarde binaire versionné: l'état de la carrière est extrait
+en structures simples, puis encodé champ par champ (entiers varint,
+chaînes préfixées par leur longueur) et compressé
+"""
+
+import struct
+import zlib
+import lzma
+from src.player import Player
+from src.career.career_path import CareerPath
+from src.career.season import Season
+from src.career.drivers import DriverRegistry
+from src.racing.results import RaceRecord
+
+# Identifiant du format (écrit dans l'en-tête des fichiers de sauvegarde)
+SAVE_FORMAT = 'dts-binary'
+
+# Version courante du schéma
+FORMAT_VERSION = 1
+
+# Compressions disponibles (identifiant écrit dans la charge utile)
+COMPRESSION_NONE = 0
+COMPRESSION_ZLIB = 1
+COMPRESSION_LZMA = 2
+
+COMPRESSORS = {
+    COMPRESSION_NONE: (lambda data: data, lambda data: data),
+    COMPRESSION_ZLIB: (zlib.compress, zlib.decompress),
+    COMPRESSION_LZMA: (lzma.compress, lzma.decompress)
+}
+
+# Champs du schéma
+CATEGORIES = ('f3', 'f2', 'f1')
+SKILL_NAMES = ('pace', 'overtaking', 'defending', 'consistency',
+               'tire_management', 'wet_driving', 'technical_feedback', 'starts')
+STAT_FIELDS = ('races', 'wins', 'podiums', 'points', 'championships', 'best_finish')
+CATEGORY_STAT_FIELDS = ('races', 'wins', 'podiums', 'points', 'championships')
+TEAM_STAT_FIELDS = ('races', 'wins', 'podiums', 'points', 'championships')
+
+# Étiquettes des valeurs génériques
+TAG_NONE, TAG_FALSE, TAG_TRUE, TAG_INT, TAG_FLOAT, TAG_STR, TAG_LIST, TAG_DICT = range(8)
+
+_DOUBLE = struct.Struct('<d')
+
+def _field_registry(season):
+    """État d'une base des pilotes reconstituée à partir du plateau d'une saison extraite"""
+    if season is None:
+        return DriverRegistry().to_state()
+    drivers = {
+        driver_id: {"name": name, "team": team, "skills": skills, "is_player": is_player}
+        for driver_id, name, team, skills, is_player in season['drivers']
+    }
+    return DriverRegistry.from_field(season['category'], drivers).to_state()
+
+
+class RecordWriter:
+    """Écriture d'enregistrements binaires dans un tampon"""
+
+    def __init__(self):
+        self.buffer = bytearray()
+
+    def write_uint(self, value):
+        """Entier positif au format varint (LEB128)"""
+        if value < 0x80:
+            self.buffer.append(value)
+            return
+        while value > 0x7F:
+            self.buffer.append((value & 0x7F) | 0x80)
+            value >>= 7
+        self.buffer.append(value)
+
+    def write_int(self, value):
+        """Entier signé (zigzag + varint)"""
+        self.write_uint(value << 1 if value >= 0 else (-value << 1) - 1)
+
+    def write_float(self, value):
+        """Flottant 64 bits"""
+        self.buffer += _DOUBLE.pack(value)
+
+    def write_bool(self, value):
+        """Booléen sur un octet"""
+        self.buffer.append(1 if value else 0)
+
+    def write_str(self, value):
+        """Chaîne UTF-8 préfixée par sa longueur"""
+        data = value.encode('utf-8')
+        self.write_uint(len(data))
+        self.buffer += data
+
+    def write_value(self, value):
+        """
+        Valeur générique étiquetée (None, booléen, nombre, chaîne, liste, dictionnaire)
+
+        Args:
+            value: Valeur à écrire
+        """
+        if value is None:
+            self.buffer.append(TAG_NONE)
+        elif value is True or value is False:
+            self.buffer.append(TAG_TRUE if value else TAG_FALSE)
+        elif isinstance(value, int):
+            self.buffer.append(TAG_INT)
+            self.write_int(value)
+        elif isinstance(value, float):
+            self.buffer.append(TAG_FLOAT)
+            self.write_float(value)
+        elif isinstance(value, str):
+            self.buffer.append(TAG_STR)
+            self.write_str(value)
+        elif isinstance(value, (list, tuple)):
+            self.buffer.append(TAG_LIST)
+            self.write_uint(len(value))
+            for item in value:
+                self.write_value(item)
+        elif isinstance(value, dict):
+            self.buffer.append(TAG_DICT)
+            self.write_uint(len(value))
+            for key, item in value.items():
+                self.write_value(key)
+                self.write_value(item)
+        else:
+            raise TypeError(f"Type non sérialisable: {type(value).__name__}")
+
+    def getvalue(self):
+        """Contenu du tampon"""
+        return bytes(self.buffer)
+
+
+class RecordReader:
+    """Lecture d'enregistrements binaires"""
+
+    def __init__(self, data):
+        self.data = memoryview(data)
+        self.pos = 0
+
+    def read_uint(self):
+        # Cas le plus fréquent: valeur sur un seul octet
+        byte = self.data[self.pos]
+        self.pos += 1
+        if byte < 0x80:
+            return byte
+
+        result = byte & 0x7F
+        shift = 7
+        while True:
+            byte = self.data[self.pos]
+            self.pos += 1
+            result |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return result
+            shift += 7
+
+    def read_int(self):
+        value = self.read_uint()
+        return (value >> 1) if not value & 1 else -((value + 1) >> 1)
+
+    def read_float(self):
+        value = _DOUBLE.unpack_from(self.data, self.pos)[0]
+        self.pos += _DOUBLE.size
+        return value
+
+    def read_bool(self):
+        value = self.data[self.pos] != 0
+        self.pos += 1
+        return value
+
+    def read_str(self):
+        size = self.read_uint()
+        value = str(self.data[self.pos:self.pos + size], 'utf-8')
+        self.pos += size
+        return value
+
+    def read_value(self):
+        tag = self.data[self.pos]
+        self.pos += 1
+
+        if tag == TAG_NONE:
+            return None
+        if tag == TAG_FALSE:
+            return False
+        if tag == TAG_TRUE:
+            return True
+        if tag == TAG_INT:
+            return self.read_int()
+        if tag == TAG_FLOAT:
+            return self.read_float()
+        if tag == TAG_STR:
+            return self.read_str()
+        if tag == TAG_LIST:
+            return [self.read_value() for _ in range(self.read_uint())]
+        if tag == TAG_DICT:
+            result = {}
+            for _ in range(self.read_uint()):
+                key = self.read_value()
+                result[key] = self.read_value()
+            return result
+        raise ValueError(f"Étiquette de valeur inconnue: {tag}")
+
+
+# --- Extraction de l'état (thread principal) ---
+
+def _team_ref(team):
+    """Référence d'une équipe: (catégorie, nom)"""
+    return [team.category, team.name] if team else None
+
+def extract_state(player, career):
+    """
+    Extrait l'état de la carrière en structures simples (nombres, chaînes,
+    listes, dictionnaires), indépendantes des objets du jeu
+
+    Args:
+        player (Player): Joueur
+        career (CareerPath): Carrière
+
+    Returns:
+        dict: État de la carrière
+    """
+    stats = player.stats
+    player_state = {
+        'name': player.name,
+        'age': player.age,
+        'reputation': player.reputation,
+        'money': player.money,
+        'academy': player.academy.name if player.academy else None,
+        'team': _team_ref(player.team),
+        'category': player.category,
+        'skills': [getattr(player.skills, name) for name in SKILL_NAMES],
+        'stats': [getattr(stats, name) for name in STAT_FIELDS],
+        'category_stats': [
+            [getattr(stats, f"{category}_stats")[name] for name in CATEGORY_STAT_FIELDS]
+            for category in CATEGORIES
+        ],
+        'contract_years': player.contract_years,
+        'contract_value': player.contract_value
+    }
+
+    teams_state = []
+    for academy in career.academies:
+        for team in academy.teams:
+            teams_state.append({
+                'ref': _team_ref(team),
+                'performance': team.performance,
+                'reputation': team.reputation,
+                'budget': team.budget,
+                'car_development': team.car_development,
+                'stats': [team.stats[name] for name in TEAM_STAT_FIELDS]
+            })
+
+    current_season = career.current_season
+    season_state = _extract_season(current_season) if current_season else None
+
+    # Les anciennes carrières n'ont pas de base des pilotes ni d'historique
+    registry = getattr(career, 'drivers', None)
+    drivers_state = registry.to_state() if registry is not None else _field_registry(season_state)
+    history_seasons = getattr(career, 'history_seasons', None)
+
+    return {
+        'version': FORMAT_VERSION,
+        'player': player_state,
+        'career': {
+            'career_id': getattr(career, 'career_id', None),
+            'current_year': career.current_year,
+            'teams': teams_state,
+            'drivers': drivers_state,
+            'history_seasons': history_seasons,
+            'season': season_state,
+            # Saisons passées gardées en mémoire par les anciennes versions (non encodées)
+            'archived': [
+                _extract_season(season) for season in getattr(career, 'seasons', ())
+                if season is not current_season
+            ]
+        }
+    }
+
+def _extract_season(season):
+    """État d'une saison (les objets Race du calendrier ne sont pas conservés)"""
+    circuits = season.circuits
+    return {
+        'year': season.year,
+        'category': season.category,
+        'races_count': season.races_count,
+        'points_system': list(season.points_system),
+        'teams': [_team_ref(team) for team in season.teams],
+        'circuits': [[c['name'], c['country'], c['difficulty']] for c in circuits],
+        'drivers': [
+            [driver_id, info['name'], info['team'], info['skills'], info['is_player']]
+            for driver_id, info in season.drivers.items()
+        ],
+        'driver_standings': dict(season.driver_standings),
+        'team_standings': dict(season.team_standings),
+        'calendar': [
+            [race['id'], race['name'], circuits.index(race['circuit']), race['date'], race['completed']]
+            for race in season.race_calendar
+        ],
+        'current_race_index': season.current_race_index,
+        'race_results': [
+            # Les saisons des anciennes sauvegardes conservent des dictionnaires de résultats
+            list(record) if isinstance(record, tuple)
+            else list(RaceRecord.from_results(race['id'], record, season.points_system))
+            for race, record in zip(season.race_calendar, season.race_results)
+        ]
+    }
+
+
+# --- Encodage (thread d'écriture) ---
+
+def encode_state(state, compression=COMPRESSION_ZLIB):
+    """
+    Encode l'état extrait au format binaire
+
+    Args:
+        state (dict): État renvoyé par extract_state
+        compression (int): Compression de la charge utile
+
+    Returns:
+        bytes: Données encodées
+    """
+    w = RecordWriter()
+    _write_player(w, state['player'])
+
+    career = state['career']
+    w.write_value(career['career_id'])
+    w.write_uint(career['current_year'])
+    w.write_uint(len(career['teams']))
+    for team in career['teams']:
+        _write_team(w, team)
+    w.write_value(career['drivers'])
+    w.write_value(career['history_seasons'])
+    w.write_bool(career['season'] is not None)
+    if career['season'] is not None:
+        _write_season(w, career['season'])
+
+    header = RecordWriter()
+    header.write_uint(state['version'])
+    header.write_uint(compression)
+    return header.getvalue() + COMPRESSORS[compression][0](w.getvalue())
+
+def _write_team_ref(w, ref):
+    w.write_value(ref)
+
+def _write_player(w, player):
+    w.write_str(player['name'])
+    w.write_uint(player['age'])
+    w.write_value(player['reputation'])
+    w.write_value(player['money'])
+    w.write_value(player['academy'])
+    _write_team_ref(w, player['team'])
+    w.write_str(player['category'])
+    for value in player['skills']:
+        w.write_value(value)
+    for value in player['stats']:
+        w.write_value(value)
+    for values in player['category_stats']:
+        for value in values:
+            w.write_value(value)
+    w.write_int(player['contract_years'])
+    w.write_value(player['contract_value'])
+
+def _write_team(w, team):
+    _write_team_ref(w, team['ref'])
+    w.write_value(team['performance'])
+    w.write_value(team['reputation'])
+    w.write_value(team['budget'])
+    w.write_value(team['car_development'])
+    for value in team['stats']:
+        w.write_value(value)
+
+def _write_season(w, season):
+    w.write_uint(season['year'])
+    w.write_str(season['category'])
+    w.write_uint(season['races_count'])
+    w.write_value(season['points_system'])
+    w.write_value(season['teams'])
+
+    w.write_uint(len(season['circuits']))
+    for name, country, difficulty in season['circuits']:
+        w.write_str(name)
+        w.write_str(country)
+        w.write_uint(difficulty)
+
+    w.write_uint(len(season['drivers']))
+    for driver_id, name, team, skills, is_player in season['drivers']:
+        w.write_str(driver_id)
+        w.write_str(name)
+        w.write_str(team)
+        w.write_value(skills)
+        w.write_bool(is_player)
+
+    w.write_value(season['driver_standings'])
+    w.write_value(season['team_standings'])
+
+    w.write_uint(len(season['calendar']))
+    for race_id, name, circuit_index, date, completed in season['calendar']:
+        w.write_uint(race_id)
+        w.write_str(name)
+        w.write_uint(circuit_index)
+        w.write_str(date)
+        w.write_bool(completed)
+
+    w.write_uint(season['current_race_index'])
+    w.write_value(season['race_results'])
+
+
+# --- Décodage ---
+
+def decode_state(data):
+    """
+    Décode des données binaires
+
+    Args:
+        data (bytes): Données écrites par encode_state
+
+    Returns:
+        dict: État de la carrière (version courante)
+    """
+    r = RecordReader(data)
+    version = r.read_uint()
+    compression = r.read_uint()
+
+    if version > FORMAT_VERSION:
+        raise ValueError(f"Version de sauvegarde non supportée: {version}")
+    if compression not in COMPRESSORS:
+        raise ValueError(f"Compression inconnue: {compression}")
+
+    body = RecordReader(COMPRESSORS[compression][1](bytes(r.data[r.pos:])))
+    return _read_state(body, version)
+
+def _read_state(r, version):
+    player = _read_player(r)
+    career = {
+        'career_id': r.read_value(),
+        'current_year': r.read_uint(),
+        'teams': [_read_team(r) for _ in range(r.read_uint())],
+        'drivers': r.read_value(),
+        'history_seasons': r.read_value(),
+        'archived': []
+    }
+    career['season'] = _read_season(r) if r.read_bool() else None
+
+    return {
+        'version': version,
+        'player': player,
+        'career': career
+    }
+
+def _read_player(r):
+    return {
+        'name': r.read_str(),
+        'age': r.read_uint(),
+        'reputation': r.read_value(),
+        'money': r.read_value(),
+        'academy': r.read_value(),
+        'team': r.read_value(),
+        'category': r.read_str(),
+        'skills': [r.read_value() for _ in SKILL_NAMES],
+        'stats': [r.read_value() for _ in STAT_FIELDS],
+        'category_stats': [[r.read_value() for _ in CATEGORY_STAT_FIELDS] for _ in CATEGORIES],
+        'contract_years': r.read_int(),
+        'contract_value': r.read_value()
+    }
+
+def _read_team(r):
+    return {
+        'ref': r.read_value(),
+        'performance': r.read_value(),
+        'reputation': r.read_value(),
+        'budget': r.read_value(),
+        'car_development': r.read_value(),
+        'stats': [r.read_value() for _ in TEAM_STAT_FIELDS]
+    }
+
+def _read_season(r):
+    season = {
+        'year': r.read_uint(),
+        'category': r.read_str(),
+        'races_count': r.read_uint(),
+        'points_system': r.read_value(),
+        'teams': r.read_value()
+    }
+    season['circuits'] = [[r.read_str(), r.read_str(), r.read_uint()] for _ in range(r.read_uint())]
+    season['drivers'] = [
+        [r.read_str(), r.read_str(), r.read_str(), r.read_value(), r.read_bool()]
+        for _ in range(r.read_uint())
+    ]
+    season['driver_standings'] = r.read_value()
+    season['team_standings'] = r.read_value()
+    season['calendar'] = [
+        [r.read_uint(), r.read_str(), r.read_uint(), r.read_str(), r.read_bool()]
+        for _ in range(r.read_uint())
+    ]
+    season['current_race_index'] = r.read_uint()
+    season['race_results'] = r.read_value()
+    return season
+
+
+# --- Reconstruction des objets ---
+
+def restore_state(state):
+    """
+    Reconstruit le joueur et la carrière à partir de l'état
+
+    Args:
+        state (dict): État renvoyé par decode_state
+
+    Returns:
+        dict: {'player': Player, 'career': CareerPath}
+    """
+    data = state['player']
+    player = Player(data['name'], data['age'])
+    career = CareerPath(player)
+
+    def team_for(ref):
+        return career.teams.get(*ref) if ref else None
+
+    # Joueur
+    player.reputation = data['reputation']
+    player.money = data['money']
+    player.academy = career.teams.get_academy(data['academy'])
+    player.team = team_for(data['team'])
+    player.category = data['category']
+    for name, value in zip(SKILL_NAMES, data['skills']):
+        setattr(player.skills, name, value)
+    player.skills.calculate_overall()
+    for name, value in zip(STAT_FIELDS, data['stats']):
+        setattr(player.stats, name, value)
+    for category, values in zip(CATEGORIES, data['category_stats']):
+        setattr(player.stats, f"{category}_stats", dict(zip(CATEGORY_STAT_FIELDS, values)))
+    player.contract_years = data['contract_years']
+    player.contract_value = data['contract_value']
+
+    # Équipes
+    for team_state in state['career']['teams']:
+        team = team_for(team_state['ref'])
+        if team is None:
+            continue
+        team.performance = team_state['performance']
+        team.reputation = team_state['reputation']
+        team.budget = team_state['budget']
+        team.car_development = team_state['car_development']
+        team.stats = dict(zip(TEAM_STAT_FIELDS, team_state['stats']))
+
+    # Saison en cours
+    career_state = state['career']
+    if career_state['career_id']:
+        career.career_id = career_state['career_id']
+    career.current_year = career_state['current_year']
+    career.drivers = DriverRegistry.from_state(career_state['drivers'])
+    if career_state['season']:
+        career.current_season = _restore_season(career_state['season'], player, team_for, career.drivers, career.teams)
+
+    # Historique: la base, partagée par les sauvegardes de la carrière, n'est
+    # pas modifiée; seules les saisons de cette partie y sont lues. Les
+    # anciennes sauvegardes (pickle) gardaient leurs saisons en mémoire: elles
+    # sont archivées au premier chargement et retrouvées aux suivants.
+    if career_state['history_seasons'] is not None:
+        career.history_seasons = career_state['history_seasons']
+    elif career_state['archived']:
+        career.history_seasons = career.history.seasons_before(career.current_year)
+        if not career.history_seasons:
+            for season in career_state['archived']:
+                career.history.archive_season(_restore_season(season, player, team_for, career.drivers, career.teams))
+
+    return {'player': player, 'career': career}
+
+def _restore_season(data, player, team_for, registry, team_registry):
+    """Reconstruit une saison sans relancer la génération aléatoire"""
+    season = Season.__new__(Season)
+    season.year = data['year']
+    season.category = data['category']
+    season.races_count = data['races_count']
+    season.points_system = data['points_system']
+    season.player = player
+    season.teams = [team for team in (team_for(ref) for ref in data['teams']) if team]
+    season.team_registry = team_registry
+    season.registry = registry
+
+    season.circuits = [
+        {"name": name, "country": country, "difficulty": difficulty}
+        for name, country, difficulty in data['circuits']
+    ]
+    season.drivers = {
+        driver_id: {"name": name, "team": team, "skills": skills, "is_player": is_player}
+        for driver_id, name, team, skills, is_player in data['drivers']
+    }
+    season.driver_standings = data['driver_standings']
+    season.team_standings = data['team_standings']
+    season.race_calendar = [
+        {
+            "id": race_id,
+            "name": name,
+            "circuit": season.circuits[circuit_index],
+            "date": date,
+            "completed": completed,
+            "race_obj": None,
+            "result": None
+        }
+        for race_id, name, circuit_index, date, completed in data['calendar']
+    ]
+    season.current_race_index = data['current_race_index']
+    season.race_results = [RaceRecord.from_state(values) for values in data['race_results']]
+    for race_info, record in zip(season.race_calendar, season.race_results):
+        race_info["result"] = record
+    season.rebuild_finishes()
+    return season
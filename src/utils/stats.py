@@ -0,0 +1,167 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Fonctions statistiques simples (sans dépendance)
+"""
+
+import math
+
+def percentile(sorted_values, pct):
+    """
+    Percentile par rang le plus proche
+
+    Args:
+        sorted_values (list): Valeurs triées
+        pct (float): Percentile (0-100)
+
+    Returns:
+        float: Valeur du percentile (0 si la liste est vide)
+    """
+    if not sorted_values:
+        return 0.0
+    rank = int(round(pct / 100 * (len(sorted_values) - 1)))
+    return sorted_values[rank]
+
+def ks_two_sample(sample_a, sample_b):
+    """
+    Test de Kolmogorov-Smirnov à deux échantillons (loi asymptotique)
+
+    Args:
+        sample_a (list): Premier échantillon (valeurs continues)
+        sample_b (list): Second échantillon
+
+    Returns:
+        tuple: (statistique D, p-valeur)
+    """
+    a = sorted(sample_a)
+    b = sorted(sample_b)
+    n, m = len(a), len(b)
+    if not n or not m:
+        return 0.0, 1.0
+
+    # Plus grand écart entre les fonctions de répartition empiriques
+    i = j = 0
+    d = 0.0
+    while i < n and j < m:
+        value = min(a[i], b[j])
+        while i < n and a[i] == value:
+            i += 1
+        while j < m and b[j] == value:
+            j += 1
+        d = max(d, abs(i / n - j / m))
+
+    en = math.sqrt(n * m / (n + m))
+    return d, _kolmogorov_sf((en + 0.12 + 0.11 / en) * d)
+
+def _kolmogorov_sf(x):
+    """Probabilité que la statistique de Kolmogorov dépasse x"""
+    if x < 0.2:
+        return 1.0
+    total = 0.0
+    for k in range(1, 101):
+        term = 2 * (-1) ** (k - 1) * math.exp(-2 * k * k * x * x)
+        total += term
+        if abs(term) < 1e-10:
+            break
+    return max(0.0, min(1.0, total))
+
+def chi_square_two_sample(counts_a, counts_b):
+    """
+    Test d'homogénéité du khi-deux entre deux distributions de comptages
+
+    Les catégories vides dans les deux échantillons sont ignorées.
+
+    Args:
+        counts_a (dict): Catégorie -> effectif du premier échantillon
+        counts_b (dict): Catégorie -> effectif du second échantillon
+
+    Returns:
+        tuple: (statistique du khi-deux, degrés de liberté, p-valeur)
+    """
+    keys = [key for key in set(counts_a) | set(counts_b) if counts_a.get(key, 0) + counts_b.get(key, 0) > 0]
+    n_a = sum(counts_a.get(key, 0) for key in keys)
+    n_b = sum(counts_b.get(key, 0) for key in keys)
+    dof = len(keys) - 1
+    if not n_a or not n_b or dof < 1:
+        return 0.0, 0, 1.0
+
+    statistic = 0.0
+    total = n_a + n_b
+    for key in keys:
+        column = counts_a.get(key, 0) + counts_b.get(key, 0)
+        for observed, n in ((counts_a.get(key, 0), n_a), (counts_b.get(key, 0), n_b)):
+            expected = n * column / total
+            statistic += (observed - expected) ** 2 / expected
+    return statistic, dof, chi_square_sf(statistic, dof)
+
+def chi_square_sf(x, dof):
+    """
+    Fonction de survie de la loi du khi-deux (fonction gamma incomplète régularisée)
+
+    Args:
+        x (float): Statistique
+        dof (int): Degrés de liberté
+
+    Returns:
+        float: P(X > x)
+    """
+    if x <= 0:
+        return 1.0
+    a = dof / 2
+    y = x / 2
+    log_prefix = a * math.log(y) - y - math.lgamma(a)
+
+    if y < a + 1:
+        # Développement en série de la fonction gamma incomplète inférieure
+        term = total = 1 / a
+        k = a
+        for _ in range(500):
+            k += 1
+            term *= y / k
+            total += term
+            if abs(term) < abs(total) * 1e-12:
+                break
+        return max(0.0, 1 - total * math.exp(log_prefix))
+
+    # Fraction continue de la fonction gamma incomplète supérieure (Lentz)
+    tiny = 1e-300
+    b = y + 1 - a
+    c = 1 / tiny
+    d = 1 / b
+    h = d
+    for i in range(1, 500):
+        an = -i * (i - a)
+        b += 2
+        d = an * d + b
+        d = tiny if abs(d) < tiny else d
+        c = b + an / c
+        c = tiny if abs(c) < tiny else c
+        d = 1 / d
+        delta = d * c
+        h *= delta
+        if abs(delta - 1) < 1e-12:
+            break
+    return min(1.0, math.exp(log_prefix) * h)
+
+def two_proportion_test(successes_a, n_a, successes_b, n_b):
+    """
+    Test z de l'égalité de deux proportions
+
+    Args:
+        successes_a (int): Succès du premier échantillon
+        n_a (int): Taille du premier échantillon
+        successes_b (int): Succès du second échantillon
+        n_b (int): Taille du second échantillon
+
+    Returns:
+        tuple: (statistique z, p-valeur bilatérale)
+    """
+    if not n_a or not n_b:
+        return 0.0, 1.0
+    pooled = (successes_a + successes_b) / (n_a + n_b)
+    variance = pooled * (1 - pooled) * (1 / n_a + 1 / n_b)
+    if variance <= 0:
+        return 0.0, 1.0
+    z = (successes_a / n_a - successes_b / n_b) / math.sqrt(variance)
+    return z, math.erfc(abs(z) / math.sqrt(2))
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Fixtures communes: sauvegardes et historique dans un dossier temporaire,
+carrière démarrée avec une graine fixe
+"""
+
+import os
+import random
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pytest
+from src.player import Player
+from src.career.career_path import CareerPath
+from src.career import history
+from src.utils import save_load
+
+
+@pytest.fixture
+def storage(tmp_path, monkeypatch):
+    """Dossiers des sauvegardes et des bases d'historique redirigés vers tmp_path"""
+    monkeypatch.setattr(save_load, 'SAVE_DIR', str(tmp_path / 'saves'))
+    monkeypatch.setattr(history, 'HISTORY_DIR', str(tmp_path / 'history'))
+    return tmp_path
+
+
+@pytest.fixture
+def career(storage):
+    """Carrière démarrée dans la première académie"""
+    random.seed(0)
+    player = Player("Pilote Test", 16)
+    career = CareerPath(player)
+    career.start_career(career.academies[0])
+    yield career
+    career.history.close()
+
+
+def play_race(career):
+    """
+    Dispute la prochaine course de la saison comme l'interface de course
+
+    Returns:
+        dict: Résultats de la course
+    """
+    season = career.current_season
+    results = season.get_next_race()['race_obj'].simulate_race()
+    season.complete_race(results)
+    career.player.update_stats({
+        'position': results['player_position'],
+        'points': results['points'],
+        'prize_money': results['prize_money'],
+        'skill_improvements': results['skill_improvements']
+    })
+    return results
+
+
+def play_season(career):
+    """Dispute les courses restantes, termine la saison et démarre la suivante"""
+    season = career.current_season
+    while season.current_race_index < len(season.race_calendar):
+        play_race(career)
+    career.player.advance_year()
+    career.end_season()
+    career.start_new_season()
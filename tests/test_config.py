@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tests du service de configuration: écriture différée, ordre des écritures,
+flush/close et nouvelle tentative après un échec
+"""
+
+import json
+import time
+
+import pytest
+
+from src.utils import config
+from src.utils.config import DEFAULT_CONFIG, ConfigService
+
+
+def read(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / 'config.json')
+
+
+def test_changes_are_grouped_into_one_delayed_write(path, monkeypatch):
+    writes = []
+    real_write = config.atomic_write
+
+    def counting_write(target, chunks):
+        writes.append(time.monotonic())
+        real_write(target, chunks)
+
+    monkeypatch.setattr(config, 'atomic_write', counting_write)
+    service = ConfigService(path, write_delay=0.5)
+    try:
+        start = time.monotonic()
+        for fps in (30, 45, 50):
+            service.set('fps', fps)
+
+        assert wait_for(lambda: writes)
+        assert writes[0] - start >= 0.5
+        assert wait_for(lambda: read(path)['fps'] == 50)
+        time.sleep(0.6)
+        assert len(writes) == 1
+    finally:
+        service.close()
+
+
+def test_older_copy_never_overwrites_a_newer_one(path):
+    service = ConfigService(path, write_delay=60)
+    try:
+        service.set('fps', 30)
+        stale = (service.snapshot(), service._generation)
+        service.set('fps', 90)
+        assert service.flush()
+
+        # Copie prise avant la dernière modification (thread d'écriture en retard)
+        assert service._write(*stale)
+        assert read(path)['fps'] == 90
+    finally:
+        service.close()
+
+
+def test_close_writes_pending_changes(path):
+    service = ConfigService(path, write_delay=60)
+    service.set('difficulty', 'hard')
+    service.close()
+
+    assert read(path)['difficulty'] == 'hard'
+    assert not service._thread.is_alive()
+    assert ConfigService(path).get('difficulty') == 'hard'
+
+
+def test_failed_write_is_retried(path, monkeypatch):
+    real_write = config.atomic_write
+    failures = []
+
+    def failing_write(target, chunks):
+        if not failures:
+            failures.append(target)
+            raise OSError("disque plein")
+        real_write(target, chunks)
+
+    monkeypatch.setattr(config, 'atomic_write', failing_write)
+    service = ConfigService(path, write_delay=0.05)
+    try:
+        service.set('fps', 75)
+        assert wait_for(lambda: failures)
+        assert wait_for(lambda: service._written == service._generation)
+        assert read(path)['fps'] == 75
+    finally:
+        service.close()
+
+
+def test_failed_flush_keeps_changes_pending(path, monkeypatch):
+    service = ConfigService(path, write_delay=60)
+    try:
+        service.set('fps', 75)
+        monkeypatch.setattr(config, 'atomic_write', lambda target, chunks: 1 / 0)
+        assert not service.flush()
+
+        monkeypatch.undo()
+        assert service.flush()
+        assert read(path)['fps'] == 75
+    finally:
+        service.close()
+
+
+def test_defaults_stay_immutable(path):
+    with pytest.raises(TypeError):
+        DEFAULT_CONFIG['fps'] = 1
+
+    service = ConfigService(path, write_delay=60)
+    try:
+        values = service.snapshot()
+        values['fps'] = 1
+        service.set('screen_width', 640)
+        service.reset()
+
+        assert service.get('fps') == DEFAULT_CONFIG['fps'] == 60
+        assert service.get('screen_width') == DEFAULT_CONFIG['screen_width'] == 1024
+    finally:
+        service.close()
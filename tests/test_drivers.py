@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tests de la base des pilotes IA: plateaux, fin de saison et état sauvegardé
+"""
+
+import random
+
+from src.career.academy import create_all_academies
+from src.career.drivers import (
+    RETIRED, RETIREMENT_AGE, SEATS_PER_TEAM, DriverRegistry, registry_driver_id, season_driver_id
+)
+from tests.conftest import play_season
+
+
+def test_field_fills_every_seat():
+    random.seed(2)
+    teams = create_all_academies().in_category('f3')
+    registry = DriverRegistry()
+    drivers = registry.field('f3', teams, teams[0].name)
+
+    assert len(drivers) == SEATS_PER_TEAM * len(teams) - 1
+    assert sum(1 for info in drivers.values() if info['team'] == teams[0].name) == SEATS_PER_TEAM - 1
+    for season_id, info in drivers.items():
+        row = registry.rows[registry_driver_id(season_id)]
+        assert registry.names[row] == info['name']
+        assert registry.teams[row] == info['team']
+
+    # Un second plateau réutilise les mêmes pilotes
+    assert registry.field('f3', teams, teams[0].name) == drivers
+
+
+def test_season_ids_round_trip():
+    assert registry_driver_id(season_driver_id(0)) == 0
+    assert registry_driver_id(season_driver_id(41)) == 41
+    assert registry_driver_id('player') is None
+
+
+def test_record_season_updates_stats(career):
+    random.seed(1)
+    season = career.current_season
+    registry = career.drivers
+    ages = {uid: registry.ages[row] for uid, row in registry.rows.items()}
+    play_season(career)
+
+    races = len(season.race_results)
+    wins = {}
+    for record in season.race_results:
+        if record.winner != 'player':
+            uid = registry_driver_id(record.winner)
+            wins[uid] = wins.get(uid, 0) + 1
+    assert wins
+    for uid, count in wins.items():
+        assert registry.wins[registry.rows[uid]] >= count
+
+    # Pilotes du plateau présents à chaque course
+    regulars = [registry_driver_id(season_id) for season_id in season.drivers if season_id != 'player'
+                and all(season_id in record.order for record in season.race_results)]
+    assert regulars
+    for uid in regulars:
+        row = registry.rows[uid]
+        assert registry.races[row] == races
+        assert registry.ages[row] == ages[uid] + 1
+
+
+def test_old_drivers_retire():
+    random.seed(3)
+    registry = DriverRegistry()
+    team = create_all_academies().in_category('f2')[0]
+    veteran = registry.add("Vétéran", 'f2', team.name, 70, RETIREMENT_AGE - 1)
+
+    class EmptySeason:
+        race_results = []
+
+    registry.record_season(EmptySeason())
+    assert registry.categories[veteran] == RETIRED
+    assert veteran not in registry.drivers_of('f2', team.name)
+
+
+def test_state_round_trip(career):
+    play_season(career)
+    registry = career.drivers
+    state = registry.to_state()
+
+    restored = DriverRegistry.from_state(state)
+    assert restored.to_state() == state
+    assert restored.rows == registry.rows
+    assert restored.by_team == registry.by_team
+
+
+def test_from_field_keeps_season_ids():
+    drivers = {
+        'player': {"name": "Joueur", "team": "A", "skills": 50, "is_player": True},
+        'driver_3': {"name": "Trois", "team": "A", "skills": 60, "is_player": False},
+        'driver_7': {"name": "Sept", "team": "B", "skills": 70, "is_player": False}
+    }
+    registry = DriverRegistry.from_field('f3', drivers)
+
+    assert registry.names[registry.rows[registry_driver_id('driver_3')]] == "Trois"
+    assert registry.names[registry.rows[registry_driver_id('driver_7')]] == "Sept"
+    assert registry.next_uid == 7
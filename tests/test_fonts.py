@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tests du résolveur de polices: cache persistant, invalidation quand les
+dossiers de polices changent et repli quand un fichier a disparu
+"""
+
+import os
+
+import pytest
+from src.ui.fonts import FontResolver
+
+
+class CountingResolver(FontResolver):
+    """Résolveur qui note les polices résolues par la table du système"""
+
+    def __init__(self, cache_path, directories, entry):
+        super().__init__(cache_path, directories)
+        self.entry = entry
+        self.resolved = []
+
+    def _resolve(self, name, size, bold, italic):
+        self.resolved.append(name)
+        return list(self.entry)
+
+
+@pytest.fixture
+def fonts_dir(tmp_path):
+    directory = tmp_path / 'fonts'
+    directory.mkdir()
+    return str(directory)
+
+
+def test_resolved_fonts_are_cached_on_disk(tmp_path, fonts_dir):
+    cache = str(tmp_path / 'fonts.json')
+    first = CountingResolver(cache, [fonts_dir], [None, False, False])
+    font = first.get_font('Arial', 20)
+    assert first.get_font('Arial', 20) is font
+    assert first.resolved == ['Arial']
+
+    second = CountingResolver(cache, [fonts_dir], [None, False, False])
+    second.get_font('Arial', 20)
+    second.get_font('arial', 24)
+    assert second.resolved == []
+
+
+def test_cache_is_invalidated_when_font_directories_change(tmp_path, fonts_dir):
+    cache = str(tmp_path / 'fonts.json')
+    CountingResolver(cache, [fonts_dir], [None, False, False]).get_font('Arial', 20)
+
+    # Nouvelle police installée: la date du dossier change
+    with open(os.path.join(fonts_dir, 'new.ttf'), 'wb'):
+        pass
+    stat = os.stat(fonts_dir)
+    os.utime(fonts_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    resolver = CountingResolver(cache, [fonts_dir], [None, False, False])
+    resolver.get_font('Arial', 20)
+    assert resolver.resolved == ['Arial']
+
+
+def test_missing_font_file_is_resolved_again(tmp_path, fonts_dir):
+    cache = str(tmp_path / 'fonts.json')
+    missing = os.path.join(fonts_dir, 'deleted.ttf')
+
+    # Cache pointant vers un fichier supprimé sans changement de dossier
+    first = CountingResolver(cache, [fonts_dir], [None, False, False])
+    first._load()
+    first.entries[first._key('Arial', False, False)] = [missing, False, False]
+    first._save()
+
+    resolver = CountingResolver(cache, [fonts_dir], [None, True, False])
+    font = resolver.get_font('Arial', 20)
+    assert resolver.resolved == ['Arial']
+    assert font.get_bold()
+    assert resolver.entries[resolver._key('Arial', False, False)] == [None, True, False]
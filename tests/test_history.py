@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tests de l'historique SQLite: requêtes, saisons visibles par chaque
+sauvegarde et suppression des bases inutilisées
+"""
+
+import os
+import random
+
+from src.player import Player
+from src.career.career_path import CareerPath
+from src.career.drivers import registry_driver_id
+from src.career.history import CareerHistory
+from src.utils import save_load
+from tests.conftest import play_season
+
+
+def summary_years(career):
+    return [season['year'] for season in career.history.season_summaries()]
+
+
+def test_archived_season_queries(career):
+    season = career.current_season
+    play_season(career)
+
+    summaries = career.history.season_summaries()
+    assert [s['year'] for s in summaries] == [season.year]
+    standings = season.get_final_standings()
+    assert summaries[0]['player_position'] == standings['player_position']
+    assert summaries[0]['player_points'] == standings['player_points']
+
+    circuit = season.race_results[0].circuit
+    assert [race['year'] for race in career.history.circuit_history(circuit)] == [season.year]
+
+
+def test_driver_results_do_not_merge_homonyms(career):
+    season = career.current_season
+    first, second = [driver_id for driver_id, info in season.drivers.items() if not info['is_player']][:2]
+    season.drivers[second]['name'] = season.drivers[first]['name']
+    play_season(career)
+
+    results = career.history.driver_results(registry_driver_id(first))
+    assert len(results) == len(season.race_results)
+    assert {result['team'] for result in results} == {season.drivers[first]['team']}
+    assert [result['position'] for result in results] == \
+        [record.position_of(first) for record in season.race_results]
+
+
+def test_reloaded_save_does_not_touch_newer_saves(career):
+    data = {'player': career.player, 'career': career}
+    play_season(career)
+    save_load.save_game(data, 1)
+    play_season(career)
+    save_load.save_game(data, 2)
+    expected = summary_years(career)
+    career.history.close()
+
+    # Rechargement de la première sauvegarde et nouvelle saison de la même année
+    replayed = save_load.load_game(1)
+    assert summary_years(replayed['career']) == expected[1:]
+    play_season(replayed['career'])
+    assert summary_years(replayed['career']) == expected
+    replayed['career'].history.close()
+
+    # Les deux saisons de la même année sont conservées
+    newer = save_load.load_game(2)
+    assert summary_years(newer['career']) == expected
+    count = newer['career'].history.connection.execute(
+        "SELECT COUNT(*) FROM seasons WHERE year = ?", (expected[0],)
+    ).fetchone()[0]
+    assert count == 2
+    assert newer['career'].history.seasons != replayed['career'].history_seasons
+    newer['career'].history.close()
+
+
+def test_seasons_before_picks_latest_of_each_year(career):
+    for _ in range(2):
+        play_season(career)
+    view = career.history
+    path = view.path
+    career_seasons = list(view.seasons)
+    career.history.close()
+
+    other = CareerHistory(path)
+    assert other.season_summaries() == []
+    assert other.seasons_before(career.current_year) == career_seasons
+    assert other.seasons_before(career.current_year - 1) == career_seasons[:1]
+    other.close()
+
+
+def test_deleting_the_last_save_removes_the_history(career):
+    data = {'player': career.player, 'career': career}
+    play_season(career)
+    path = career.history.path
+    save_load.save_game(data, 1)
+    save_load.save_game(data, 2)
+    career.history.close()
+
+    # Base encore utilisée par l'emplacement 2
+    assert save_load.delete_save(1)
+    assert os.path.exists(path)
+
+    assert save_load.delete_save(2)
+    assert not os.path.exists(path)
+
+
+def test_new_career_replacing_the_autosave_removes_the_old_history(career, storage):
+    play_season(career)
+    old_path = career.history.path
+    save_load.save_game({'player': career.player, 'career': career})
+    career.history.close()
+
+    random.seed(5)
+    player = Player("Nouveau Pilote", 16)
+    new_career = CareerPath(player)
+    new_career.start_career(new_career.academies[2])
+    try:
+        # Les anciennes versions de l'auto-save utilisent encore l'ancienne base
+        for _ in range(save_load.SAVE_GENERATIONS - 1):
+            save_load.save_game({'player': player, 'career': new_career})
+            assert os.path.exists(old_path)
+
+        save_load.save_game({'player': player, 'career': new_career})
+        assert not os.path.exists(old_path)
+    finally:
+        new_career.history.close()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tests du journal d'auto-sauvegarde: rejeu au chargement, enregistrement
+interrompu et changements de structure de la carrière
+"""
+
+import os
+
+from src.utils import save_load
+from src.utils.journal import JOURNAL_PREFIX, CareerJournal, read_journal, structure_key
+from src.utils.serialization import extract_state
+from tests.conftest import play_race, play_season
+
+
+def autosave(journal, career):
+    """Auto-sauvegarde synchrone, selon la même règle que Game.save_game"""
+    player = career.player
+    if journal.can_append(player, career):
+        assert save_load.append_journal(journal.base_id, journal.take_pending())
+        return False
+
+    journal_id = int.from_bytes(os.urandom(8), 'little')
+    journal.reset(journal_id, structure_key(player, career))
+    snapshot = save_load.snapshot_save_data({'player': player, 'career': career}, journal_id)
+    assert save_load.write_snapshot(snapshot)
+    return True
+
+
+def loaded_state():
+    loaded = save_load.load_game()
+    loaded['career'].history.close()
+    return extract_state(loaded['player'], loaded['career'])
+
+
+def test_journal_is_replayed_on_load(career):
+    journal = CareerJournal()
+    career.player.journal = journal
+    assert autosave(journal, career)
+
+    for _ in range(3):
+        play_race(career)
+        assert not autosave(journal, career)
+
+    assert len(read_journal(save_load.get_journal_path(), journal.base_id)) == 6
+    assert loaded_state() == extract_state(career.player, career)
+
+
+def test_torn_record_is_ignored(career):
+    journal = CareerJournal()
+    career.player.journal = journal
+    autosave(journal, career)
+    play_race(career)
+    autosave(journal, career)
+    expected = extract_state(career.player, career)
+
+    # Écriture interrompue au milieu de l'enregistrement suivant
+    with open(save_load.get_journal_path(), 'ab') as f:
+        f.write(b'\x40\x00\x00\x00\x12')
+
+    assert loaded_state() == expected
+
+
+def test_structure_change_writes_a_new_base(career):
+    journal = CareerJournal()
+    career.player.journal = journal
+    autosave(journal, career)
+    first_base = journal.base_id
+    play_race(career)
+    autosave(journal, career)
+
+    # Nouvelle saison: le journal ne suffit plus, l'ancien journal est supprimé
+    play_season(career)
+    assert autosave(journal, career)
+    assert journal.base_id != first_base
+    assert not os.path.exists(save_load.get_journal_path())
+    assert read_journal(save_load.get_journal_path(), first_base) == []
+
+    play_race(career)
+    assert not autosave(journal, career)
+    assert loaded_state() == extract_state(career.player, career)
+
+
+def test_journal_size_threshold(career):
+    # Seuil atteint dès le premier ajout au journal
+    journal = CareerJournal(threshold=JOURNAL_PREFIX.size + 1)
+    career.player.journal = journal
+    assert autosave(journal, career)
+
+    play_race(career)
+    assert not autosave(journal, career)
+
+    # Journal au-delà du seuil: sauvegarde complète
+    play_race(career)
+    assert autosave(journal, career)
+    assert loaded_state() == extract_state(career.player, career)
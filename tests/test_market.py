@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tests du marché des transferts: affectation stable, baquet réservé au
+joueur et compactage des pilotes retraités
+"""
+
+import random
+
+from src.career.academy import create_all_academies
+from src.career.drivers import CATEGORIES, RETIRED, SEATS_PER_TEAM, DriverRegistry
+from src.career.market import DriverMarket
+from tests.conftest import play_season
+
+
+def paddock(seed):
+    """Registre des équipes et base des pilotes de toutes les catégories"""
+    random.seed(seed)
+    teams = create_all_academies()
+    registry = DriverRegistry()
+    for category in CATEGORIES:
+        registry.field(category, teams.in_category(category), None)
+    return teams, registry
+
+
+def test_every_seat_is_filled_once():
+    teams, registry = paddock(4)
+    for driver_id in range(len(registry)):
+        registry.contracts[driver_id] = driver_id % 2
+    DriverMarket(registry, teams).run()
+
+    for category in CATEGORIES:
+        for team in teams.in_category(category):
+            assert len(registry.drivers_of(category, team.name)) == SEATS_PER_TEAM
+
+
+def test_assignment_is_stable():
+    teams, registry = paddock(5)
+    for driver_id in range(len(registry)):
+        registry.contracts[driver_id] = 0
+
+    market = DriverMarket(registry, teams)
+    scores = market.score_drivers()
+    market.run()
+
+    # Aucun pilote ne préfère une équipe plus attractive qui préférerait ce pilote
+    for category in CATEGORIES:
+        ranking = {team.name: i for i, team in enumerate(market.team_appeal(category))}
+        signed = [d for d in registry.drivers_in(category) if registry.contracts[d] > 0]
+        for driver_id in signed:
+            for other in signed:
+                better_team = ranking[registry.teams[other]] < ranking[registry.teams[driver_id]]
+                assert not (better_team and scores[driver_id] > scores[other])
+
+
+def test_player_seat_is_reserved_first():
+    teams, registry = paddock(6)
+    player_team = teams.in_category('f2')[0]
+    contracted = registry.drivers_of('f2', player_team.name)
+    assert len(contracted) == SEATS_PER_TEAM
+    for driver_id in contracted:
+        registry.contracts[driver_id] = 3
+    uids = {registry.uids[d] for d in contracted}
+
+    moves = DriverMarket(registry, teams).run(player_team)
+
+    # Un seul pilote reste à côté du joueur, l'autre passe par le marché
+    remaining = registry.drivers_of('f2', player_team.name)
+    assert len(remaining) == SEATS_PER_TEAM - 1
+    released = [move for move in moves if move[0] in uids]
+    assert len(released) == 1
+    assert released[0][2] != ('f2', player_team.name)
+
+
+def test_compact_removes_retired_drivers():
+    teams, registry = paddock(7)
+    retired = registry.drivers_in('f1')[:3]
+    for driver_id in retired:
+        registry.retire(driver_id)
+    active = {registry.uids[d]: registry.names[d] for d in range(len(registry)) if registry.categories[d] != RETIRED}
+    size = len(registry)
+
+    assert registry.compact() == len(retired)
+    assert len(registry) == size - len(retired)
+    assert RETIRED not in registry.categories
+    assert {registry.uids[row]: registry.names[row] for row in range(len(registry))} == active
+    assert registry.rows == {uid: row for row, uid in enumerate(registry.uids)}
+
+    # Les identifiants des pilotes supprimés ne sont pas réattribués
+    rookie = registry.sign_rookie('f1', teams.in_category('f1')[0])
+    assert registry.uids[rookie] == registry.next_uid - 1 >= size
+    assert registry.compact() == 0
+
+
+def test_registry_stays_bounded_over_a_career(career):
+    sizes = []
+    for _ in range(8):
+        play_season(career)
+        sizes.append(len(career.drivers))
+        assert RETIRED not in career.drivers.categories
+    assert max(sizes) <= 3 * SEATS_PER_TEAM * len(career.teams.in_category('f3'))
@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tests des sauvegardes atomiques: rotation des versions et repli sur
+une ancienne version valide
+"""
+
+import os
+
+import pytest
+from src.utils import save_load
+from src.utils.atomic import atomic_write, backup_path, generation_paths
+from tests.conftest import play_race
+
+
+def read(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def test_atomic_write_rotates_generations(tmp_path):
+    path = str(tmp_path / 'file.dat')
+    for i in range(4):
+        atomic_write(path, [b'version ', str(i).encode()], backups=2)
+
+    assert [read(p) for p in generation_paths(path, 2)] == [b'version 3', b'version 2', b'version 1']
+    assert not os.path.exists(backup_path(path, 3))
+    assert not os.path.exists(f"{path}.tmp")
+
+
+def test_atomic_write_failure_keeps_previous_version(tmp_path):
+    path = str(tmp_path / 'file.dat')
+    atomic_write(path, [b'ancienne'], backups=1)
+
+    def chunks():
+        yield b'nouv'
+        raise OSError("disque plein")
+
+    with pytest.raises(OSError):
+        atomic_write(path, chunks(), backups=1)
+
+    assert read(path) == b'ancienne'
+    assert not os.path.exists(backup_path(path, 1))
+    assert not os.path.exists(f"{path}.tmp")
+
+
+def test_load_falls_back_to_previous_generation(career):
+    data = {'player': career.player, 'career': career}
+    assert save_load.save_game(data, 1)
+    play_race(career)
+    assert save_load.save_game(data, 1)
+
+    # Version la plus récente tronquée: la précédente est chargée
+    path = save_load.get_save_path(1)
+    content = read(path)
+    with open(path, 'wb') as f:
+        f.write(content[:-10])
+
+    loaded = save_load.load_game(1)
+    loaded['career'].history.close()
+    assert loaded['career'].current_season.current_race_index == 0
+
+    # Version la plus récente corrompue (somme de contrôle): même repli
+    with open(path, 'wb') as f:
+        f.write(content[:-1] + bytes([content[-1] ^ 0xFF]))
+
+    loaded = save_load.load_game(1)
+    loaded['career'].history.close()
+    assert loaded['career'].current_season.current_race_index == 0
+
+
+def test_load_fails_when_every_generation_is_damaged(career):
+    data = {'player': career.player, 'career': career}
+    for _ in range(save_load.SAVE_GENERATIONS):
+        assert save_load.save_game(data, 2)
+
+    for path in save_load.get_generation_paths(2):
+        with open(path, 'r+b') as f:
+            f.truncate(os.path.getsize(path) // 2)
+
+    assert save_load.load_game(2) is None
+
+
+def test_delete_removes_every_generation(career):
+    data = {'player': career.player, 'career': career}
+    for _ in range(2):
+        assert save_load.save_game(data, 4)
+
+    assert save_load.delete_save(4)
+    assert not any(os.path.exists(path) for path in save_load.get_generation_paths(4))
+    assert 4 not in save_load.list_save_slots()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tests des sauvegardes en arrière-plan: l'image des données est prise à
+la demande, la partie peut continuer pendant l'écriture
+"""
+
+import threading
+
+from src.utils import save_load
+from src.utils.save_load import SaveWriter
+from tests.conftest import play_race
+
+
+def test_snapshot_is_isolated_from_later_changes(career, monkeypatch):
+    player = career.player
+    name, money, races = player.name, player.money, len(career.current_season.race_results)
+
+    # Thread d'écriture bloqué: la sauvegarde est écrite après les modifications
+    release = threading.Event()
+    write_snapshot = save_load.write_snapshot
+
+    def delayed_write(*args):
+        release.wait()
+        return write_snapshot(*args)
+
+    monkeypatch.setattr(save_load, 'write_snapshot', delayed_write)
+    writer = SaveWriter()
+    results = []
+    try:
+        writer.submit({'player': player, 'career': career}, 1, results.append)
+
+        player.name = "Autre Pilote"
+        play_race(career)
+        assert player.money != money
+
+        release.set()
+        writer.flush()
+    finally:
+        release.set()
+        writer.close()
+
+    assert results == [True]
+    loaded = save_load.load_game(1)
+    try:
+        assert loaded['player'].name == name
+        assert loaded['player'].money == money
+        assert len(loaded['career'].current_season.race_results) == races
+    finally:
+        loaded['career'].history.close()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tests des classements de saison: départage au nombre d'arrivées à chaque
+position (victoires, puis deuxièmes places...)
+"""
+
+import random
+
+from src.racing.results import RaceRecord
+from src.utils.serialization import decode_state, encode_state, extract_state, restore_state
+
+
+def complete(season, leaders, points):
+    """
+    Termine la prochaine course: leaders en tête dans l'ordre donné, points imposés
+
+    Args:
+        season (Season): Saison en cours
+        leaders (list): Premiers pilotes de l'ordre d'arrivée
+        points (list): Points marqués par les premiers pilotes (0 pour les suivants)
+    """
+    order = list(leaders) + [driver_id for driver_id in season.drivers if driver_id not in leaders]
+    points = list(points) + [0] * (len(order) - len(points))
+    record = RaceRecord(0, "GP", "Circuit", tuple(order), tuple(order), tuple(points),
+                        None, (), "Sec", tuple(0.0 for _ in order))
+    season.complete_race({"record": record})
+
+
+def ranking(season):
+    return [driver_id for driver_id, _ in season.get_current_standings()["driver_standings"]]
+
+
+def ai_drivers(season, count):
+    return [driver_id for driver_id, info in season.drivers.items() if not info["is_player"]][:count]
+
+
+def test_more_wins_breaks_a_points_tie(career):
+    season = career.current_season
+    a, b = ai_drivers(season, 2)
+
+    # 20 points chacun: une victoire et une troisième place contre deux deuxièmes places
+    complete(season, [a, b], [10, 10])
+    complete(season, ["player", b, a], [0, 10, 10])
+
+    assert season.driver_standings[a] == season.driver_standings[b] == 20
+    assert ranking(season)[:2] == [a, b]
+
+
+def test_countback_goes_down_the_positions(career):
+    season = career.current_season
+    a, b, c = ai_drivers(season, 3)
+
+    # Une victoire chacun, départage aux deuxièmes places puis aux troisièmes
+    complete(season, [a, c, b], [10, 5, 5])
+    complete(season, [b, a, c], [10, 5, 5])
+    complete(season, [c, b, a], [10, 5, 5])
+    complete(season, ["player", a, c, b], [0, 0, 0, 0])
+
+    assert season.driver_standings[a] == season.driver_standings[b] == season.driver_standings[c] == 20
+    assert ranking(season)[:3] == [a, c, b]
+
+
+def test_team_countback(career):
+    season = career.current_season
+    teams = {}
+    for driver_id, info in season.drivers.items():
+        if not info["is_player"]:
+            teams.setdefault(info["team"], driver_id)
+    (team_a, a), (team_b, b) = list(teams.items())[:2]
+
+    complete(season, [a, b], [10, 10])
+    complete(season, ["player", b, a], [0, 10, 10])
+
+    team_ranking = [name for name, _ in season.get_current_standings()["team_standings"]]
+    assert team_ranking.index(team_a) < team_ranking.index(team_b)
+
+
+def test_matches_a_full_recount(career):
+    season = career.current_season
+    field = list(season.drivers)
+    random.seed(11)
+
+    # Un point par course pour les trois premiers: nombreuses égalités
+    for _ in range(len(season.race_calendar)):
+        random.shuffle(field)
+        complete(season, field[:3], [1, 1, 1])
+
+    def recount(driver_id):
+        positions = [record.position_of(driver_id) for record in season.race_results]
+        return (-season.driver_standings[driver_id],) + tuple(-positions.count(p) for p in range(1, len(field) + 1))
+
+    assert ranking(season) == sorted(season.drivers, key=recount)
+
+
+def test_countback_survives_a_save(career):
+    season = career.current_season
+    a, b = ai_drivers(season, 2)
+    complete(season, [a, b], [10, 10])
+    complete(season, ["player", b, a], [0, 10, 10])
+
+    restored = restore_state(decode_state(encode_state(extract_state(career.player, career))))
+    try:
+        assert ranking(restored["career"].current_season) == ranking(season)
+    finally:
+        restored["career"].history.close()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tests du format de sauvegarde binaire: aller-retour et chargement des
+anciennes sauvegardes (pickle)
+"""
+
+import os
+import pickle
+import random
+
+import pytest
+from src.player import Player
+from src.career.career_path import CareerPath
+from src.utils import save_load
+from src.utils.serialization import (
+    COMPRESSORS, FORMAT_VERSION, decode_state, encode_state, extract_state, restore_state
+)
+from tests.conftest import play_race
+
+def plain(value):
+    """État sous la forme produite par le décodage (tuples -> listes)"""
+    if isinstance(value, (list, tuple)):
+        return [plain(item) for item in value]
+    if isinstance(value, dict):
+        return {key: plain(item) for key, item in value.items()}
+    return value
+
+
+@pytest.mark.parametrize('compression', sorted(COMPRESSORS))
+def test_encode_decode_round_trip(career, compression):
+    for _ in range(2):
+        play_race(career)
+
+    state = extract_state(career.player, career)
+    assert decode_state(encode_state(state, compression)) == plain(state)
+
+
+def test_restore_round_trip(career):
+    for _ in range(3):
+        play_race(career)
+
+    state = extract_state(career.player, career)
+    restored = restore_state(decode_state(encode_state(state)))
+    try:
+        assert plain(extract_state(restored['player'], restored['career'])) == plain(state)
+        season = restored['career'].current_season
+        assert season.race_results == career.current_season.race_results
+        assert season.get_current_standings() == career.current_season.get_current_standings()
+    finally:
+        restored['career'].history.close()
+
+
+def test_unknown_version_is_rejected(career):
+    data = bytearray(encode_state(extract_state(career.player, career)))
+    data[0] = FORMAT_VERSION + 1
+    with pytest.raises(ValueError):
+        decode_state(bytes(data))
+
+
+def legacy_save(path):
+    """
+    Écrit une sauvegarde au format des anciennes versions: graphe d'objets
+    picklé, saisons passées gardées en mémoire, sans identifiant de carrière
+
+    Returns:
+        CareerPath: Carrière sauvegardée
+    """
+    random.seed(1)
+    player = Player("Ancien Pilote", 16)
+    career = CareerPath(player)
+    career.start_career(career.academies[1])
+    finished = career.current_season
+    finished.get_final_standings()
+    career.current_year += 1
+    career.start_new_season()
+    play_race(career)
+
+    career.seasons = [finished, career.current_season]
+    del career.career_id, career._history_seasons
+    save_load.ensure_save_dir()
+    with open(path, 'wb') as f:
+        pickle.dump({'player': player, 'career': career, 'save_date': 'ancienne'}, f)
+    return career
+
+
+def test_legacy_pickle_is_loaded_without_writing(storage):
+    path = save_load.get_save_path(3)
+    career = legacy_save(path)
+    with open(path, 'rb') as f:
+        original = f.read()
+
+    first = save_load.load_game(3)
+    assert first['migrated']
+    assert first['player'].name == "Ancien Pilote"
+    assert first['save_date'] == 'ancienne'
+    assert first['career'].current_season.race_results == career.current_season.race_results
+    assert [s['year'] for s in first['career'].history.season_summaries()] == [career.current_year - 1]
+    first['career'].history.close()
+
+    # Le fichier n'est pas modifié par le chargement
+    with open(path, 'rb') as f:
+        assert f.read() == original
+    assert not any(os.path.exists(p) for p in save_load.get_generation_paths(3)[1:])
+
+    # Un second chargement retrouve la même carrière, sans archiver à nouveau ses saisons
+    second = save_load.load_game(3)
+    history = second['career'].history
+    assert second['career'].career_id == first['career'].career_id
+    assert history.seasons == first['career'].history_seasons
+    assert history.connection.execute("SELECT COUNT(*) FROM seasons").fetchone()[0] == 1
+
+    # La sauvegarde suivante écrit le format courant, l'original devient une ancienne version
+    assert save_load.save_game(second, 3)
+    history.close()
+    with open(path, 'rb') as f:
+        assert save_load.read_save_header(f)['version'] == FORMAT_VERSION
+    with open(save_load.get_generation_paths(3)[1], 'rb') as f:
+        assert f.read() == original
+
+    third = save_load.load_game(3)
+    third['career'].history.close()
+    assert not third['migrated']
+    assert third['career'].career_id == first['career'].career_id
+    assert third['career'].history_seasons == first['career'].history_seasons
@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tests des fonctions statistiques, comparées à des valeurs de référence
+(tables des lois du khi-deux, normale et de Kolmogorov)
+"""
+
+import math
+
+import pytest
+from src.utils.stats import (
+    _kolmogorov_sf, chi_square_sf, chi_square_two_sample, ks_two_sample, percentile, two_proportion_test
+)
+
+
+def test_percentile():
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 51
+    assert percentile(values, 99) == 99
+    assert percentile([], 95) == 0.0
+
+
+@pytest.mark.parametrize('x, dof, expected', [
+    (3.841458820694124, 1, 0.05),
+    (6.634896601021214, 1, 0.01),
+    (5.991464547107979, 2, 0.05),
+    (18.307038053275146, 10, 0.05),
+    (3.940299136119250, 10, 0.95),  # Développement en série (x petit devant dof)
+])
+def test_chi_square_sf_matches_tables(x, dof, expected):
+    assert chi_square_sf(x, dof) == pytest.approx(expected, abs=1e-9)
+
+
+def test_chi_square_sf_two_degrees_of_freedom_is_exponential():
+    for x in (0.5, 4.0, 30.0):
+        assert chi_square_sf(x, 2) == pytest.approx(math.exp(-x / 2), rel=1e-9)
+    assert chi_square_sf(0, 3) == 1.0
+
+
+def test_chi_square_two_sample():
+    # Tableau 2x2 [[10, 20], [20, 10]]: effectifs attendus de 15, khi-deux de 20/3
+    statistic, dof, p_value = chi_square_two_sample({'a': 10, 'b': 20}, {'a': 20, 'b': 10})
+    assert statistic == pytest.approx(20 / 3)
+    assert dof == 1
+    assert p_value == pytest.approx(0.0098232745, abs=1e-9)
+
+    # Catégories vides ignorées, distributions identiques
+    assert chi_square_two_sample({'a': 5, 'b': 5, 'c': 0}, {'a': 5, 'b': 5}) == (0.0, 1, 1.0)
+    assert chi_square_two_sample({'a': 5}, {'a': 3}) == (0.0, 0, 1.0)
+
+
+def test_two_proportion_test():
+    # 45/100 contre 30/100: proportion commune 0.375
+    z, p_value = two_proportion_test(45, 100, 30, 100)
+    assert z == pytest.approx(2.1908902, abs=1e-7)
+    assert p_value == pytest.approx(0.0284597, abs=1e-7)
+
+    assert two_proportion_test(30, 100, 45, 100)[0] == pytest.approx(-z)
+    assert two_proportion_test(0, 10, 0, 10) == (0.0, 1.0)
+    assert two_proportion_test(1, 0, 1, 10) == (0.0, 1.0)
+
+
+@pytest.mark.parametrize('x, expected', [(1.3581, 0.05), (1.6276, 0.01), (1.2239, 0.10)])
+def test_kolmogorov_distribution_matches_tables(x, expected):
+    assert _kolmogorov_sf(x) == pytest.approx(expected, abs=1e-4)
+
+
+def test_ks_two_sample_statistic():
+    assert ks_two_sample([1, 3, 5, 7], [2, 4, 6, 8])[0] == pytest.approx(0.25)
+    assert ks_two_sample([1, 1, 2], [1, 2, 2])[0] == pytest.approx(1 / 3)
+    assert ks_two_sample([1, 2, 3], [3, 2, 1]) == (0.0, 1.0)
+    assert ks_two_sample([], [1, 2]) == (0.0, 1.0)
+
+    # Échantillons disjoints: D = 1, p = Q((√2.5 + 0.12 + 0.11 / √2.5) * 1)
+    d, p_value = ks_two_sample(range(5), range(5, 10))
+    en = math.sqrt(2.5)
+    assert d == 1.0
+    assert p_value == pytest.approx(_kolmogorov_sf(en + 0.12 + 0.11 / en))
+    assert p_value < 0.01